@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+"""Measure cold import time of randname module.
+
+Every sample runs a new interpreter, so nothing is cached in `sys.modules`.
+Time of a bare interpreter start is measured the same way and subtracted.
+
+Example: python3 benchmarks/bench_import.py --repeat 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    "import": "import randname",
+    "first name": "import randname; randname.randfirst(country='US')",
+}
+
+
+def measure(statement: str, repeat: int) -> float:
+    """Return median wall time of running statement in a new interpreter
+
+    :param statement: Python code passed to `python -c`
+    :type statement: str
+    :param repeat: number of samples
+    :type repeat: int
+    :return: median time in seconds
+    :rtype: float
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        samples.append(time.perf_counter() - start)
+
+    return statistics.median(samples)
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=10, help="number of samples"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+
+    baseline = measure("pass", args.repeat)
+    print(f"{'interpreter':<12} {baseline * 1000:8.1f} ms")
+
+    for label, statement in STATEMENTS.items():
+        elapsed = measure(statement, args.repeat) - baseline
+        print(f"{label:<12} {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
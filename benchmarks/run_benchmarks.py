@@ -0,0 +1,326 @@
+#!/usr/bin/python3
+"""Benchmark suite for randname hot paths.
+
+Every benchmark runs against the bundled database (`src/randname/data`) and
+the full database (`database/`), when it's present. Results are written as
+JSON, with the commit they were measured on, so runs from different commits
+can be compared.
+
+Lower value is better for every benchmark.
+
+Example:
+    python3 benchmarks/run_benchmarks.py --output before.json
+    git checkout feature
+    python3 benchmarks/run_benchmarks.py --output after.json --compare before.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from functools import partial
+from pathlib import Path
+from typing import NamedTuple
+
+from bench_import import measure
+
+from randname.core import Randname
+from randname.database import Database
+from randname.error import RandnameError
+
+ROOT = Path(__file__).resolve().parent.parent
+DATABASES = {
+    "bundled": Randname.PATH_TO_DATABASE,
+    "full": ROOT / "database",
+}
+BATCH_SIZE = 10_000
+# Country present in both databases, with first and last names
+COUNTRY = "US"
+# Relative change of median reported as regression or improvement
+THRESHOLD = 0.1
+
+
+class Result(NamedTuple):
+    """Outcome of a single benchmark.
+
+    Attributes:
+        name: Name of the benchmark.
+        database: Database the benchmark ran against, "-" if it does not use one.
+        unit: Unit of the samples.
+        median: Median of the samples.
+        minimum: Lowest sample.
+        samples: All measured values.
+    """
+
+    name: str
+    database: str
+    unit: str
+    median: float
+    minimum: float
+    samples: list[float]
+
+
+def result(name: str, database: str, unit: str, samples: list[float]) -> Result:
+    return Result(
+        name, database, unit, statistics.median(samples), min(samples), samples
+    )
+
+
+def timed(function: Callable[[], object], number: int, repeat: int) -> list[float]:
+    """Return time of a single call in microseconds, for every repetition.
+
+    Garbage collector is disabled during measurement, like in `timeit`.
+    """
+    samples = []
+    for _ in range(repeat):
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        samples.append(elapsed / number * 1e6)
+
+    return samples
+
+
+def bench_single(database: str, path: Path, repeat: int) -> Iterator[Result]:
+    """Latency of single name functions, with warm cache."""
+    rn = Randname(path, seed=0)
+    for function in (rn.randfirst, rn.randlast, rn.randfull):
+        # Warm up the cache, so datasets are not loaded during measurement
+        for _ in range(1_000):
+            function(country=COUNTRY)
+        yield result(
+            f"single.{function.__name__}",
+            database,
+            "us/call",
+            timed(partial(function, country=COUNTRY), 2_000, repeat),
+        )
+
+
+def bench_resolve(database: str, path: Path, repeat: int) -> Iterator[Result]:
+    """Latency of drawing year and sex of a single name, with warm cache.
+
+    It's the part of a single draw independent from the sampler, e.g. it
+    shows the cost of logging on the hot path.
+    """
+    rn = Randname(path, seed=0)
+    rn.preload(countries=[COUNTRY])
+    for name_type in ("first_names", "last_names"):
+        yield result(
+            f"resolve.{name_type}",
+            database,
+            "us/call",
+            timed(
+                partial(rn._resolve_key, name_type, None, None, COUNTRY), 10_000, repeat
+            ),
+        )
+
+
+def bench_batch(database: str, path: Path, repeat: int) -> Iterator[Result]:
+    """Throughput of batch functions, with warm cache."""
+    rn = Randname(path, seed=0)
+    for function in (rn.randfirst_many, rn.randlast_many, rn.randfull_many):
+        function(BATCH_SIZE, country=COUNTRY)
+        samples = timed(partial(function, BATCH_SIZE, country=COUNTRY), 1, repeat)
+        yield result(
+            f"batch.{function.__name__}",
+            database,
+            "us/name",
+            [sample / BATCH_SIZE for sample in samples],
+        )
+
+
+def bench_first_call(database: str, path: Path, repeat: int) -> Iterator[Result]:
+    """Latency of the first call of a new instance, for every country.
+
+    First names are used, because not every country has last names.
+    """
+    for country in sorted(Randname(path).available_countries()):
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            Randname(path, seed=0).randfirst(country=country)
+            samples.append((time.perf_counter() - start) * 1e3)
+
+        yield result(f"first_call.{country}", database, "ms", samples)
+
+
+def bench_peak_memory(database: str, path: Path, repeat: int) -> Iterator[Result]:
+    """Peak memory of a new instance drawing a batch of names, for every country.
+
+    First names are drawn for random years and sexes, so most first names
+    datasets of the country are loaded.
+    """
+    for country in sorted(Randname(path).available_countries()):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            Randname(path, seed=0).randfirst_many(BATCH_SIZE, country=country)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        yield result(f"peak_memory.{country}", database, "KiB", [peak / 1024])
+
+
+def bench_validate(database: str, path: Path, repeat: int) -> Iterator[Result]:
+    """Wall time of database validation."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            Database.validate(path)
+        except RandnameError as error:
+            # Time of a validation stopped at the first error is not comparable
+            print(f"skipping validate on {database} database: {error!r}")
+            return
+        samples.append((time.perf_counter() - start) * 1e3)
+
+    yield result("validate", database, "ms", samples)
+
+
+def bench_import(repeat: int) -> Iterator[Result]:
+    """Cold import time, in a new interpreter, without interpreter start."""
+    baseline = measure("pass", repeat)
+    samples = [(measure("import randname", 1) - baseline) * 1e3 for _ in range(repeat)]
+    yield result("import", "-", "ms", samples)
+
+
+BENCHMARKS = {
+    "single": bench_single,
+    "resolve": bench_resolve,
+    "batch": bench_batch,
+    "first_call": bench_first_call,
+    "peak_memory": bench_peak_memory,
+    "validate": bench_validate,
+}
+
+
+def run(databases: list[str], repeat: int, groups: list[str]) -> list[Result]:
+    results = list(bench_import(repeat)) if "import" in groups else []
+
+    for database in databases:
+        path = DATABASES[database]
+        if not path.is_dir():
+            print(f"skipping {database} database, {path} does not exist")
+            continue
+
+        for group, benchmark in BENCHMARKS.items():
+            if group in groups:
+                results.extend(benchmark(database, path, repeat))
+
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            cwd=ROOT,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return output.stdout.strip()
+
+
+def to_json(results: list[Result]) -> dict:
+    return {
+        "metadata": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": [item._asdict() for item in results],
+    }
+
+
+def compare(results: list[Result], previous: dict) -> None:
+    """Print change of medians against previous results."""
+    old = {
+        (item["name"], item["database"]): item["median"] for item in previous["results"]
+    }
+    print(f"\ncompared with {previous['metadata']['commit']}")
+
+    for item in results:
+        before = old.get((item.name, item.database))
+        if not before:
+            continue
+
+        change = item.median / before - 1
+        mark = ""
+        if change > THRESHOLD:
+            mark = "slower"
+        elif change < -THRESHOLD:
+            mark = "faster"
+
+        print(
+            f"{item.name:<28} {item.database:<8} {before:>12.3f} -> "
+            f"{item.median:>12.3f} {item.unit:<8} {change:>+7.1%} {mark}"
+        )
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="\n".join(__doc__.splitlines()[9:]),
+    )
+    parser.add_argument(
+        "-d",
+        "--database",
+        nargs="+",
+        choices=DATABASES,
+        default=list(DATABASES),
+        metavar="DATABASE",
+        help=f"databases to run benchmarks against: {', '.join(DATABASES)} (default: all)",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="number of samples")
+    parser.add_argument(
+        "-b",
+        "--benchmark",
+        nargs="+",
+        choices=["import", *BENCHMARKS],
+        default=["import", *BENCHMARKS],
+        metavar="BENCHMARK",
+        help=f"benchmarks to run: import, {', '.join(BENCHMARKS)} (default: all)",
+    )
+    parser.add_argument("-o", "--output", type=Path, help="write results as JSON")
+    parser.add_argument(
+        "-c", "--compare", type=Path, help="JSON results to compare with"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    results = run(args.database, args.repeat, args.benchmark)
+
+    for item in results:
+        print(f"{item.name:<28} {item.database:<8} {item.median:>12.3f} {item.unit}")
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(to_json(results), indent=2) + "\n")
+
+    if args.compare is not None:
+        compare(results, json.loads(args.compare.read_text()))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +0,0 @@
-../tools/convert_to_json.py
\ No newline at end of file
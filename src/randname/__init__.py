@@ -1,31 +1,68 @@
 """Randname - A random name generator library.
 
 Modules:
+    aio: Asynchronous interface for asyncio applications.
+    cache: Memory bounded cache for loaded datasets.
     config: Configuration for logging.
     core: Core functionality for generating random names.
     database: Database handling for name data.
     error: Custom exceptions for the randname library.
+    instrumentation: Timers and counters of stages of name generation.
 """
 
-from importlib.metadata import version
+from typing import Any
 
 from randname.core import (
     available_countries,
+    cache_info,
+    clear_cache,
+    disable_instrumentation,
+    enable_instrumentation,
+    instrumentation_info,
+    preload,
     randfirst,
+    randfirst_many,
     randfull,
+    randfull_many,
     randlast,
+    randlast_many,
+    resident_datasets,
+    seed,
     show_data,
+    stream,
 )
 
 __title__ = "rname"
-__version__ = version(__title__)
 __author__ = "Adam Walkiewicz"
 __license__ = "MIT"
 
 __all__ = [
     "available_countries",
+    "cache_info",
+    "clear_cache",
+    "disable_instrumentation",
+    "enable_instrumentation",
+    "instrumentation_info",
+    "preload",
     "randfirst",
+    "randfirst_many",
     "randfull",
+    "randfull_many",
     "randlast",
+    "randlast_many",
+    "resident_datasets",
+    "seed",
     "show_data",
+    "stream",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Reading package metadata is slow, so version is looked up on first use
+    if name == "__version__":
+        from importlib.metadata import version
+
+        globals()["__version__"] = value = version(__title__)
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,41 @@
 import argparse
-from collections.abc import Sequence
+import csv
+import json
+import os
+import sys
+from collections.abc import Iterator, Sequence
+from typing import TextIO
 
-from randname.core import Randname, available_countries, randfirst, randfull, randlast
+from randname.core import (
+    KindConvention,
+    Randname,
+    YearRange,
+    _instance,
+    available_countries,
+)
 
 sex_choices = [choice for choice in Randname.VALID_SEX_OPTIONS if choice]
 
+FORMATS = ("text", "csv", "jsonl")
+COLUMNS = ("country", "sex", "year")
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+type Row = tuple[str, str, str, int | YearRange]
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{value} is lower than 0")
+    return number
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is lower than 1")
+    return number
+
 
 def parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -44,20 +75,141 @@ def parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
         help="Specify the year for name generation (default: None).",
     )
 
+    # Bulk generation
+    parser.add_argument(
+        "-n",
+        "--count",
+        type=non_negative_int,
+        default=1,
+        help="Number of names to generate (default: 1).",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for reproducible output (default: None).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="text",
+        help="Output format (default: text).",
+    )
+    parser.add_argument(
+        "--columns",
+        nargs="+",
+        choices=COLUMNS,
+        default=[],
+        metavar="COLUMN",
+        help=(
+            "Extra columns with country, sex and year of the dataset the name "
+            f"was drawn from, any of: {', '.join(COLUMNS)}. For full names, "
+            "the first name dataset is reported."
+        ),
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Write names to file instead of standard output.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=positive_int,
+        default=Randname.DEFAULT_CHUNK_SIZE,
+        help=(
+            "Number of names generated at once "
+            f"(default: {Randname.DEFAULT_CHUNK_SIZE})."
+        ),
+    )
+
     return parser.parse_args(args)
 
 
-def main():
-    args = parse_args()
+def generate_rows(args: argparse.Namespace, rn: Randname) -> Iterator[list[Row]]:
+    """Yield rows of (name, country, sex, year), in chunks of chunk size."""
+    kind: KindConvention = "first" if args.first else "last" if args.last else "full"
+
+    for start in range(0, args.count, args.chunk_size):
+        names, keys = rn._gen_many(
+            kind,
+            min(args.chunk_size, args.count - start),
+            args.year,
+            args.sex,
+            args.country,
+            True,
+        )
+        yield [
+            (name, country, sex, year)
+            for name, (country, _, year, sex) in zip(names, keys)
+        ]
+
+
+def write_rows(
+    chunks: Iterator[list[Row]],
+    output: TextIO,
+    output_format: str,
+    columns: Sequence[str],
+) -> None:
+    """Write rows in given format, one chunk with a single write call."""
+    # Column positions in Row
+    indexes = [0] + [COLUMNS.index(column) + 1 for column in columns]
+    header = ["name", *columns]
+
+    if output_format == "csv":
+        writer = csv.writer(output, lineterminator="\n")
+        writer.writerow(header)
+        for chunk in chunks:
+            writer.writerows([[row[i] for i in indexes] for row in chunk])
+
+    elif output_format == "jsonl":
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+        for chunk in chunks:
+            output.write(
+                "".join(
+                    encode({key: row[i] for key, i in zip(header, indexes)}) + "\n"
+                    for row in chunk
+                )
+            )
+
+    elif len(indexes) == 1:
+        for chunk in chunks:
+            output.write("".join(f"{row[0]}\n" for row in chunk))
 
-    if args.first:
-        name = randfirst(country=args.country, sex=args.sex, year=args.year)
-    elif args.last:
-        name = randlast(country=args.country, sex=args.sex, year=args.year)
     else:
-        name = randfull(country=args.country, sex=args.sex, year=args.year)
+        template = "\t".join(f"{{{i}}}" for i in indexes) + "\n"
+        for chunk in chunks:
+            output.write("".join(template.format(*row) for row in chunk))
+
+
+def main(args: Sequence[str] | None = None) -> None:
+    arguments = parse_args(args)
+
+    rn = _instance()
+    if arguments.seed is not None:
+        rn.seed(arguments.seed)
+
+    chunks = generate_rows(arguments, rn)
+
+    if arguments.output is not None:
+        with open(
+            arguments.output,
+            "w",
+            encoding="utf-8",
+            newline="",
+            buffering=OUTPUT_BUFFER_SIZE,
+        ) as output:
+            write_rows(chunks, output, arguments.format, arguments.columns)
+        return
 
-    print(name)
+    try:
+        write_rows(chunks, sys.stdout, arguments.format, arguments.columns)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Output piped to a command that exited early, e.g. `head`
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
 
 
 if __name__ == "__main__":
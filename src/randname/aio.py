@@ -0,0 +1,260 @@
+"""Asyncio module
+
+Generate names in asyncio applications without blocking the event loop.
+
+Reading and parsing names files is done in a thread pool. Concurrent
+requests for the same dataset share a single load. Datasets already in the
+cache are served directly, without suspending the coroutine, so calls
+after the warm-up cost the same as the synchronous functions.
+
+An instance should be used from a single event loop.
+
+Examples:
+    >>> import randname.aio
+    >>> await randname.aio.randfull(country="US")
+    'John Doe'
+
+    >>> rn = randname.aio.AsyncRandname(Randname(seed=42))
+    >>> await rn.randfirst_many(2, country="US")
+    ['John', 'Mary']
+
+Classes:
+    AsyncRandname: Asynchronous interface of a Randname instance.
+
+Functions:
+    randfirst: Generate a random first name.
+    randlast: Generate a random last name.
+    randfull: Generate a random full name.
+"""
+
+import asyncio
+from collections.abc import Hashable, Iterable
+from concurrent.futures import Executor
+from typing import Any
+
+import randname.core
+from randname.core import DatasetKey, Randname, YearConvention
+
+
+class AsyncRandname:
+    """Asynchronous interface of a Randname instance.
+
+    Methods take the same arguments as the methods of Randname.
+
+    Args:
+        instance: Instance generating names, defaults to None (new instance
+            with default settings)
+        executor: Executor loading datasets, defaults to None (default
+            executor of the event loop)
+    """
+
+    def __init__(
+        self, instance: Randname | None = None, executor: Executor | None = None
+    ):
+        self._randname = Randname() if instance is None else instance
+        self._executor = executor
+        self._index: asyncio.Future[Any] | None = None
+        self._loading: dict[DatasetKey, asyncio.Future[list[tuple[Any, Any, int]]]] = {}
+
+    @property
+    def randname(self) -> Randname:
+        """Wrapped Randname instance
+
+        Returns:
+            Randname instance
+        """
+        return self._randname
+
+    async def randfull(
+        self,
+        year: YearConvention | None = None,
+        sex: str | None = None,
+        country: str | None = None,
+        weights: bool = True,
+    ) -> str:
+        """Return full name, see `Randname.randfull`."""
+        return (await self.randfull_many(1, year, sex, country, weights))[0]
+
+    async def randlast(
+        self,
+        year: YearConvention | None = None,
+        sex: str | None = None,
+        country: str | None = None,
+        weights: bool = True,
+    ) -> str:
+        """Return last name, see `Randname.randlast`."""
+        return (await self.randlast_many(1, year, sex, country, weights))[0]
+
+    async def randfirst(
+        self,
+        year: YearConvention | None = None,
+        sex: str | None = None,
+        country: str | None = None,
+        weights: bool = True,
+    ) -> str:
+        """Return first name, see `Randname.randfirst`."""
+        return (await self.randfirst_many(1, year, sex, country, weights))[0]
+
+    async def randfull_many(
+        self,
+        n: int,
+        year: YearConvention | None = None,
+        sex: str | None = None,
+        country: str | None = None,
+        weights: bool = True,
+    ) -> list[str]:
+        """Return list of n full names, see `Randname.randfull_many`."""
+        await self._load_index()
+        first_keys, last_keys = self._randname._resolve_full_keys_many(
+            n, year, sex, country
+        )
+        loaded = await self._load_datasets([*first_keys, *last_keys])
+
+        first_names = self._randname._gen_names(first_keys, weights, loaded)
+        last_names = self._randname._gen_names(last_keys, weights, loaded)
+        return [f"{first} {last}" for first, last in zip(first_names, last_names)]
+
+    async def randlast_many(
+        self,
+        n: int,
+        year: YearConvention | None = None,
+        sex: str | None = None,
+        country: str | None = None,
+        weights: bool = True,
+    ) -> list[str]:
+        """Return list of n last names, see `Randname.randlast_many`."""
+        await self._load_index()
+        keys = self._randname._resolve_keys("last_names", n, year, sex, country)
+        loaded = await self._load_datasets(keys)
+        return self._randname._gen_names(keys, weights, loaded)
+
+    async def randfirst_many(
+        self,
+        n: int,
+        year: YearConvention | None = None,
+        sex: str | None = None,
+        country: str | None = None,
+        weights: bool = True,
+    ) -> list[str]:
+        """Return list of n first names, see `Randname.randfirst_many`."""
+        await self._load_index()
+        keys = self._randname._resolve_keys("first_names", n, year, sex, country)
+        loaded = await self._load_datasets(keys)
+        return self._randname._gen_names(keys, weights, loaded)
+
+    async def _load_index(self) -> None:
+        """Build database index in the executor, if it's not built yet."""
+        if self._randname.database.index_built:
+            return
+
+        if self._index is None or self._index.done():
+            loop = asyncio.get_running_loop()
+            self._index = loop.run_in_executor(
+                self._executor, lambda: self._randname.database.index
+            )
+
+        await asyncio.shield(self._index)
+
+    async def _load_datasets(self, keys: Iterable[DatasetKey]) -> dict[Hashable, Any]:
+        """Return datasets and structures used by the sampler, loading the
+        ones missing in the cache in the executor.
+
+        Returns without suspending, when all datasets are in the cache.
+        Loaded entries are returned even if they don't fit in the cache, so
+        names are drawn from them without reading files in the event loop.
+
+        Returns:
+            Datasets and derived structures by cache key
+        """
+        loaded: dict[Hashable, Any] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            entries = self._randname._resident_entries(key)
+            if entries is None:
+                missing.append(key)
+            else:
+                loaded.update(entries)
+
+        if missing:
+            # Shield shared loads, so a cancelled caller doesn't cancel them
+            # for other callers
+            results = await asyncio.gather(
+                *(asyncio.shield(self._load_dataset(key)) for key in missing)
+            )
+            for built in results:
+                loaded.update((cache_key, value) for cache_key, value, _ in built)
+
+        return loaded
+
+    def _load_dataset(
+        self, key: DatasetKey
+    ) -> asyncio.Future[list[tuple[Any, Any, int]]]:
+        """Return future of a dataset load, shared by concurrent callers."""
+        future = self._loading.get(key)
+
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                self._executor, self._randname._build_cache_entries, key
+            )
+            self._loading[key] = future
+            future.add_done_callback(lambda done: self._store(key, done))
+
+        return future
+
+    def _store(
+        self, key: DatasetKey, future: asyncio.Future[list[tuple[Any, Any, int]]]
+    ) -> None:
+        """Put loaded entries in the cache, once for all callers sharing the
+        load. Called in the event loop thread, when the load is done.
+        """
+        del self._loading[key]
+
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        for cache_key, value, nbytes in future.result():
+            self._randname._store(cache_key, value, nbytes)
+
+
+_default: AsyncRandname | None = None
+
+
+def _default_instance() -> AsyncRandname:
+    """Return AsyncRandname wrapping the shared instance of randname.core."""
+    global _default
+
+    if _default is None or _default.randname is not randname.core._instance():
+        _default = AsyncRandname(randname.core._instance())
+
+    return _default
+
+
+async def randfull(
+    year: YearConvention | None = None,
+    sex: str | None = None,
+    country: str | None = None,
+    weights: bool = True,
+) -> str:
+    """Return full name, see `randname.randfull`."""
+    return await _default_instance().randfull(year, sex, country, weights)
+
+
+async def randlast(
+    year: YearConvention | None = None,
+    sex: str | None = None,
+    country: str | None = None,
+    weights: bool = True,
+) -> str:
+    """Return last name, see `randname.randlast`."""
+    return await _default_instance().randlast(year, sex, country, weights)
+
+
+async def randfirst(
+    year: YearConvention | None = None,
+    sex: str | None = None,
+    country: str | None = None,
+    weights: bool = True,
+) -> str:
+    """Return first name, see `randname.randfirst`."""
+    return await _default_instance().randfirst(year, sex, country, weights)
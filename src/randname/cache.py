@@ -0,0 +1,184 @@
+"""Cache module
+
+Classes:
+    CacheInfo: Snapshot of the cache counters.
+    DatasetCache: Memory bounded LRU cache for loaded name datasets.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Counters of the dataset cache.
+
+    Attributes:
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that required loading a dataset.
+        evictions: Number of datasets removed to stay within the memory budget.
+        currsize: Estimated number of bytes held by cached datasets.
+        maxsize: Memory budget in bytes.
+        entries: Number of cached datasets.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int
+    entries: int
+
+
+class DatasetCache:
+    """Least recently used cache with a memory budget.
+
+    Entries are evicted starting from the least recently used one, until the
+    sum of their sizes fits in `maxsize`. An entry bigger than the whole
+    budget is not stored at all.
+
+    Args:
+        maxsize: Memory budget in bytes. 0 disables caching.
+        on_evict: Function called with key and value of every evicted
+            entry, after the cache lock is released, so it can use the
+            cache. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        on_evict: Callable[[Hashable, Any], None] | None = None,
+    ):
+        if maxsize < 0:
+            raise ValueError("maxsize must be greater or equal 0")
+
+        self._maxsize = maxsize
+        self._on_evict = on_evict
+        self._data: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._currsize = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    @property
+    def maxsize(self) -> int:
+        """Memory budget in bytes
+
+        Returns:
+            Memory budget in bytes
+        """
+        return self._maxsize
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return cached value and mark it as recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value or None if key is not in the cache.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def peek(self, key: Hashable) -> Any | None:
+        """Return cached value, without updating counters and recency.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value or None if key is not in the cache.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+        return None if entry is None else entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        """Store value in the cache, evicting old entries when needed.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            nbytes: Size of the value in bytes.
+        """
+        evicted = []
+        with self._lock:
+            if key in self._data:
+                self._currsize -= self._data.pop(key)[1]
+
+            if nbytes > self._maxsize:
+                return
+
+            while self._data and self._currsize + nbytes > self._maxsize:
+                evicted_key, (evicted_value, evicted_nbytes) = self._data.popitem(
+                    last=False
+                )
+                self._currsize -= evicted_nbytes
+                self._evictions += 1
+                evicted.append((evicted_key, evicted_value))
+
+            self._data[key] = (value, nbytes)
+            self._currsize += nbytes
+
+        if self._on_evict is not None:
+            for evicted_key, evicted_value in evicted:
+                self._on_evict(evicted_key, evicted_value)
+
+    def discard(self, key: Hashable) -> None:
+        """Remove entry, if it's in the cache. It's not counted as eviction.
+
+        Args:
+            key: Cache key.
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is not None:
+                self._currsize -= entry[1]
+
+    def entries(self) -> list[tuple[Any, int]]:
+        """Return keys and sizes of cached entries.
+
+        Returns:
+            Keys with sizes in bytes, from the least to the most recently used
+        """
+        with self._lock:
+            return [(key, nbytes) for key, (_, nbytes) in self._data.items()]
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are preserved."""
+        with self._lock:
+            self._data.clear()
+            self._currsize = 0
+
+    def info(self) -> CacheInfo:
+        """Return snapshot of cache counters.
+
+        Returns:
+            Cache counters
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                currsize=self._currsize,
+                maxsize=self._maxsize,
+                entries=len(self._data),
+            )
@@ -1,9 +1,14 @@
 """Configuration for logging in the randname library.
 
+No handlers are installed at import, except `logging.NullHandler`, so
+messages are handled by the application logging configuration. Debug
+messages on hot paths are guarded with `logger.isEnabledFor`, so they
+cost nothing until debug level is enabled, e.g. with `set_logger("debug")`.
+
 Attributes:
     DEFAULT_LOGGING_LEVEL: Default logging level for the application.
     LOGGING_LEVEL_MAP: Mapping of string logging levels to logging module constants.
-    logger: Configured logger instance.
+    logger: Logger of the library, named "randname".
 
 Functions:
     set_logger: Set logger for the application.
@@ -20,9 +25,18 @@ LOGGING_LEVEL_MAP = {
     "critical": logging.CRITICAL,
 }
 
+logger = logging.getLogger("randname")
+logger.addHandler(logging.NullHandler())
+
+# Handler installed by set_logger, replaced on every call
+_handler: logging.Handler | None = None
+
 
 def set_logger(level_name: str) -> logging.Logger:
-    """Set logger for the application.
+    """Log messages of the library to standard error.
+
+    Opt-in, for debugging and scripts. Applications should configure the
+    "randname" logger with the `logging` module instead.
 
     Args:
         level_name: Logging level to set. Can be a string key from LOGGING_LEVEL_MAP
@@ -31,6 +45,8 @@ def set_logger(level_name: str) -> logging.Logger:
     Returns:
         logger
     """
+    global _handler
+
     level = LOGGING_LEVEL_MAP.get(level_name, logging.ERROR)
     formatter = logging.Formatter(
         "[%(asctime)s][%(levelname)s][%(filename)s:%(funcName)s:%(lineno)d] %(message)s"
@@ -40,10 +56,10 @@ def set_logger(level_name: str) -> logging.Logger:
     handler.setLevel(level)
     handler.setFormatter(formatter)
 
-    logger = logging.getLogger("randname")
+    if _handler is not None:
+        logger.removeHandler(_handler)
     logger.addHandler(handler)
+    logger.setLevel(level)
+    _handler = handler
 
     return logger
-
-
-logger = set_logger("debug")
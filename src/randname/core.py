@@ -5,6 +5,8 @@ class. This allows users to call functions directly from the module without
 needing to instantiate the Randname class themselves. And makes implementation
 easier, because functions share internal state and resources.
 
+The shared instance is created on first use, not at import time.
+
 To change the database path, assign a new path to `randname.core.database`
 attribute.
 
@@ -22,42 +24,268 @@ Functions:
     randfirst: Generate a random first name.
     randlast: Generate a random last name.
     randfull: Generate a random full name.
+    randfirst_many: Generate a list of random first names.
+    randlast_many: Generate a list of random last names.
+    randfull_many: Generate a list of random full names.
+    stream: Generate an endless iterator of random names.
     available_countries: List available countries in the database.
     show_data: Show information about the database.
+    seed: Initialize the random generator of module level functions.
+    cache_info: Show counters of the dataset cache.
+    clear_cache: Remove loaded datasets from the cache.
+    preload: Load datasets ahead of the first draw.
+    resident_datasets: List datasets held in the cache.
+    enable_instrumentation: Record time spent in stages of name generation.
+    disable_instrumentation: Stop recording time spent in stages.
+    instrumentation_info: Show timers and counters of stages.
 
 Classes:
     Randname: Main class for generating random names.
+    ResidentDataset: Dataset held in the cache and its memory usage.
+    YearRange: Years of a dataset merged from datasets of many years.
 """
 
+import functools
+import heapq
 import json
 import logging
 import os
 import random
-from bisect import bisect_left
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import (
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import accumulate, islice
 from pathlib import Path
-from typing import Literal
+from types import MappingProxyType
+from typing import Any, Concatenate, Literal, NamedTuple, overload
 
+import randname.cache
 import randname.database
 import randname.error
+import randname.instrumentation
+import randname.sampling
 from randname.config import logger
 
 _THIS_FOLDER = os.path.dirname(os.path.abspath(__file__))
 
+# Unique sampling: after a chunk of draws accepting fewer new names than this
+# share, the rest is selected among all remaining names, if there are at most
+# _UNIQUE_ENUMERATION_FACTOR times more of them than draws still expected at
+# the acceptance of that chunk.
+_UNIQUE_MIN_ACCEPTANCE = 0.1
+_UNIQUE_ENUMERATION_FACTOR = 8
+_UNIQUE_MIN_CHUNK = 1_000
+_UNIQUE_MAX_CHUNK = 1_000_000
+
+# Sum of totals of a merged dataset with year weights. Names keep integer
+# totals, large enough that rounding doesn't change their probabilities.
+_MERGE_SCALE = 1 << 40
+
+# Bisect on array of totals creates an int on every probe. For at least
+# 1 / _BISECT_COPY_FACTOR draws per name, totals are copied to a list first.
+_BISECT_COPY_FACTOR = 16
+
+# Name type reported for name tables, stored in the cache under
+# (country, _NAME_TABLE)
+_NAME_TABLE = "name_table"
+
 type ShortConvention = Literal["first", "last"]
 type LongConvention = Literal["first_names", "last_names"]
 type SexConvention = Literal["F", "M", "N"]
+type SamplerConvention = Literal["bisect", "alias", "numpy"]
+type KindConvention = Literal["first", "last", "full"]
+type YearConvention = int | tuple[int, int] | Mapping[int, float]
+type DatasetKey = tuple[str, str, int | YearRange, str]
+type LoadedDataset = tuple[Sequence[str], Sequence[int]]
+
+# Instrumented methods of Randname: stage, method and amount of work done
+_STAGES: tuple[randname.instrumentation.Stage, ...] = (
+    ("resolve_country", "_gen_country", None),
+    ("resolve_year", "_gen_year", None),
+    ("resolve_sex", "_gen_sex", None),
+    ("load_dataset", "_read_key", lambda args, result: (1, result[1])),
+    ("read_file", "_read_file", lambda args, result: (1, len(result))),
+    ("parse_json", "_parse_dataset", lambda args, result: (len(result[0]), 0)),
+    ("merge_years", "_merge_years", lambda args, result: (len(result[0]), 0)),
+    ("sample", "_sample", lambda args, result: (len(result), 0)),
+)
+# Default of functions taking entries loaded by the caller
+_NOTHING_LOADED: Mapping[Hashable, Any] = MappingProxyType({})
+# Instrumented methods of Database, the index is built once
+_DATABASE_STAGES: tuple[randname.instrumentation.Stage, ...] = (
+    ("scan_database", "build_index", lambda args, result: (len(result), 0)),
+)
+
+
+class YearRange(NamedTuple):
+    """Years of a dataset merged from datasets of many years.
+
+    Attributes:
+        years: Years of merged datasets, sorted.
+        weights: Population weight of every year, or None if occurrences of
+            names are added up over years.
+    """
+
+    years: tuple[int, ...]
+    weights: tuple[float, ...] | None = None
+
+
+class ResidentDataset(NamedTuple):
+    """Dataset held in the cache.
+
+    Attributes:
+        country: Country of the dataset.
+        name_type: "first_names" or "last_names".
+        year: Year of the dataset, or years of a merged dataset.
+        sex: Sex of the dataset.
+        nbytes: Memory used by the dataset and structures derived from it
+            (e.g. alias table) in bytes.
+
+    With shared names, the table of names of a country is listed as a
+    dataset with "name_table" name type, year 0 and empty sex.
+    """
+
+    country: str
+    name_type: str
+    year: int | YearRange
+    sex: str
+    nbytes: int
+
+
+def _year_order(year: int | YearRange) -> tuple[int, ...]:
+    """Sort key of dataset years, merged datasets after their first year."""
+    return year.years if isinstance(year, YearRange) else (year,)
+
+
+def _dataset_order(key: DatasetKey) -> tuple[Any, ...]:
+    """Sort key of dataset keys."""
+    country, name_type, year, sex = key
+    return country, name_type, _year_order(year), sex
 
 
 class Randname:
     PATH_TO_DATABASE = Path() / _THIS_FOLDER / "data"
     VALID_SEX_OPTIONS = ("M", "F", "N", None)
+    VALID_SAMPLERS = ("bisect", "alias", "numpy")
+    DEFAULT_CACHE_SIZE = 128 * 1024 * 1024
+    DEFAULT_CHUNK_SIZE = 10_000
+
+    def __init__(
+        self,
+        path_to_database: Path | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        sampler: SamplerConvention = "bisect",
+        seed: float | str | bytes | bytearray | None = None,
+        rng: random.Random | None = None,
+        shared_names: bool = False,
+    ):
+        """Random name generator.
+
+        Loaded datasets are kept in a per instance LRU cache, so only the
+        first draw from a dataset pays for reading and parsing its file.
+
+        Every instance draws from its own random generator, independent from
+        the global `random` module state. Instances created with the same
+        seed (and the same database) generate the same names.
+
+        Thread safety:
+            An instance can be shared by threads. Every dataset is read
+            once, threads drawing from a dataset that's being read wait for
+            it. Database index is immutable once built and is read without a
+            lock, the cache takes a lock only for lookups and inserts.
+
+            The thread that created the instance, or last called `seed`,
+            draws from the seeded generator. Other threads draw from their
+            own generators, seeded from the instance seed on their first
+            draw, so names are reproducible only within the seeding thread. Changing
+            `database` while other threads draw is not supported.
+
+        Years:
+            Year of birth is mapped to the dataset of the nearest year
+            available. A range of years, `(start, end)`, selects datasets of
+            all years within it, and names are drawn from them merged, with
+            occurrences of every name added up over years. A mapping of years
+            to population weights draws from every year with probability
+            proportional to its weight instead. Merged datasets are built
+            once and cached, so drawing from a range costs the same as
+            drawing from a single year.
+
+        Args:
+            path_to_database: Path to directory with database, defaults to
+                PATH_TO_DATABASE
+            cache_size: Memory budget of the dataset cache in bytes,
+                0 disables caching, defaults to DEFAULT_CACHE_SIZE
+            sampler: Sampling method. "bisect" searches cumulative weights on
+                every draw, "alias" builds an alias table once per dataset and
+                draws in constant time, "numpy" draws names in bulk with
+                NumPy, if it's not installed "bisect" is used instead,
+                defaults to "bisect"
+            seed: Seed of the instance generator, defaults to None (seeded
+                from the operating system randomness source)
+            rng: Generator to use instead of creating a new one, any
+                `random.Random` instance or subclass constructible without
+                arguments, defaults to None
+            shared_names: Store names of datasets read from JSON files in a
+                table per country, shared by all its datasets, so every name
+                is stored once, whatever number of years is loaded. Worth it
+                when many years of a country are loaded, e.g. with `preload`
+                or year ranges, for a single year it uses more memory. The
+                table counts in the cache budget and is kept as long as any
+                dataset of its country, defaults to False
+
+        Raises:
+            ValueError: If sampler is not in VALID_SAMPLERS, or both seed and
+                rng are given
+        """
+        if sampler not in Randname.VALID_SAMPLERS:
+            raise ValueError(f"{sampler} not in {Randname.VALID_SAMPLERS}")
+
+        if seed is not None and rng is not None:
+            raise ValueError("seed and rng are mutually exclusive")
+
+        if sampler == "numpy" and not randname.sampling.NUMPY_AVAILABLE:
+            logger.warning("numpy is not installed, using bisect sampler instead")
+            sampler = "bisect"
 
-    def __init__(self, path_to_database: Path | None = None):
         if path_to_database is None:
             self._database = randname.database.Database(Randname.PATH_TO_DATABASE)
         else:
             self._database = randname.database.Database(path_to_database)
 
+        self._cache = randname.cache.DatasetCache(
+            cache_size, self._evicted if shared_names else None
+        )
+        self._sampler = sampler
+        # Guards _loading, _seeder and fields identifying the seeding thread
+        self._lock = threading.Lock()
+        self._loading: dict[Hashable, Future[Any]] = {}
+        self._main_rng = random.Random(seed) if rng is None else rng
+        # Seeds generators of other threads, without advancing the main one
+        self._seeder = random.Random(seed)
+        self._main_numpy_generator = self._new_numpy_generator(self._main_rng)
+        self._owner = threading.get_ident()
+        self._generation = 0
+        self._local = threading.local()
+        self._instrumentation: randname.instrumentation.Instrumentation | None = None
+        # Years of datasets selected by (country, name type, year range)
+        self._year_ranges: dict[tuple[str, str, tuple[int, int]], int | YearRange] = {}
+        # Country -> names of its datasets, if they are shared
+        self._shared_names = shared_names
+        self._name_tables: dict[str, randname.database.NameTable] = {}
+        # Guards _name_tables and charging them to the cache. Reentrant, the
+        # cache calls _evicted in the thread storing an entry.
+        self._tables_lock = threading.RLock()
+        # Generation of the database cached datasets were read from
+        self._database_generation = self._database.generation
+
         logger.debug("Database: %s", self._database)
 
     @property
@@ -67,11 +295,331 @@ class Randname:
     @database.setter
     def database(self, path: Path) -> None:
         self._database = randname.database.Database(path)
+        if self._instrumentation is not None:
+            randname.instrumentation.instrument(
+                self._database, _DATABASE_STAGES, self._instrumentation
+            )
+        self._database_generation = self._database.generation
+        self._year_ranges.clear()
+        self.clear_cache()
         logger.debug("Database path: %s", self._database.path)
 
+    def _sync_database(self) -> None:
+        """Drop datasets and years read from the database, if its path was
+        changed since, with `database.path`.
+        """
+        generation = self._database.generation
+        if generation != self._database_generation:
+            self._database_generation = generation
+            self._year_ranges.clear()
+            self.clear_cache()
+            logger.debug("Database path changed: %s", self._database.path)
+
+    def seed(self, a: float | str | bytes | bytearray | None = None) -> None:
+        """Reinitialize the instance generator, same as `random.seed`.
+
+        Calling thread draws from the seeded generator. Generators of other
+        threads are seeded again, on their next draw.
+
+        Args:
+            a: Seed, defaults to None (seeded from the operating system
+                randomness source)
+
+        Examples:
+            >>> seed(42)
+            >>> randfull()
+            'John Doe'
+        """
+        with self._lock:
+            self._main_rng.seed(a)
+            self._seeder.seed(a)
+            self._main_numpy_generator = self._new_numpy_generator(self._main_rng)
+            self._owner = threading.get_ident()
+            # Generators of other threads are seeded again on their next draw
+            self._generation += 1
+
+    def _new_numpy_generator(self, rng: random.Random) -> Any:
+        """Create NumPy generator seeded from the given generator, so it
+        follows the instance seed."""
+        if self._sampler != "numpy":
+            return None
+
+        return randname.sampling.numpy_generator(rng.getrandbits(128))
+
+    @property
+    def _rng(self) -> random.Random:
+        """Generator of the calling thread."""
+        if threading.get_ident() == self._owner:
+            return self._main_rng
+        return self._thread_generators()[0]
+
+    @property
+    def _numpy_generator(self) -> Any:
+        """NumPy generator of the calling thread, None for other samplers."""
+        if threading.get_ident() == self._owner:
+            return self._main_numpy_generator
+        return self._thread_generators()[1]
+
+    def _thread_generators(self) -> tuple[random.Random, Any]:
+        """Return generators of a thread other than the seeding one.
+
+        They are created on first use, and again after `seed`, seeded from
+        the instance seed.
+        """
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            with self._lock:
+                rng = type(self._main_rng)()
+                rng.seed(self._seeder.getrandbits(128))
+                local.generators = (rng, self._new_numpy_generator(rng))
+                local.generation = self._generation
+
+        return local.generators
+
+    def cache_info(self) -> randname.cache.CacheInfo:
+        """Return counters of the dataset cache.
+
+        Returns:
+            Hits, misses, evictions and memory usage of the cache
+
+        Examples:
+            >>> cache_info()
+            CacheInfo(hits=9, misses=1, evictions=0, currsize=222278, maxsize=134217728, entries=1)
+        """
+        return self._cache.info()
+
+    def clear_cache(self) -> None:
+        """Remove all loaded datasets from the cache."""
+        with self._tables_lock:
+            self._cache.clear()
+            self._name_tables.clear()
+
+    def enable_instrumentation(
+        self,
+        callback: Callable[[randname.instrumentation.Measurement], None] | None = None,
+    ) -> None:
+        """Record time spent in stages of name generation, and work done.
+
+        Stages are: "scan_database" (directory listings and info.json
+        files), "resolve_country", "resolve_year" and "resolve_sex",
+        "load_dataset" (cache misses, with bytes loaded), "read_file",
+        "parse_json", "merge_years" and "sample" (with names drawn).
+
+        Instrumentation costs nothing until it's enabled. Enabling it again
+        resets counters and replaces the callback.
+
+        Args:
+            callback: Function called with every measurement, e.g. to export
+                it to a metrics library, defaults to None
+
+        Examples:
+            >>> enable_instrumentation(lambda m: histogram.labels(m.stage).observe(m.seconds))
+        """
+        instrumentation = randname.instrumentation.Instrumentation(callback)
+        randname.instrumentation.instrument(self, _STAGES, instrumentation)
+        randname.instrumentation.instrument(
+            self._database, _DATABASE_STAGES, instrumentation
+        )
+        self._instrumentation = instrumentation
+
+    def disable_instrumentation(self) -> None:
+        """Stop recording stages of name generation, and discard counters."""
+        randname.instrumentation.uninstrument(self, _STAGES)
+        randname.instrumentation.uninstrument(self._database, _DATABASE_STAGES)
+        self._instrumentation = None
+
+    def instrumentation_info(self) -> dict[str, dict[str, Any]]:
+        """Return timers and counters of stages, and counters of the cache.
+
+        Returns:
+            Snapshot with "stages": stage -> calls, seconds, items and bytes,
+            and "cache": counters of the dataset cache. Stages are empty when
+            instrumentation is disabled.
+
+        Examples:
+            >>> instrumentation_info()
+            {'stages': {'sample': {'calls': 2, 'seconds': 1.2e-05, 'items': 2, 'bytes': 0}, ...}, 'cache': {'hits': 1, ...}}
+        """
+        instrumentation = self._instrumentation
+        return {
+            "stages": {} if instrumentation is None else instrumentation.snapshot(),
+            "cache": self._cache.info()._asdict(),
+        }
+
+    @overload
+    def preload(
+        self,
+        countries: Iterable[str] | None = None,
+        name_types: Iterable[LongConvention] | None = None,
+        years: Iterable[YearConvention] | None = None,
+        sexes: Iterable[str] | None = None,
+        background: Literal[False] = False,
+    ) -> list[DatasetKey]: ...
+
+    @overload
+    def preload(
+        self,
+        countries: Iterable[str] | None = None,
+        name_types: Iterable[LongConvention] | None = None,
+        years: Iterable[YearConvention] | None = None,
+        sexes: Iterable[str] | None = None,
+        *,
+        background: Literal[True],
+    ) -> Future[list[DatasetKey]]: ...
+
+    def preload(
+        self,
+        countries: Iterable[str] | None = None,
+        name_types: Iterable[LongConvention] | None = None,
+        years: Iterable[YearConvention] | None = None,
+        sexes: Iterable[str] | None = None,
+        background: bool = False,
+    ) -> list[DatasetKey] | Future[list[DatasetKey]]:
+        """Load selected datasets ahead of the first draw.
+
+        Builds the database index, reads datasets into the cache and builds
+        structures used by the instance sampler, so the first draw from
+        these datasets does not read any files. Datasets are kept only as
+        long as they fit in the cache, a warning is logged if they don't.
+
+        Arguments set to None select everything available. Years are mapped
+        to datasets the same way as in `randfirst` and similar functions,
+        sexes not available for a name type are skipped.
+
+        Args:
+            countries: Countries, defaults to None (all countries)
+            name_types: "first_names" and/or "last_names", defaults to None
+                (both)
+            years: Years of birth, or ranges of years, defaults to None (all
+                years)
+            sexes: Sexes, defaults to None (all sexes)
+            background: Load datasets in a background thread, defaults to
+                False
+
+        Returns:
+            Keys of loaded datasets: country, name type, year and sex. With
+            background, a future completed with keys, when loading finishes.
+
+        Raises:
+            InvalidCountryName: If country is not in valid countries
+            ValueError: If name type is not "first_names" or "last_names"
+
+        Examples:
+            >>> preload(countries=["US"], name_types=["first_names"])
+            [('US', 'first_names', 2018, 'F'), ('US', 'first_names', 2018, 'M')]
+        """
+        keys = self._preload_keys(countries, name_types, years, sexes)
+
+        if not background:
+            return self._preload(keys)
+
+        executor = ThreadPoolExecutor(1, thread_name_prefix="randname-preload")
+        future = executor.submit(self._preload, keys)
+        executor.shutdown(wait=False)
+        return future
+
+    def resident_datasets(self) -> list[ResidentDataset]:
+        """List datasets held in the cache, with their memory usage.
+
+        Returns:
+            Resident datasets, sorted by country, name type, year and sex
+
+        Examples:
+            >>> resident_datasets()
+            [ResidentDataset(country='US', name_type='first_names', year=2018, sex='F', nbytes=222278)]
+        """
+        self._sync_database()
+        sizes: dict[DatasetKey, int] = {}
+        for key, nbytes in self._cache.entries():
+            if key[1] == _NAME_TABLE:
+                dataset_key = (key[0], _NAME_TABLE, 0, "")
+            # Derived structures are stored under (dataset key, kind)
+            elif len(key) == 2:
+                dataset_key = key[0]
+            else:
+                dataset_key = key
+            sizes[dataset_key] = sizes.get(dataset_key, 0) + nbytes
+
+        return [
+            ResidentDataset(*key, nbytes)
+            for key, nbytes in sorted(
+                sizes.items(), key=lambda item: _dataset_order(item[0])
+            )
+        ]
+
+    def _preload_keys(
+        self,
+        countries: Iterable[str] | None,
+        name_types: Iterable[LongConvention] | None,
+        years: Iterable[YearConvention] | None,
+        sexes: Iterable[str] | None,
+    ) -> list[DatasetKey]:
+        """Select datasets for preload."""
+        index = self._database.index
+        selected_name_types = (
+            randname.database.NAME_TYPES if name_types is None else tuple(name_types)
+        )
+        selected_years = None if years is None else tuple(years)
+        selected_sexes = None if sexes is None else tuple(sexes)
+
+        for name_type in selected_name_types:
+            if name_type not in randname.database.NAME_TYPES:
+                raise ValueError(f"{name_type} not in {randname.database.NAME_TYPES}")
+
+        keys: list[DatasetKey] = []
+        for country in sorted(index) if countries is None else countries:
+            country = self._gen_country(country)
+            for name_type in selected_name_types:
+                entry = index[country][name_type]
+                if not entry.years:
+                    continue
+
+                dataset_years: Iterable[int | YearRange] = (
+                    entry.years
+                    if selected_years is None
+                    else sorted(
+                        {
+                            self._gen_year(year, country, name_type)
+                            for year in selected_years
+                        },
+                        key=_year_order,
+                    )
+                )
+                dataset_sexes = [
+                    sex
+                    for sex in entry.sexes
+                    if selected_sexes is None or sex in selected_sexes
+                ]
+                keys.extend(
+                    (country, name_type, year, sex)
+                    for year in dataset_years
+                    for sex in dataset_sexes
+                )
+
+        return keys
+
+    def _preload(self, keys: list[DatasetKey]) -> list[DatasetKey]:
+        for key in keys:
+            names, totals = self._load_dataset(key)
+            if self._sampler == "numpy":
+                self._numpy_dataset(key, names, totals)
+            elif self._sampler == "alias":
+                self._alias_table(key, totals)
+
+        missing = sum(key not in self._cache for key in keys)
+        if missing:
+            logger.warning(
+                "%s of %s preloaded datasets don't fit in the cache of %s bytes",
+                missing,
+                len(keys),
+                self._cache.maxsize,
+            )
+
+        return keys
+
     def randfull(
         self,
-        year: int | None = None,
+        year: YearConvention | None = None,
         sex: str | None = None,
         country: str | None = None,
         weights: bool = True,
@@ -79,7 +627,8 @@ class Randname:
         """Return full name
 
         Args:
-            year: Year of birth, defaults to None
+            year: Year of birth, (start, end) range of years, or mapping of
+                years to population weights, defaults to None
             sex: Sex's name, defaults to None
             country: Country of origin, defaults to None
             weights: Use population distribution if True, else treat all names
@@ -91,35 +640,20 @@ class Randname:
         Raises:
             InvalidSexArgument: If sex is not in proper sex options
             InvalidCountryName: If country is not in valid countries
+            ValueError: If year range or year weights are invalid
 
         Examples:
             >>> randfull()
             'John Doe'
         """
-        country = self._gen_country(country)
-        first_name_available_sex = self._available_sex(country, "first_names")
-        last_name_available_sex = self._available_sex(country, "last_names")
-
-        first_name_sex = last_name_sex = sex
-
-        if sex not in Randname.VALID_SEX_OPTIONS:
-            raise randname.error.InvalidSexArgumentError(
-                sex, Randname.VALID_SEX_OPTIONS
-            )
-
-        if sex not in first_name_available_sex:
-            first_name_sex = random.choice(first_name_available_sex)
-
-        if sex not in last_name_available_sex:
-            last_name_sex = random.choice(last_name_available_sex)
-
-        first = self.randfirst(year, first_name_sex, country, weights)
-        last = self.randlast(year, last_name_sex, country, weights)
+        first_key, last_key = self._resolve_full_keys(year, sex, country)
+        first = self._gen_names([first_key], weights)[0]
+        last = self._gen_names([last_key], weights)[0]
         return f"{first} {last}"
 
     def randlast(
         self,
-        year: int | None = None,
+        year: YearConvention | None = None,
         sex: str | None = None,
         country: str | None = None,
         weights: bool = True,
@@ -127,7 +661,8 @@ class Randname:
         """Return random last name
 
         Args:
-            year: Year of birth, defaults to None
+            year: Year of birth, (start, end) range of years, or mapping of
+                years to population weights, defaults to None
             sex: Sex's name, defaults to None
             country: Country of origin, defaults to None
             weights: Use population distribution if True, else treat all names
@@ -139,6 +674,7 @@ class Randname:
         Raises:
             InvalidSexArgument: If sex is not in proper sex options
             InvalidCountryName: If country is not in valid countries
+            ValueError: If year range or year weights are invalid
 
         Examples:
             >>> randlast()
@@ -149,7 +685,7 @@ class Randname:
 
     def randfirst(
         self,
-        year: int | None = None,
+        year: YearConvention | None = None,
         sex: str | None = None,
         country: str | None = None,
         weights: bool = True,
@@ -157,7 +693,8 @@ class Randname:
         """Return random first name
 
         Args:
-            year: Year of birth, defaults to None
+            year: Year of birth, (start, end) range of years, or mapping of
+                years to population weights, defaults to None
             sex: Sex's name, defaults to None
             country: Country of origin, defaults to None
             weights: Use population distribution if True, else treat all names
@@ -169,6 +706,7 @@ class Randname:
         Raises:
             InvalidSexArgument: If sex is not in proper sex options
             InvalidCountryName: If country is not in valid countries
+            ValueError: If year range or year weights are invalid
 
         Examples:
             >>> randfirst()
@@ -176,10 +714,215 @@ class Randname:
         """
         return self._gen_name("first", year, sex, country, weights)
 
+    def randfull_many(
+        self,
+        n: int,
+        year: YearConvention | None = None,
+        sex: str | None = None,
+        country: str | None = None,
+        weights: bool = True,
+        unique: bool = False,
+    ) -> list[str]:
+        """Return list of n full names
+
+        Arguments set to None are drawn independently for every name, so the
+        result has the same distribution as n calls to `randfull`. Missing
+        arguments are drawn in bulk and each dataset is loaded once and
+        sampled in a single pass.
+
+        With unique, names are drawn without replacement: every next name is
+        drawn from names not drawn yet, with probability proportional to its
+        weight. Memory usage is proportional to n.
+
+        Args:
+            n: Number of names
+            year: Year of birth, (start, end) range of years, or mapping of
+                years to population weights, defaults to None
+            sex: Sex's name, defaults to None
+            country: Country of origin, defaults to None
+            weights: Use population distribution if True, else treat all names
+                with same probability, defaults to True
+            unique: Draw n distinct names, without replacement, defaults to
+                False
+
+        Returns:
+            List of full names
+
+        Raises:
+            InvalidSexArgument: If sex is not in proper sex options
+            InvalidCountryName: If country is not in valid countries
+            ValueError: If n is negative, or year range or year weights are
+                invalid
+            NotEnoughNamesError: If unique and there are less than n names
+
+        Examples:
+            >>> randfull_many(2)
+            ['John Doe', 'Mary Smith']
+        """
+        if unique:
+            return self._gen_unique("full", n, year, sex, country, weights)
+
+        return self._gen_many("full", n, year, sex, country, weights)[0]
+
+    def randlast_many(
+        self,
+        n: int,
+        year: YearConvention | None = None,
+        sex: str | None = None,
+        country: str | None = None,
+        weights: bool = True,
+        unique: bool = False,
+    ) -> list[str]:
+        """Return list of n last names
+
+        Arguments set to None are drawn independently for every name, so the
+        result has the same distribution as n calls to `randlast`.
+
+        Args:
+            n: Number of names
+            year: Year of birth, (start, end) range of years, or mapping of
+                years to population weights, defaults to None
+            sex: Sex's name, defaults to None
+            country: Country of origin, defaults to None
+            weights: Use population distribution if True, else treat all names
+                with same probability, defaults to True
+            unique: Draw n distinct names, without replacement, defaults to
+                False
+
+        Returns:
+            List of last names
+
+        Raises:
+            InvalidSexArgument: If sex is not in proper sex options
+            InvalidCountryName: If country is not in valid countries
+            ValueError: If n is negative, or year range or year weights are
+                invalid
+            NotEnoughNamesError: If unique and there are less than n names
+
+        Examples:
+            >>> randlast_many(2)
+            ['Doe', 'Smith']
+        """
+        if unique:
+            return self._gen_unique("last", n, year, sex, country, weights)
+
+        return self._gen_many("last", n, year, sex, country, weights)[0]
+
+    def randfirst_many(
+        self,
+        n: int,
+        year: YearConvention | None = None,
+        sex: str | None = None,
+        country: str | None = None,
+        weights: bool = True,
+        unique: bool = False,
+    ) -> list[str]:
+        """Return list of n first names
+
+        Arguments set to None are drawn independently for every name, so the
+        result has the same distribution as n calls to `randfirst`.
+
+        Args:
+            n: Number of names
+            year: Year of birth, (start, end) range of years, or mapping of
+                years to population weights, defaults to None
+            sex: Sex's name, defaults to None
+            country: Country of origin, defaults to None
+            weights: Use population distribution if True, else treat all names
+                with same probability, defaults to True
+            unique: Draw n distinct names, without replacement, defaults to
+                False
+
+        Returns:
+            List of first names
+
+        Raises:
+            InvalidSexArgument: If sex is not in proper sex options
+            InvalidCountryName: If country is not in valid countries
+            ValueError: If n is negative, or year range or year weights are
+                invalid
+            NotEnoughNamesError: If unique and there are less than n names
+
+        Examples:
+            >>> randfirst_many(2)
+            ['John', 'Mary']
+        """
+        if unique:
+            return self._gen_unique("first", n, year, sex, country, weights)
+
+        return self._gen_many("first", n, year, sex, country, weights)[0]
+
+    def stream(
+        self,
+        kind: KindConvention = "full",
+        year: YearConvention | None = None,
+        sex: str | None = None,
+        country: str | None = None,
+        weights: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """Return endless iterator of names
+
+        Names are generated lazily, in chunks of `chunk_size` names drawn with
+        the batch methods, so memory usage does not depend on how many names
+        are consumed. Arguments are validated when the first chunk is drawn.
+
+        Args:
+            kind: "first", "last" or "full", defaults to "full"
+            year: Year of birth, (start, end) range of years, or mapping of
+                years to population weights, defaults to None
+            sex: Sex's name, defaults to None
+            country: Country of origin, defaults to None
+            weights: Use population distribution if True, else treat all names
+                with same probability, defaults to True
+            chunk_size: Number of names generated at once, defaults to
+                DEFAULT_CHUNK_SIZE
+
+        Returns:
+            Iterator of names
+
+        Raises:
+            ValueError: If kind is invalid or chunk_size is lower than 1
+
+        Examples:
+            >>> names = stream(country="US")
+            >>> next(names)
+            'John Doe'
+            >>> list(itertools.islice(names, 2))
+            ['Mary Smith', 'James Brown']
+        """
+        generators = {
+            "first": self.randfirst_many,
+            "last": self.randlast_many,
+            "full": self.randfull_many,
+        }
+
+        if kind not in generators:
+            raise ValueError(f"{kind} not in {tuple(generators)}")
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0")
+
+        return Randname._stream(
+            generators[kind], chunk_size, year, sex, country, weights
+        )
+
+    @staticmethod
+    def _stream(
+        generate: Callable[..., list[str]],
+        chunk_size: int,
+        year: YearConvention | None,
+        sex: str | None,
+        country: str | None,
+        weights: bool,
+    ) -> Iterator[str]:
+        while True:
+            yield from generate(chunk_size, year, sex, country, weights)
+
     def _gen_name(
         self,
         short_name: ShortConvention,
-        year: int | None = None,
+        year: YearConvention | None = None,
         sex: str | None = None,
         country: str | None = None,
         cum_weights: bool = True,
@@ -207,14 +950,463 @@ class Randname:
             "Doe"
         """
         long_name = Randname._map_short_to_full_convention(short_name)
+        key = self._resolve_key(long_name, year, sex, country)
+        return self._gen_names([key], cum_weights)[0]
+
+    def _gen_names(
+        self,
+        keys: list[DatasetKey],
+        cum_weights: bool = True,
+        loaded: Mapping[Hashable, Any] = _NOTHING_LOADED,
+    ) -> list[str]:
+        """Draw one name from every dataset in keys.
+
+        Keys pointing to the same dataset are grouped, so each dataset is
+        loaded once and sampled with a single call.
+
+        Args:
+            keys: Dataset key for every name to draw
+            cum_weights: Include weights in database, defaults to True
+            loaded: Datasets and structures used by the sampler, already
+                loaded by the caller, by cache key. They are used instead of
+                the cache, defaults to none
+
+        Returns:
+            Names in the same order as keys
+        """
+        if not keys:
+            return []
+
+        # Fast path for a single dataset, list.count compares by identity first
+        if keys.count(keys[0]) == len(keys):
+            return self._sample(keys[0], cum_weights, len(keys), loaded)
+
+        positions: dict[DatasetKey, list[int]] = {}
+        for index, key in enumerate(keys):
+            positions.setdefault(key, []).append(index)
+
+        result = [""] * len(keys)
+        for key, indexes in positions.items():
+            sample = self._sample(key, cum_weights, len(indexes), loaded)
+            for index, name in zip(indexes, sample):
+                result[index] = name
+
+        return result
+
+    def _resolve_key(
+        self,
+        long_name: LongConvention,
+        year: YearConvention | None,
+        sex: str | None,
+        country: str | None,
+    ) -> DatasetKey:
+        """Pick dataset for a single name, drawing arguments that are None.
+
+        Args:
+            long_name: "first_names" or "last_names"
+            year: Year of source database
+            sex: Name gender
+            country: Database country
+
+        Returns:
+            Country, name type, year and sex of the dataset
+        """
         country = self._gen_country(country)
-        year = self._gen_year(year, country, long_name)
+        dataset_year = self._gen_year(year, country, long_name)
         sex = self._gen_sex(sex, country, long_name)
+        return (country, long_name, dataset_year, sex)
+
+    def _gen_many(
+        self,
+        kind: KindConvention,
+        n: int,
+        year: YearConvention | None,
+        sex: str | None,
+        country: str | None,
+        weights: bool,
+    ) -> tuple[list[str], list[DatasetKey]]:
+        """Draw n names together with datasets they were drawn from.
+
+        For full names, keys of the first name datasets are returned.
+
+        Returns:
+            Names and dataset key for every name
+        """
+        if kind == "full":
+            first_keys, last_keys = self._resolve_full_keys_many(n, year, sex, country)
+            first_names = self._gen_names(first_keys, weights)
+            last_names = self._gen_names(last_keys, weights)
+            names = [f"{first} {last}" for first, last in zip(first_names, last_names)]
+            return names, first_keys
+
+        long_name = Randname._map_short_to_full_convention(kind)
+        keys = self._resolve_keys(long_name, n, year, sex, country)
+        return self._gen_names(keys, weights), keys
+
+    def _gen_unique(
+        self,
+        kind: KindConvention,
+        n: int,
+        year: YearConvention | None,
+        sex: str | None,
+        country: str | None,
+        weights: bool,
+    ) -> list[str]:
+        """Draw n distinct names, weighted sampling without replacement.
+
+        Names are drawn in chunks, with replacement, and repeated names are
+        dropped. It's equivalent to drawing every next name from the names
+        not drawn yet. When most of a chunk is repeated names, the rest is
+        selected among all remaining names with Efraimidis-Spirakis keys, if
+        there are not too many of them compared to the draws still expected.
+
+        Returns:
+            List of n distinct names, in order they were drawn
+        """
+        if n < 0:
+            raise ValueError("n must be greater or equal 0")
+
+        drawn: dict[str, None] = {}
+        parts: list[tuple[float, list[dict[str, float]]]] | None = None
+        available = 0
+        while len(drawn) < n:
+            chunk = min(max(2 * (n - len(drawn)), _UNIQUE_MIN_CHUNK), _UNIQUE_MAX_CHUNK)
+            before = len(drawn)
+            drawn.update(
+                dict.fromkeys(
+                    self._gen_many(kind, chunk, year, sex, country, weights)[0]
+                )
+            )
+            accepted = len(drawn) - before
+
+            if len(drawn) >= n or accepted >= chunk * _UNIQUE_MIN_ACCEPTANCE:
+                continue
 
-        name_of_dataset = f"{year}_{sex}"
-        path_to_dataset = self.database.path / country / long_name / name_of_dataset
+            if parts is None:
+                parts = self._unique_parts(kind, year, sex, country, weights)
+                available = Randname._count_candidates(kind, parts)
+                if available < n:
+                    raise randname.error.NotEnoughNamesError(n, available)
+
+            # Checked after every chunk, acceptance drops as the most likely
+            # names are drawn, and the expected number of draws grows.
+            # Compared as remaining names <= factor * missing / acceptance.
+            if (available - len(drawn)) * accepted <= (
+                _UNIQUE_ENUMERATION_FACTOR * (n - len(drawn)) * chunk
+            ):
+                self._select_rest(kind, parts, drawn, n)
+            # Otherwise there are plenty of names left, keep drawing
+
+        return list(islice(drawn, n))
+
+    def _unique_parts(
+        self,
+        kind: KindConvention,
+        year: YearConvention | None,
+        sex: str | None,
+        country: str | None,
+        weights: bool,
+    ) -> list[tuple[float, list[dict[str, float]]]]:
+        """Return probability of every country and of names within it.
+
+        For full names, probabilities of first and last names are returned,
+        they are drawn independently.
+        """
+        countries = (
+            list(self._database.index)
+            if country is None
+            else [self._gen_country(country)]
+        )
+        long_names: tuple[LongConvention, ...] = (
+            ("first_names", "last_names")
+            if kind == "full"
+            else (Randname._map_short_to_full_convention(kind),)
+        )
+
+        parts = []
+        for country_name in countries:
+            mixtures = []
+            for long_name in long_names:
+                name_sex = sex
+                if kind == "full" and sex not in self._available_sex(
+                    country_name, long_name
+                ):
+                    name_sex = None
+                mixtures.append(
+                    self._name_mixture(long_name, country_name, year, name_sex, weights)
+                )
+            parts.append((1 / len(countries), mixtures))
+
+        return parts
+
+    def _name_mixture(
+        self,
+        long_name: LongConvention,
+        country: str,
+        year: YearConvention | None,
+        sex: str | None,
+        weights: bool,
+    ) -> dict[str, float]:
+        """Return probability of every name of a country and name type.
+
+        Datasets are mixed the same way keys are picked for single names.
+        Names that can't be drawn, with zero weight, are skipped.
+        """
+        if year:
+            years: Sequence[int | YearRange] = [
+                self._gen_year(year, country, long_name)
+            ]
+        else:
+            years = self._available_years(country, long_name)
+
+        if sex is not None:
+            sexes: Sequence[str] = [self._gen_sex(sex, country, long_name)]
+        else:
+            sexes = self._available_sex(country, long_name)
+
+        share = 1 / (len(years) * len(sexes))
+        mixture: dict[str, float] = {}
+        for dataset_year in years:
+            for dataset_sex in sexes:
+                names, totals = self._load_dataset(
+                    (country, long_name, dataset_year, dataset_sex)
+                )
+                if not weights:
+                    probability = share / len(names)
+                    for name in names:
+                        mixture[name] = mixture.get(name, 0.0) + probability
+                    continue
+
+                scale = share / totals[-1]
+                previous = 0
+                for name, total in zip(names, totals):
+                    if total > previous:
+                        mixture[name] = (
+                            mixture.get(name, 0.0) + (total - previous) * scale
+                        )
+                    previous = total
+
+        return mixture
+
+    @staticmethod
+    def _count_candidates(
+        kind: KindConvention, parts: list[tuple[float, list[dict[str, float]]]]
+    ) -> int:
+        """Count names available for unique sampling.
+
+        Exact for first and last names. For full names it's an upper bound,
+        the same full name can be made of names from different countries.
+        """
+        if kind != "full":
+            return len(set().union(*(mixtures[0] for _, mixtures in parts)))
+
+        return sum(len(first) * len(last) for _, (first, last) in parts)
+
+    def _select_rest(
+        self,
+        kind: KindConvention,
+        parts: list[tuple[float, list[dict[str, float]]]],
+        drawn: dict[str, None],
+        n: int,
+    ) -> None:
+        """Add names not drawn yet, until there are n of them.
+
+        Every candidate gets Efraimidis-Spirakis key, exponential variate
+        divided by its probability, and candidates with the lowest keys are
+        selected. It's the same as drawing them one by one without
+        replacement. Only the selected candidates are kept in memory.
+
+        Raises:
+            NotEnoughNamesError: If there are less than n names
+        """
+        rng = self._rng
+        while len(drawn) < n:
+            selected = heapq.nsmallest(
+                n - len(drawn),
+                Randname._unique_candidates(kind, parts, drawn),
+                key=lambda candidate: rng.expovariate(1.0) / candidate[1],
+            )
+            if not selected:
+                raise randname.error.NotEnoughNamesError(n, len(drawn))
 
-        return Randname._gen_name_from_file(path_to_dataset, cum_weights)
+            # Full names made of names from different countries can repeat
+            drawn.update(dict.fromkeys(name for name, _ in selected))
+
+    @staticmethod
+    def _unique_candidates(
+        kind: KindConvention,
+        parts: list[tuple[float, list[dict[str, float]]]],
+        drawn: dict[str, None],
+    ) -> Iterator[tuple[str, float]]:
+        """Yield names not drawn yet, with their probability."""
+        if kind != "full":
+            probabilities: dict[str, float] = {}
+            for country_probability, (mixture,) in parts:
+                for name, probability in mixture.items():
+                    probabilities[name] = (
+                        probabilities.get(name, 0.0) + country_probability * probability
+                    )
+            for name, probability in probabilities.items():
+                if name not in drawn:
+                    yield name, probability
+            return
+
+        for country_probability, (first_names, last_names) in parts:
+            for first_name, first_probability in first_names.items():
+                probability = country_probability * first_probability
+                for last_name, last_probability in last_names.items():
+                    name = f"{first_name} {last_name}"
+                    if name not in drawn:
+                        yield name, probability * last_probability
+
+    def _resolve_keys(
+        self,
+        long_name: LongConvention,
+        n: int,
+        year: YearConvention | None,
+        sex: str | None,
+        country: str | None,
+    ) -> list[DatasetKey]:
+        """Pick datasets for n names.
+
+        Missing arguments are drawn independently for every name, in bulk.
+        Given arguments are validated and resolved once per country.
+        """
+        if n < 0:
+            raise ValueError("n must be greater or equal 0")
+
+        keys: list[DatasetKey] = [("", long_name, 0, "")] * n
+        for country_name, positions in self._gen_countries(n, country).items():
+            country_keys = self._resolve_country_keys(
+                long_name, country_name, len(positions), year, sex
+            )
+            for index, key in zip(positions, country_keys):
+                keys[index] = key
+
+        return keys
+
+    def _resolve_full_keys_many(
+        self,
+        n: int,
+        year: YearConvention | None,
+        sex: str | None,
+        country: str | None,
+    ) -> tuple[list[DatasetKey], list[DatasetKey]]:
+        """Pick first and last name datasets for n full names.
+
+        Follows the same rules as `_resolve_full_keys`, in bulk.
+        """
+        if n < 0:
+            raise ValueError("n must be greater or equal 0")
+
+        if sex not in Randname.VALID_SEX_OPTIONS:
+            raise randname.error.InvalidSexArgumentError(
+                sex, Randname.VALID_SEX_OPTIONS
+            )
+
+        first_keys: list[DatasetKey] = [("", "first_names", 0, "")] * n
+        last_keys: list[DatasetKey] = [("", "last_names", 0, "")] * n
+        for country_name, positions in self._gen_countries(n, country).items():
+            long_name: LongConvention
+            for long_name, keys in (
+                ("first_names", first_keys),
+                ("last_names", last_keys),
+            ):
+                available_sex = self._available_sex(country_name, long_name)
+                country_keys = self._resolve_country_keys(
+                    long_name,
+                    country_name,
+                    len(positions),
+                    year,
+                    sex if sex in available_sex else None,
+                )
+                for index, key in zip(positions, country_keys):
+                    keys[index] = key
+
+        return first_keys, last_keys
+
+    def _gen_countries(self, n: int, country: str | None) -> dict[str, list[int]]:
+        """Draw country for n names.
+
+        Returns:
+            Positions of names, grouped by country
+        """
+        if country is not None:
+            return {self._gen_country(country): list(range(n))}
+
+        positions: dict[str, list[int]] = {}
+        for index, name in enumerate(
+            self._rng.choices(list(self._database.index), k=n)
+        ):
+            positions.setdefault(name, []).append(index)
+
+        return positions
+
+    def _resolve_country_keys(
+        self,
+        long_name: LongConvention,
+        country: str,
+        k: int,
+        year: YearConvention | None,
+        sex: str | None,
+    ) -> list[DatasetKey]:
+        """Pick datasets for k names from one country."""
+        if year and sex is not None:
+            key = (
+                country,
+                long_name,
+                self._gen_year(year, country, long_name),
+                self._gen_sex(sex, country, long_name),
+            )
+            return [key] * k
+
+        if year:
+            years = [self._gen_year(year, country, long_name)] * k
+        else:
+            years = self._rng.choices(self._available_years(country, long_name), k=k)
+
+        if sex is not None:
+            sexes = [self._gen_sex(sex, country, long_name)] * k
+        else:
+            sexes = self._rng.choices(self._available_sex(country, long_name), k=k)
+
+        return [
+            (country, long_name, name_year, name_sex)
+            for name_year, name_sex in zip(years, sexes)
+        ]
+
+    def _resolve_full_keys(
+        self,
+        year: YearConvention | None,
+        sex: str | None,
+        country: str | None,
+    ) -> tuple[DatasetKey, DatasetKey]:
+        """Pick first and last name datasets for a single full name.
+
+        If sex is not available for one of the name types, (e.g. neutral last
+        names), sex for that name type is drawn from the available ones.
+        """
+        country = self._gen_country(country)
+        first_name_available_sex = self._available_sex(country, "first_names")
+        last_name_available_sex = self._available_sex(country, "last_names")
+
+        first_name_sex = last_name_sex = sex
+
+        if sex not in Randname.VALID_SEX_OPTIONS:
+            raise randname.error.InvalidSexArgumentError(
+                sex, Randname.VALID_SEX_OPTIONS
+            )
+
+        if sex not in first_name_available_sex:
+            first_name_sex = self._rng.choice(first_name_available_sex)
+
+        if sex not in last_name_available_sex:
+            last_name_sex = self._rng.choice(last_name_available_sex)
+
+        return (
+            self._resolve_key("first_names", year, first_name_sex, country),
+            self._resolve_key("last_names", year, last_name_sex, country),
+        )
 
     @staticmethod
     def _map_short_to_full_convention(
@@ -232,9 +1424,9 @@ class Randname:
         return result
 
     def _gen_country(self, country: str | None) -> str:
-        countries = list(self.available_countries())
+        countries = list(self._database.index)
         if country is None:
-            country = random.choice(countries)
+            country = self._rng.choice(countries)
         # TODO: if not countries
         if country not in countries:
             raise randname.error.InvalidCountryNameError(country, countries)
@@ -242,70 +1434,527 @@ class Randname:
 
     def _gen_year(
         self,
-        year: int | None,
+        year: YearConvention | None,
         country: str,
         name_type: str,
-    ) -> int:
-        database_files = list((self._database.path / country / name_type).iterdir())
-        database_years = set(year.name.split("_")[0] for year in database_files)
-        data_range = sorted([int(year) for year in database_years])
+    ) -> int | YearRange:
+        self._sync_database()
 
-        if not year:
-            year = random.choice(data_range)
+        if isinstance(year, tuple):
+            range_key = (country, name_type, year)
+            dataset_year = self._year_ranges.get(range_key)
+            if dataset_year is None:
+                dataset_year = self._gen_year_range(year, country, name_type)
+                self._year_ranges[range_key] = dataset_year
+            return dataset_year
 
-        logging.debug(f"Year: {year}")
+        if isinstance(year, Mapping):
+            return self._gen_year_range(year, country, name_type)
 
-        if not min(data_range) <= year <= max(data_range):
+        return self._snap_year(year, country, name_type)
+
+    def _snap_year(self, year: int | None, country: str, name_type: str) -> int:
+        data_range = self._available_years(country, name_type)
+
+        if not year:
+            year = self._rng.choice(data_range)
+
+        if not data_range[0] <= year <= data_range[-1]:
             logger.warning("%s -> %s not in range %s", year, year, data_range)
 
-        # Correction of year index. If bisect_left returns int > len(data_range)
-        # return bisect_left -1. It's in case of very small data sets.
-        def correct_bisect_left(d, y):
-            bisect = bisect_left(d, y)
-            return bisect if bisect != len(d) else bisect - 1
+        # Correction of year index. If bisect_left returns len(data_range)
+        # use the last year instead. It's in case of very small data sets.
+        year_index = min(bisect_left(data_range, year), len(data_range) - 1)
 
-        year_index = correct_bisect_left(data_range, year)
-        logging.debug(f"Year index: {year_index}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Year: %s, year index: %s", year, year_index)
 
         return data_range[year_index]
 
+    def _gen_year_range(
+        self,
+        year: tuple[int, int] | Mapping[int, float],
+        country: str,
+        name_type: str,
+    ) -> int | YearRange:
+        """Map range of years, or years with population weights, to datasets.
+
+        Range selects datasets of all years within it, or of the nearest year
+        if there are none. Weighted years are mapped to datasets like single
+        years, weights of years mapped to the same dataset are added up.
+
+        Returns:
+            Year of the dataset, if only one is selected, else years of
+            datasets to merge
+        """
+        if isinstance(year, Mapping):
+            weights: dict[int, float] = {}
+            for name_year, weight in year.items():
+                if weight < 0:
+                    raise ValueError(f"weight of {name_year} is negative: {weight}")
+                dataset_year = self._snap_year(name_year, country, name_type)
+                weights[dataset_year] = weights.get(dataset_year, 0) + weight
+
+            years = tuple(sorted(y for y, weight in weights.items() if weight > 0))
+            if not years:
+                raise ValueError("year weights must not be all zero")
+            if len(years) == 1:
+                return years[0]
+            return YearRange(years, tuple(weights[y] for y in years))
+
+        if len(year) != 2:
+            raise ValueError(f"year range must be (start, end), not {year}")
+
+        start, end = year
+        if start > end:
+            raise ValueError(f"start of year range {year} is after its end")
+
+        data_range = self._available_years(country, name_type)
+        years = data_range[
+            bisect_left(data_range, start) : bisect_right(data_range, end)
+        ]
+        if not years:
+            return self._snap_year(start, country, name_type)
+        if len(years) == 1:
+            return years[0]
+        return YearRange(years)
+
+    def _available_years(self, country: str, name_type: str) -> tuple[int, ...]:
+        data_range = self._database.index[country][name_type].years
+
+        if not data_range:
+            raise randname.error.DirectoryDoesNotExistError(
+                self._database.path / country / name_type
+            )
+
+        return data_range
+
     def _gen_sex(self, sex: str | None, country: str, name_type: str) -> str:
         available_sex = self._available_sex(country, name_type)
 
         if sex is None:
-            sex = random.choice(available_sex)
+            sex = self._rng.choice(available_sex)
 
         if str(sex).capitalize() not in available_sex:
             raise randname.error.InvalidSexArgumentError(sex, available_sex)
 
         return sex
 
-    def _available_sex(self, country: str, name_type: str):
-        info = self._database.path / country / "info.json"
-
-        with info.open("r", encoding="utf-8") as fd:
-            available_sex = json.load(fd)[name_type]
+    def _available_sex(self, country: str, name_type: str) -> tuple[str, ...]:
+        available_sex = self._database.index[country][name_type].sexes
 
-        logging.debug("Available sex: %s", available_sex)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available sex: %s", available_sex)
 
         return available_sex
 
+    def _load_dataset(self, key: DatasetKey) -> LoadedDataset:
+        """Return dataset from the cache, reading it from file on a miss.
+
+        Args:
+            key: Country, name type, year and sex of the dataset
+
+        Returns:
+            Names and cumulative weights
+        """
+        return self._load_once(key, lambda: self._read_key(key))
+
+    def _read_key(self, key: DatasetKey) -> tuple[LoadedDataset, int]:
+        """Read dataset from country pack, if the country is packed, else from
+        binary file if it exists, otherwise from JSON file.
+
+        Returns:
+            Names and cumulative weights, and their size in bytes
+        """
+        country, name_type, year, sex = key
+
+        if isinstance(year, YearRange):
+            merged = randname.database.Dataset(
+                *self._merge_years(country, name_type, year, sex),
+                self._name_table(country),
+            )
+            return (merged.names, merged.totals), merged.nbytes
+
+        return self._read_year(country, name_type, year, sex)
+
+    def _read_year(
+        self, country: str, name_type: str, year: int, sex: str
+    ) -> tuple[LoadedDataset, int]:
+        """Read dataset of a single year, see `_read_key`.
+
+        Not instrumented, so years read to merge them are not counted as
+        loaded datasets.
+
+        Returns:
+            Names and cumulative weights, and their size in bytes
+        """
+        pack = self._database.pack(country)
+        if pack is not None:
+            try:
+                binary = pack.dataset(name_type, year, sex)
+            except KeyError:
+                raise FileNotFoundError(
+                    f"{self._database.path / country / randname.database.PACK_NAME}: "
+                    f"no {name_type} for {year} {sex}"
+                ) from None
+            return (binary.names, binary.totals), binary.nbytes
+
+        path_to_dataset = self._database.path / country / name_type / f"{year}_{sex}"
+        path_to_binary = path_to_dataset.with_name(
+            path_to_dataset.name + randname.database.BINARY_SUFFIX
+        )
+
+        if path_to_binary.exists():
+            binary = randname.database.BinaryDataset.open(path_to_binary)
+            return (binary.names, binary.totals), binary.nbytes
+
+        compact = randname.database.Dataset(
+            *self._parse_dataset(self._read_file(path_to_dataset)),
+            self._name_table(country),
+        )
+        return (compact.names, compact.totals), compact.nbytes
+
+    def _store(self, cache_key: Hashable, value: Any, nbytes: int) -> None:
+        """Put value in the cache, and with shared names, the name table of
+        the dataset country.
+
+        Name table is charged to the cache budget, its size is updated
+        every time a dataset of the country is stored.
+        """
+        if not self._shared_names:
+            self._cache.put(cache_key, value, nbytes)
+            return
+
+        with self._tables_lock:
+            self._store_with_table(cache_key, value, nbytes)
+
+    def _store_with_table(self, cache_key: Hashable, value: Any, nbytes: int) -> None:
+        """Store value and charge name table used by it, see `_store`.
+
+        Called with the tables lock held.
+        """
+        self._cache.put(cache_key, value, nbytes)
+
+        if not isinstance(cache_key, tuple) or len(cache_key) != 4:
+            return
+
+        country = cache_key[0]
+        if cache_key not in self._cache:
+            # Dataset doesn't fit in the cache
+            self._drop_unused_table(country)
+            return
+
+        # Binary datasets don't use the table, their names are in the file
+        table = getattr(value[0], "table", None)
+        if table is None:
+            table = self._name_tables.get(country)
+            if table is None:
+                return
+        elif self._name_tables.setdefault(country, table) is not table:
+            # Table was dropped while the dataset was read, and other load
+            # created a new one. Dataset is not kept, its table is not charged.
+            self._cache.discard(cache_key)
+            return
+
+        table_key = (country, _NAME_TABLE)
+        self._cache.put(table_key, table, table.nbytes)
+        if table_key not in self._cache:
+            # Datasets can't be kept without their table
+            self._drop_country(country)
+
+    def _evicted(self, key: Hashable, value: Any) -> None:
+        """Keep name tables in the cache as long as datasets using them.
+
+        Eviction of a table evicts datasets of its country, eviction of the
+        last dataset of a country evicts its table.
+        """
+        if not isinstance(key, tuple):
+            return
+
+        if len(key) == 2 and key[1] == _NAME_TABLE:
+            self._drop_country(key[0])
+        elif len(key) == 4:
+            self._drop_unused_table(key[0])
+
+    def _drop_unused_table(self, country: str) -> None:
+        """Remove name table of a country, if no dataset of it is cached."""
+        with self._tables_lock:
+            if country not in self._name_tables or any(
+                len(key) == 4 and key[0] == country for key, _ in self._cache.entries()
+            ):
+                return
+
+            self._name_tables.pop(country, None)
+            self._cache.discard((country, _NAME_TABLE))
+
+    def _drop_country(self, country: str) -> None:
+        """Remove name table, datasets and derived structures of a country."""
+        with self._tables_lock:
+            self._name_tables.pop(country, None)
+            for key, _ in self._cache.entries():
+                # Derived structures are stored under (dataset key, kind)
+                key_country = key[0] if isinstance(key[0], str) else key[0][0]
+                if key_country == country:
+                    self._cache.discard(key)
+
+    def _name_table(self, country: str) -> randname.database.NameTable | None:
+        """Return table of names shared by datasets of the country, if names
+        are shared, creating it on first use.
+        """
+        if not self._shared_names:
+            return None
+
+        with self._tables_lock:
+            table = self._name_tables.get(country)
+            if table is None:
+                # Threads loading datasets of the country at once get the same table
+                table = self._name_tables[country] = randname.database.NameTable()
+            return table
+
+    def _merge_years(
+        self, country: str, name_type: str, year_range: YearRange, sex: str
+    ) -> LoadedDataset:
+        """Merge datasets of many years into one.
+
+        Without weights, occurrences of every name are added up over years.
+        With weights, names of every year get share of the merged totals
+        proportional to the year weight. Datasets already in the cache are
+        reused, others are read without storing them in the cache.
+
+        Returns:
+            Names and cumulative weights
+        """
+        counts: dict[str, float] = {}
+        weights = year_range.weights
+        weight_sum = 0.0 if weights is None else sum(weights)
+
+        for index, dataset_year in enumerate(year_range.years):
+            key = (country, name_type, dataset_year, sex)
+            dataset = self._cache.peek(key)
+            if dataset is None:
+                dataset = self._read_year(country, name_type, dataset_year, sex)[0]
+            names, totals = dataset
+
+            scale = 1.0
+            if weights is not None:
+                scale = (
+                    _MERGE_SCALE * weights[index] / weight_sum / totals[-1]
+                    if totals[-1]
+                    else 0.0
+                )
+
+            previous = 0
+            for name, total in zip(names, totals):
+                counts[name] = counts.get(name, 0) + (total - previous) * scale
+                previous = total
+
+        return list(counts), list(accumulate(round(count) for count in counts.values()))
+
+    def _build_cache_entries(self, key: DatasetKey) -> list[tuple[Any, Any, int]]:
+        """Read dataset and build structure used by the sampler, if any.
+
+        Entries are not stored in the cache, the caller stores them, e.g.
+        once for all requests sharing an asynchronous load.
+
+        Returns:
+            Cache key, value and size in bytes of every entry
+        """
+        dataset, nbytes = self._read_key(key)
+        entries: list[tuple[Any, Any, int]] = [(key, dataset, nbytes)]
+        names, totals = dataset
+
+        derived: randname.sampling.NumpyDataset | randname.sampling.AliasTable
+        if self._sampler == "numpy":
+            derived = randname.sampling.NumpyDataset(names, totals)
+            entries.append(((key, "numpy"), derived, derived.nbytes))
+        elif self._sampler == "alias":
+            derived = randname.sampling.AliasTable(totals)
+            entries.append(((key, "alias"), derived, derived.nbytes))
+
+        return entries
+
+    def _resident_entries(self, key: DatasetKey) -> dict[Hashable, Any] | None:
+        """Return dataset and structure used by the sampler from the cache.
+
+        Returns:
+            Cached values by cache key, or None if any of them is not cached
+        """
+        dataset = self._cache.get(key)
+        if dataset is None:
+            return None
+
+        entries: dict[Hashable, Any] = {key: dataset}
+        if self._sampler in ("numpy", "alias"):
+            derived = self._cache.get((key, self._sampler))
+            if derived is None:
+                return None
+            entries[(key, self._sampler)] = derived
+
+        return entries
+
+    def _sample(
+        self,
+        key: DatasetKey,
+        cum_weights: bool,
+        k: int,
+        loaded: Mapping[Hashable, Any] = _NOTHING_LOADED,
+    ) -> list[str]:
+        """Draw k names from dataset, using sampler selected for the instance.
+
+        Args:
+            key: Country, name type, year and sex of the dataset
+            cum_weights: Include weights in database
+            k: Number of names
+            loaded: Dataset and structure used by the sampler, already
+                loaded by the caller, by cache key, defaults to none
+
+        Returns:
+            List of names
+        """
+        dataset = loaded.get(key)
+        names, totals = self._load_dataset(key) if dataset is None else dataset
+
+        if self._sampler == "numpy":
+            numpy_dataset = loaded.get((key, "numpy"))
+            if numpy_dataset is None:
+                numpy_dataset = self._numpy_dataset(key, names, totals)
+            return numpy_dataset.sample(k, self._numpy_generator, cum_weights)
+
+        if cum_weights and self._sampler == "alias":
+            alias_table = loaded.get((key, "alias"))
+            if alias_table is None:
+                alias_table = self._alias_table(key, totals)
+            return Randname._take(names, alias_table.sample(k, self._rng.random))
+
+        return self._choose_names(names, totals, cum_weights, k)
+
+    def _numpy_dataset(
+        self, key: DatasetKey, names: Sequence[str], totals: Sequence[int]
+    ) -> randname.sampling.NumpyDataset:
+        return self._load_derived(
+            key, "numpy", lambda: randname.sampling.NumpyDataset(names, totals)
+        )
+
+    def _alias_table(
+        self, key: DatasetKey, totals: Sequence[int]
+    ) -> randname.sampling.AliasTable:
+        return self._load_derived(
+            key, "alias", lambda: randname.sampling.AliasTable(totals)
+        )
+
+    def _load_derived(
+        self, key: DatasetKey, kind: str, build: Callable[[], Any]
+    ) -> Any:
+        """Return structure derived from the dataset, building it on a cache miss.
+
+        Derived structures (e.g. alias tables) share the cache, and the memory
+        budget, with datasets. They must have `nbytes` attribute.
+
+        Args:
+            key: Country, name type, year and sex of the dataset
+            kind: Name of the derived structure
+            build: Function building the structure
+
+        Returns:
+            Derived structure
+        """
+
+        def load() -> tuple[Any, int]:
+            derived = build()
+            return derived, derived.nbytes
+
+        return self._load_once((key, kind), load)
+
+    def _load_once(
+        self, cache_key: Hashable, load: Callable[[], tuple[Any, int]]
+    ) -> Any:
+        """Return cached value, loading it on a miss.
+
+        Concurrent misses of the same key are served by a single load, other
+        threads wait for its result. Errors are raised in every waiting
+        thread.
+
+        Args:
+            cache_key: Cache key
+            load: Function returning value and its size in bytes
+
+        Returns:
+            Cached or loaded value
+        """
+        self._sync_database()
+        value = self._cache.get(cache_key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            pending = self._loading.get(cache_key)
+            if pending is None:
+                # Value could be stored between the miss and taking the lock
+                value = self._cache.peek(cache_key)
+                if value is not None:
+                    return value
+                future: Future[Any] = Future()
+                self._loading[cache_key] = future
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            value, nbytes = load()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            # Stored before the future is released, so a thread missing the
+            # cache either finds it pending or finds it in the cache
+            self._store(cache_key, value, nbytes)
+            future.set_result(value)
+        finally:
+            with self._lock:
+                del self._loading[cache_key]
+
+        return value
+
     @staticmethod
-    def _gen_name_from_file(path_to_dataset: Path, cum_weights: bool = True) -> str:
-        with path_to_dataset.open("r", encoding="utf-8") as json_file:
-            logging.debug(f"Opening: {json_file.name}")
-            data_set = json.load(json_file)
-            name_population = data_set["Names"]
-            name_cum_weights = data_set["Totals"]
+    def _read_file(path_to_dataset: Path) -> bytes:
+        logger.debug("Opening: %s", path_to_dataset)
+        return path_to_dataset.read_bytes()
 
+    @staticmethod
+    def _parse_dataset(content: bytes) -> LoadedDataset:
+        data_set = json.loads(content)
+        return data_set["Names"], data_set["Totals"]
+
+    def _choose_names(
+        self,
+        name_population: Sequence[str],
+        name_cum_weights: Sequence[int],
+        cum_weights: bool,
+        k: int = 1,
+    ) -> list[str]:
+        # Indexes are drawn with the same random numbers as names would be.
+        # Length of totals is cheaper to get than of compact names.
+        population = range(len(name_cum_weights))
         if cum_weights:
-            name = random.choices(name_population, cum_weights=name_cum_weights)[0]
+            if k * _BISECT_COPY_FACTOR >= len(name_cum_weights) and not isinstance(
+                name_cum_weights, list
+            ):
+                name_cum_weights = list(name_cum_weights)
+            indexes = self._rng.choices(population, cum_weights=name_cum_weights, k=k)
         else:
-            name = random.choices(name_population)[0]
+            indexes = self._rng.choices(population, k=k)
 
-        logging.debug(f"Name: {name}")
+        return Randname._take(name_population, indexes)
 
-        return name
+    @staticmethod
+    def _take(names: Sequence[str], indexes: Sequence[int]) -> list[str]:
+        """Return names at indexes, in a single call for compact datasets."""
+        # Cheaper than isinstance check against an abstract base class
+        take = getattr(names, "take", None)
+        if take is not None:
+            return take(indexes)
+
+        return [names[index] for index in indexes]
 
     # Support functions
 
@@ -322,10 +1971,10 @@ class Randname:
             >>> available_countries()
             {'ES', 'PL', 'US'}
         """
-        if path is None:
-            path = self._database.path
+        if path is None or path == self._database.path:
+            return set(self._database.index)
 
-        return {p.name for p in path.iterdir()}
+        return {p.name for p in path.iterdir() if p.is_dir()}
 
     def show_data(
         self, path: Path | None
@@ -367,21 +2016,62 @@ class Randname:
         return result
 
 
-# Create one instance of Randname
+# Create one instance of Randname, lazily, on first use
 # Alias module-level functions to the instance methods
 # This is similar approach as seen in libraries like 'random' or 'numpy'
 # It allows users to call functions directly from the module without
 # needing to instantiate the Randname class themselves.
 # At the same time it makes implementation easier, because functions share
 # internal state and resources.
+# Instance is not created at import time, to keep `import randname` cheap.
+
+_inst_lock = threading.Lock()
+
+
+def _instance() -> Randname:
+    """Return module level instance of Randname, creating it on first call."""
+    instance = globals().get("_inst")
+
+    if instance is None:
+        with _inst_lock:
+            instance = globals().get("_inst")
+            if instance is None:
+                instance = globals()["_inst"] = Randname()
+
+    return instance
+
+
+def __getattr__(name: str) -> Any:
+    if name == "_inst":
+        return _instance()
+    if name == "database":
+        return _instance().database
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _alias[**P, R](method: Callable[Concatenate[Randname, P], R]) -> Callable[P, R]:
+    @functools.wraps(method)
+    def function(*args: P.args, **kwargs: P.kwargs) -> R:
+        return method(_instance(), *args, **kwargs)
 
-_inst = Randname()
+    return function
 
-database = _inst.database
 
-randfirst = _inst.randfirst
-randlast = _inst.randlast
-randfull = _inst.randfull
+randfirst = _alias(Randname.randfirst)
+randlast = _alias(Randname.randlast)
+randfull = _alias(Randname.randfull)
+randfirst_many = _alias(Randname.randfirst_many)
+randlast_many = _alias(Randname.randlast_many)
+randfull_many = _alias(Randname.randfull_many)
+stream = _alias(Randname.stream)
 
-available_countries = _inst.available_countries
-show_data = _inst.show_data
+available_countries = _alias(Randname.available_countries)
+show_data = _alias(Randname.show_data)
+seed = _alias(Randname.seed)
+cache_info = _alias(Randname.cache_info)
+clear_cache = _alias(Randname.clear_cache)
+preload = _alias(Randname.preload)
+resident_datasets = _alias(Randname.resident_datasets)
+enable_instrumentation = _alias(Randname.enable_instrumentation)
+disable_instrumentation = _alias(Randname.disable_instrumentation)
+instrumentation_info = _alias(Randname.instrumentation_info)
@@ -2,17 +2,146 @@
 
 Classes:
     Database: Database container and validator.
+    NameTypeIndex: Years and sexes available for one name type of a country.
+    Dataset: Names and cumulative weights in compact form.
+    NameSequence: Read only sequence of names of a dataset.
+    NameTable: Names shared by datasets, every name stored once.
+    BinaryDataset: Names file in compact binary format.
+    CountryPack: Names files of a country packed in a single file.
+
+Functions:
+    pack_dataset: Serialize names and cumulative weights to binary format.
+    pack_country: Pack binary names files of a country in a single file.
+    validate_names: Check content of names file.
+    validate_info: Check content of info.json file.
+
+Binary format:
+    Binary files are stored next to JSON files, with `.bin` suffix, for
+    example `2018_M.bin`. When both exist, the binary file is used.
+    All integers are little-endian.
+
+    | Part    | Type                | Description                         |
+    |---------|---------------------|-------------------------------------|
+    | header  | 4s, uint32, 2*int64 | magic, version, count, blob size    |
+    | offsets | int64[count + 1]    | start of each name in the blob      |
+    | totals  | int64[count]        | cumulative weights                  |
+    | blob    | bytes               | UTF-8 encoded names, one after other|
+
+Pack format:
+    All names files of a country can be packed in a single `names.pack`
+    file, in the country directory, next to info.json. When it exists, it's
+    used instead of first_names and last_names directories, which can be
+    removed. Opening a dataset is a lookup in the entry table, the file is
+    memory mapped once per country. All integers are little-endian.
+
+    | Part     | Type                     | Description                      |
+    |----------|--------------------------|----------------------------------|
+    | header   | 4s, uint32, int64        | magic, version, count            |
+    | entries  | (uint8, 1s, 2x, int32,   | name type (index in NAME_TYPES), |
+    |          | int64, int64)[count]     | sex, year, offset, size          |
+    | datasets | bytes                    | datasets in binary format,       |
+    |          |                          | starting at 8 byte boundaries    |
 """
 
+import abc
+import hashlib
+import importlib.util
 import json
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import (
+    Buffer,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from itertools import accumulate
 from pathlib import Path
-from typing import Union
-
-import jsonschema
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple, Union, overload
 
 import randname.error
 from randname.config import logger
 
+if TYPE_CHECKING:
+    import jsonschema
+
+
+BINARY_SUFFIX = ".bin"
+BINARY_MAGIC = b"RNDN"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sIqq")
+
+PACK_NAME = "names.pack"
+PACK_MAGIC = b"RNDP"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct("<4sIq")
+PACK_ENTRY = struct.Struct("<B1s2xiqq")
+
+DATASET_NAME_PATTERN = re.compile(
+    r"(?P<year>[1-9][0-9]*)_(?P<sex>[A-Z])(?P<suffix>\.bin)?"
+)
+NAME_TYPES = ("first_names", "last_names")
+MANIFEST_VERSION = 1
+# Validation modes, from the least to the most strict
+VALIDATION_MODES = ("structural", "full", "strict")
+# Batches of at least that many names share names drawn more than once
+_TAKE_SHARED_MIN = 32
+
+# jsonschema is optional, it's used only to validate info.json files and in
+# strict validation mode
+JSONSCHEMA_AVAILABLE = importlib.util.find_spec("jsonschema") is not None
+
+
+class NameTypeIndex(NamedTuple):
+    """Index entry for one name type of a country.
+
+    Attributes:
+        years: Sorted years for which there is at least one dataset.
+        sexes: Sexes defined in info.json.
+    """
+
+    years: tuple[int, ...]
+    sexes: tuple[str, ...]
+
+
+type DatabaseIndex = Mapping[str, Mapping[str, NameTypeIndex]]
+# Name type, year and sex of a dataset within a country
+type PackKey = tuple[str, int, str]
+
+
+class _LazyValidator:
+    """Class attribute with jsonschema validator, created on first access.
+
+    Importing jsonschema and building validators is slow, and they are
+    needed only to validate the database, not to draw names.
+
+    Args:
+        schema_attribute: Name of the class attribute holding the schema.
+    """
+
+    def __init__(self, schema_attribute: str):
+        self._schema_attribute = schema_attribute
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type) -> "jsonschema.Draft7Validator":
+        import jsonschema
+
+        validator = jsonschema.Draft7Validator(getattr(owner, self._schema_attribute))
+        # Replace descriptor with validator, so it's created only once
+        setattr(owner, self._name, validator)
+        return validator
+
 
 class Database:
     schema_info_json = {
@@ -43,8 +172,8 @@ class Database:
         "additionalProperties": False,
     }
 
-    draft_validator_info = jsonschema.Draft7Validator(schema_info_json)
-    draft_validator_name = jsonschema.Draft7Validator(schema_name_json)
+    draft_validator_info = _LazyValidator("schema_info_json")
+    draft_validator_name = _LazyValidator("schema_name_json")
 
     def __init__(self, path_to_database: Union[Path, str]):
         """Database container.
@@ -57,9 +186,17 @@ class Database:
 
         Args:
             path_to_database: Path to directory with database
+
+        Attributes:
+            generation: Number of times the path was changed, so users of
+                the database can tell data read from it is stale
         """
         # self.validate_database(path_to_database)
         self._path = Path(path_to_database)
+        self.generation = 0
+        self._index: DatabaseIndex | None = None
+        self._index_lock = threading.Lock()
+        self._packs: dict[str, CountryPack | None] = {}
 
     @property
     def path(self) -> Path:
@@ -74,44 +211,207 @@ class Database:
     def path(self, new_path: Path) -> None:
         Database.validate(new_path)
         self._path = Path(new_path)
+        self._index = None
+        self._packs = {}
+        self.generation += 1
+
+    @property
+    def index(self) -> DatabaseIndex:
+        """Read only index of the database: country -> name type -> years and sexes.
+
+        Index is built once, on first access after the path is set, so
+        directory listings and info.json files are not read on every lookup.
+        Threads accessing it concurrently wait for a single build. Built
+        index is immutable, so it's read without a lock.
+
+        Returns:
+            Index of the database
+
+        Raises:
+            FileNotFoundError: If directory with database does not exist.
+            randname.error.MissingInfoFileError: If country has no info.json.
+        """
+        index = self._index
+        if index is None:
+            with self._index_lock:
+                index = self._index
+                if index is None:
+                    index = self._index = self.build_index(self._path)
+        return index
+
+    @property
+    def index_built(self) -> bool:
+        """Whether the index is built, so accessing it does not scan the database.
+
+        Returns:
+            True if the index is built
+        """
+        return self._index is not None
+
+    def pack(self, country: str) -> "CountryPack | None":
+        """Return pack of a country, if the country is packed.
+
+        Pack file is opened on first access and kept open.
+
+        Args:
+            country: Country
+
+        Returns:
+            Pack or None, if there is no pack file in the country directory
+
+        Raises:
+            randname.error.InvalidDatasetFormatError: If pack file is invalid.
+        """
+        try:
+            return self._packs[country]
+        except KeyError:
+            pass
+
+        with self._index_lock:
+            if country not in self._packs:
+                path_to_pack = self._path / country / PACK_NAME
+                self._packs[country] = (
+                    CountryPack.open(path_to_pack) if path_to_pack.is_file() else None
+                )
+            return self._packs[country]
 
     @staticmethod
-    def validate(path: Path) -> bool:
+    def build_index(path: Path) -> DatabaseIndex:
+        """Scan database directory and build its index.
+
+        Years of packed countries are read from the pack entries. Files that
+        do not match the `<year>_<sex>` naming convention are skipped. Use
+        `Database.validate` to report them.
+
+        Args:
+            path: Path to database
+
+        Returns:
+            Index of the database
+        """
+        index: dict[str, Mapping[str, NameTypeIndex]] = {}
+
+        for country_directory in path.iterdir():
+            if not country_directory.is_dir():
+                continue
+
+            path_to_info_file = country_directory / "info.json"
+            if not path_to_info_file.exists():
+                raise randname.error.MissingInfoFileError(path_to_info_file)
+
+            with path_to_info_file.open("r", encoding="utf-8") as info_file:
+                info = json.load(info_file)
+
+            pack_keys: list[PackKey] | None = None
+            path_to_pack = country_directory / PACK_NAME
+            if path_to_pack.is_file():
+                pack_keys = CountryPack.open(path_to_pack).keys()
+
+            country_index: dict[str, NameTypeIndex] = {}
+            for name_type in NAME_TYPES:
+                name_type_directory = country_directory / name_type
+                years: set[int] = set()
+
+                if pack_keys is not None:
+                    years.update(
+                        year
+                        for pack_name_type, year, _ in pack_keys
+                        if pack_name_type == name_type
+                    )
+                elif name_type_directory.is_dir():
+                    for dataset in name_type_directory.iterdir():
+                        match = DATASET_NAME_PATTERN.fullmatch(dataset.name)
+                        if match:
+                            years.add(int(match["year"]))
+
+                country_index[name_type] = NameTypeIndex(
+                    tuple(sorted(years)), tuple(info.get(name_type, ()))
+                )
+
+            index[country_directory.name] = MappingProxyType(country_index)
+
+        return MappingProxyType(index)
+
+    @staticmethod
+    def validate(
+        path: Path,
+        *,
+        structural: bool = False,
+        strict: bool = False,
+        workers: int | None = 1,
+        manifest: Path | None = None,
+    ) -> bool:
         """Check if database has valid structure and it's files are
         correctly formatted.
 
+        Directory structure and file names are checked first, then content
+        of every info.json and names file, in a pool of `workers` processes.
+        For packed countries, the pack file is checked instead of names
+        directories.
+
+        Names files are checked by `validate_names`, in a single pass. It
+        checks everything the JSON schema does, and also that Names and
+        Totals have the same length and Totals are not decreasing. info.json
+        files are checked with jsonschema, if it's installed, otherwise by
+        `validate_info`.
+
+        With `manifest`, size, modification time and SHA-256 hash of every
+        valid file are saved to the manifest file. On the next validation
+        files with the same size and modification time, or the same hash,
+        are not checked again. Manifest can be stored in database root,
+        files in the root directory are ignored.
+
         Warning:
             Validating database might take some time, depends how large is the database.
 
         Args:
             path: Path to database
+            structural: Don't use jsonschema at all, defaults to False
+            strict: Validate names files against the JSON schema as well,
+                requires jsonschema, defaults to False
+            workers: Number of processes, None for number of CPUs,
+                defaults to 1 (validate in the current process)
+            manifest: Path to validation manifest, defaults to None
+                (validate every file)
 
         Raises:
             randname.error.DirectoryDoesNotExist: Raise when directory with database does not exist.
             randname.error.MissingInfoFile: Raise when info.json is missing.
             randname.error.GenderMismatch: Raise when gender information in info.json does not match to what is in directories.
             randname.error.FileNameDoesNotMatchPattern: Raise when file with names doesn't match naming convention.
-            jsonschema.ValidationError: Raise when json file doesn't match pattern.
+            jsonschema.ValidationError: Raise when json or binary file doesn't match pattern, if jsonschema is installed.
+            randname.error.InvalidDatasetFormatError: Raise when json or binary file is invalid, in structural mode or without jsonschema.
+            ImportError: Raise in strict mode, when jsonschema is not installed.
+            ValueError: Raise when both structural and strict are set.
         """
+        if structural and strict:
+            raise ValueError("structural and strict are mutually exclusive")
+
+        if strict and not JSONSCHEMA_AVAILABLE:
+            raise ImportError(
+                "strict validation requires jsonschema: pip install rname[jsonschema]"
+            )
+
+        mode = "structural" if structural else "strict" if strict else "full"
         invalid_name_pattern: list[Path] = []
-        invalid_json_files: list[Path] = []
+        files: list[tuple[Path, str]] = []
 
         if not path.is_dir():
             raise randname.error.DirectoryDoesNotExistError(path)
 
         # traverse directory
-        for country_directory in path.iterdir():
+        for country_directory in sorted(path.iterdir()):
+            if not country_directory.is_dir():
+                continue
+
             path_to_info_file = Path() / country_directory / "info.json"
             first_names_dir = Path() / country_directory / "first_names"
             last_names_dir = Path() / country_directory / "last_names"
+            path_to_pack = Path() / country_directory / PACK_NAME
 
             # check for required files
             if not path_to_info_file.exists():
                 raise randname.error.MissingInfoFileError(path_to_info_file)
-            if not first_names_dir.exists():
-                raise randname.error.DirectoryDoesNotExistError(first_names_dir)
-            if not last_names_dir.exists():
-                raise randname.error.DirectoryDoesNotExistError(last_names_dir)
 
             # check info.json
             with path_to_info_file.open("r", encoding="utf-8") as info_file:
@@ -119,21 +419,26 @@ class Database:
                 first_names_sex = set(json_file["first_names"])
                 last_names_sex = set(json_file["last_names"])
 
-            try:
-                Database._validate_json_schema(
-                    Database.schema_info_json, path_to_info_file
-                )
-            except jsonschema.ValidationError:
-                logger.error(f"Invalid info file: {path_to_info_file}")
-                invalid_json_files.append(path_to_info_file)
+            files.append((path_to_info_file, "info"))
+
+            # names directories of packed country are not used
+            if path_to_pack.exists():
+                Database._validate_pack_sexes(path_to_pack, json_file)
+                files.append((path_to_pack, "pack"))
+                continue
+
+            if not first_names_dir.exists():
+                raise randname.error.DirectoryDoesNotExistError(first_names_dir)
+            if not last_names_dir.exists():
+                raise randname.error.DirectoryDoesNotExistError(last_names_dir)
 
             # check if content fo info.json match the content of first_names and last_names directories
-            sex_in_first_names_dir = set(
-                [path.name.split("_")[1] for path in first_names_dir.iterdir()]
-            )
-            sex_in_last_names_dir = set(
-                [path.name.split("_")[1] for path in last_names_dir.iterdir()]
-            )
+            sex_in_first_names_dir = {
+                Database._dataset_sex(path) for path in first_names_dir.iterdir()
+            }
+            sex_in_last_names_dir = {
+                Database._dataset_sex(path) for path in last_names_dir.iterdir()
+            }
 
             diff = first_names_sex.difference(sex_in_first_names_dir)
             if diff:
@@ -146,34 +451,26 @@ class Database:
                     f"Info file: {path_to_info_file}, defines: {last_names_sex}, but there is {sex_in_last_names_dir} in firs_names directory"
                 )
 
-            # TODO: refactor into smaller functions
-            # check first_names
-            glob_pattern = f"[1-9]*_[{''.join(first_names_sex)}]"
-            for f in first_names_dir.iterdir():
-                match = f.match(glob_pattern)
-                if not match:
-                    logger.error(f"Invalid name pattern: {f}")
-                    invalid_name_pattern.append(f)
-                try:
-                    Database._validate_json_schema(Database.schema_name_json, f)
-                except jsonschema.ValidationError:
-                    logger.error(f"Invalid content pattern: {f}")
-                    invalid_json_files.append(f)
-
-            # check last_names
-            glob_pattern = f"[1-9]*_[{''.join(last_names_sex)}]"
-            for f in last_names_dir.iterdir():
-                if not f.match(glob_pattern):
-                    logger.error(f"Invalid name pattern: {f}")
-                    invalid_name_pattern.append(f)
-                try:
-                    Database._validate_json_schema(Database.schema_name_json, f)
-                except jsonschema.ValidationError:
-                    logger.error(f"Invalid content pattern: {f}")
-                    invalid_json_files.append(f)
+            # check first_names and last_names
+            for names_dir, names_sex in (
+                (first_names_dir, first_names_sex),
+                (last_names_dir, last_names_sex),
+            ):
+                files.extend(
+                    Database._validate_names_dir(
+                        names_dir, names_sex, invalid_name_pattern
+                    )
+                )
+
+        invalid_files = Database._validate_files(path, files, mode, workers, manifest)
 
-        if invalid_json_files:
-            raise jsonschema.ValidationError(str(invalid_json_files))
+        if invalid_files:
+            if structural or not JSONSCHEMA_AVAILABLE:
+                raise randname.error.InvalidDatasetFormatError(str(invalid_files))
+
+            import jsonschema
+
+            raise jsonschema.ValidationError(str(invalid_files))
 
         if invalid_name_pattern:
             raise randname.error.FileNameDoesNotMatchPatternError(invalid_name_pattern)
@@ -181,23 +478,886 @@ class Database:
         return True
 
     @staticmethod
-    def _validate_json_schema(schema, path: Path) -> None:
-        """Validate JSON schema for database files
+    def _validate_pack_sexes(path_to_pack: Path, info: dict[str, Any]) -> None:
+        """Check if pack has datasets of every sex defined in info.json."""
+        try:
+            pack_keys = CountryPack.open(path_to_pack).keys()
+        except randname.error.InvalidDatasetFormatError as error:
+            # Reported as invalid file, when content is validated
+            logger.error("%s: %s", path_to_pack, error)
+            return
+
+        for name_type in NAME_TYPES:
+            sexes = {
+                sex for key_name_type, _, sex in pack_keys if key_name_type == name_type
+            }
+            if set(info[name_type]).difference(sexes):
+                raise randname.error.GenderMismatchError(
+                    f"Info file defines {info[name_type]} {name_type}, "
+                    f"but there is {sorted(sexes)} in {path_to_pack}"
+                )
+
+    @staticmethod
+    def _dataset_sex(path: Path) -> str:
+        return path.name.split("_")[1].removesuffix(BINARY_SUFFIX)
+
+    @staticmethod
+    def _validate_names_dir(
+        names_dir: Path,
+        names_sex: set[str],
+        invalid_name_pattern: list[Path],
+    ) -> list[tuple[Path, str]]:
+        """Validate names of files in first_names or last_names directory,
+        collecting files with invalid names in the given list.
+
+        Args:
+            names_dir: Path to directory with names files
+            names_sex: Sexes defined in info.json for this directory
+            invalid_name_pattern: Files with invalid names are appended here
+
+        Returns:
+            Files to validate with kind of their content, "names" or "binary"
+        """
+        files = []
+        glob_pattern = f"[1-9]*_[{''.join(names_sex)}]"
+        for f in sorted(names_dir.iterdir()):
+            if f.suffix == BINARY_SUFFIX:
+                if not f.match(glob_pattern + BINARY_SUFFIX):
+                    logger.error("Invalid name pattern: %s", f)
+                    invalid_name_pattern.append(f)
+                files.append((f, "binary"))
+                continue
+
+            if not f.match(glob_pattern):
+                logger.error("Invalid name pattern: %s", f)
+                invalid_name_pattern.append(f)
+            files.append((f, "names"))
+
+        return files
+
+    @staticmethod
+    def _validate_files(
+        path: Path,
+        files: list[tuple[Path, str]],
+        mode: str,
+        workers: int | None,
+        manifest: Path | None,
+    ) -> list[Path]:
+        """Validate content of files, skipping files unchanged since the last
+        validation recorded in manifest.
+
+        Args:
+            path: Path to database, manifest stores paths relative to it
+            files: Files to validate with kind of their content
+            mode: Validation mode, one of VALIDATION_MODES
+            workers: Number of processes, None for number of CPUs
+            manifest: Path to validation manifest or None
+
+        Returns:
+            Invalid files
+        """
+        previous = Database._read_manifest(manifest) if manifest else {}
+        entries: dict[str, dict[str, Any]] = {}
+        to_check: list[tuple[Path, str]] = []
+
+        for file_path, kind in files:
+            key = file_path.relative_to(path).as_posix()
+            entry = previous.get(key)
+            stat = file_path.stat()
+
+            # Entry from stricter validation is valid for less strict one
+            if entry is None or VALIDATION_MODES.index(
+                entry["mode"]
+            ) < VALIDATION_MODES.index(mode):
+                to_check.append((file_path, kind))
+            elif (entry["size"], entry["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                entries[key] = entry
+            elif (
+                entry["size"] == stat.st_size
+                and Database._file_digest(file_path.read_bytes()) == entry["sha256"]
+            ):
+                entries[key] = {**entry, "mtime_ns": stat.st_mtime_ns}
+            else:
+                to_check.append((file_path, kind))
+
+        logger.debug("Validating %s of %s files", len(to_check), len(files))
+
+        if workers == 1 or len(to_check) <= 1:
+            results = list(
+                map(Database._validate_file, to_check, [mode] * len(to_check))
+            )
+        else:
+            # Imported here, multiprocessing is slow to import
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        Database._validate_file,
+                        to_check,
+                        [mode] * len(to_check),
+                        chunksize=max(
+                            1, len(to_check) // (4 * (workers or os.cpu_count() or 1))
+                        ),
+                    )
+                )
+
+        invalid_files = []
+        for (file_path, kind), (valid, digest, stat_result) in zip(to_check, results):
+            if not valid:
+                logger.error("Invalid %s file: %s", kind, file_path)
+                invalid_files.append(file_path)
+                continue
+
+            entries[file_path.relative_to(path).as_posix()] = {
+                "size": stat_result[0],
+                "mtime_ns": stat_result[1],
+                "sha256": digest,
+                "mode": mode,
+            }
+
+        if manifest:
+            Database._write_manifest(manifest, entries)
+
+        return invalid_files
+
+    @staticmethod
+    def _validate_file(
+        file: tuple[Path, str], mode: str
+    ) -> tuple[bool, str, tuple[int, int]]:
+        """Validate content of a single file.
+
+        Args:
+            file: Path to file and kind of its content, "info", "names",
+                "binary" or "pack"
+            mode: Validation mode, one of VALIDATION_MODES
+
+        Returns:
+            Validity, SHA-256 hash, size and modification time of the file
+        """
+        path, kind = file
+        stat = path.stat()
+        content = path.read_bytes()
+        result = (Database._file_digest(content), (stat.st_size, stat.st_mtime_ns))
+
+        try:
+            if kind == "binary":
+                Database._validate_binary(BinaryDataset(content))
+                return True, *result
+
+            if kind == "pack":
+                pack = CountryPack(content)
+                for key in pack:
+                    Database._validate_binary(pack.dataset(*key))
+                return True, *result
+
+            data = json.loads(content)
+        except (ValueError, randname.error.InvalidDatasetFormatError) as error:
+            logger.error("%s: %s", path, error)
+            return False, *result
+
+        if kind == "info":
+            if mode == "structural" or not JSONSCHEMA_AVAILABLE:
+                return Database._is_valid(validate_info, data, path), *result
+            return Database.draft_validator_info.is_valid(data), *result
+
+        valid = Database._is_valid(validate_names, data, path)
+        if valid and mode == "strict":
+            valid = Database.draft_validator_name.is_valid(data)
+
+        return valid, *result
+
+    @staticmethod
+    def _is_valid(validator: Callable[[Any], None], data: Any, path: Path) -> bool:
+        try:
+            validator(data)
+        except randname.error.InvalidDatasetFormatError as error:
+            logger.error("%s: %s", path, error)
+            return False
+
+        return True
+
+    @staticmethod
+    def _validate_binary(dataset: "BinaryDataset") -> None:
+        dataset.names.validate()
+        Database._validate_totals(dataset.totals)
+
+    @staticmethod
+    def _validate_totals(totals: Sequence[int]) -> None:
+        previous = 0
+        for index, total in enumerate(totals):
+            if total < previous:
+                raise randname.error.InvalidDatasetFormatError(
+                    f"Totals decrease at index {index}"
+                )
+            previous = total
+
+    @staticmethod
+    def _file_digest(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def _read_manifest(manifest: Path) -> dict[str, dict[str, Any]]:
+        try:
+            with manifest.open("r", encoding="utf-8") as manifest_file:
+                content = json.load(manifest_file)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning("Invalid validation manifest %s, ignoring it", manifest)
+            return {}
+
+        if not isinstance(content, dict) or content.get("version") != MANIFEST_VERSION:
+            return {}
+
+        return content["files"]
+
+    @staticmethod
+    def _write_manifest(manifest: Path, entries: dict[str, dict[str, Any]]) -> None:
+        temporary = manifest.with_name(manifest.name + ".tmp")
+        with temporary.open("w", encoding="utf-8") as manifest_file:
+            json.dump(
+                {"version": MANIFEST_VERSION, "files": dict(sorted(entries.items()))},
+                manifest_file,
+                indent=1,
+            )
+        os.replace(temporary, manifest)
+
+
+def validate_names(data: Any) -> None:
+    """Check content of names file.
+
+    Checks everything `Database.schema_name_json` does: Names is a non-empty
+    list of strings and Totals is a list of numbers. Also checks what JSON
+    schema can't: both lists have the same length and Totals, as cumulative
+    weights, are not negative and not decreasing. Everything is checked in
+    a single pass over the lists.
+
+    Args:
+        data: Decoded content of names file
+
+    Raises:
+        randname.error.InvalidDatasetFormatError: If content is invalid
+    """
+    if not isinstance(data, dict) or data.keys() != {"Names", "Totals"}:
+        raise randname.error.InvalidDatasetFormatError(
+            "Names file must contain only Names and Totals"
+        )
+
+    names = data["Names"]
+    totals = data["Totals"]
+
+    if not isinstance(names, list) or not isinstance(totals, list):
+        raise randname.error.InvalidDatasetFormatError("Names and Totals must be lists")
+    if not names:
+        raise randname.error.InvalidDatasetFormatError("Names must not be empty")
+    if len(names) != len(totals):
+        raise randname.error.InvalidDatasetFormatError(
+            f"Names and Totals lengths differ: {len(names)} != {len(totals)}"
+        )
+
+    previous: float = 0
+    for index, (name, total) in enumerate(zip(names, totals)):
+        # Exact type checks, json module creates only these types and bool is
+        # not a number in JSON
+        if type(name) is not str:
+            raise randname.error.InvalidDatasetFormatError(
+                f"Name at index {index} is not a string"
+            )
+        if type(total) is not int and type(total) is not float:
+            raise randname.error.InvalidDatasetFormatError(
+                f"Total at index {index} is not a number"
+            )
+        if total < previous:
+            raise randname.error.InvalidDatasetFormatError(
+                f"Totals decrease at index {index}"
+            )
+        previous = total
+
+
+def validate_info(data: Any) -> None:
+    """Check content of info.json file, the same way as
+    `Database.schema_info_json`, without jsonschema.
+
+    Args:
+        data: Decoded content of info.json file
+
+    Raises:
+        randname.error.InvalidDatasetFormatError: If content is invalid
+    """
+    if not isinstance(data, dict) or data.keys() != {"country", *NAME_TYPES}:
+        raise randname.error.InvalidDatasetFormatError(
+            f"Info file must contain only country and {' and '.join(NAME_TYPES)}"
+        )
+
+    if not isinstance(data["country"], str):
+        raise randname.error.InvalidDatasetFormatError("Country must be a string")
+
+    for name_type in NAME_TYPES:
+        sexes = data[name_type]
+        if (
+            not isinstance(sexes, list)
+            or not sexes
+            or not all(isinstance(sex, str) for sex in sexes)
+        ):
+            raise randname.error.InvalidDatasetFormatError(
+                f"{name_type} must be a non-empty list of strings"
+            )
+
+
+def pack_dataset(names: Sequence[str], totals: Sequence[int]) -> bytes:
+    """Serialize dataset to binary format.
+
+    Args:
+        names: List of names
+        totals: List of cumulative weights, integers only
+
+    Returns:
+        Content of binary dataset file
+
+    Raises:
+        ValueError: If names and totals have different length
+        TypeError: If totals are not integers
+    """
+    if len(names) != len(totals):
+        raise ValueError(
+            f"Names and Totals have different length: {len(names)} != {len(totals)}"
+        )
+
+    try:
+        weights = array("q", totals)
+    except TypeError as error:
+        raise TypeError(
+            f"Binary format stores integer totals only, got: {error}"
+        ) from error
+
+    encoded = [name.encode("utf-8") for name in names]
+    offsets = array("q", [0])
+    for name in encoded:
+        offsets.append(offsets[-1] + len(name))
+
+    if sys.byteorder != "little":
+        offsets.byteswap()
+        weights.byteswap()
+
+    header = BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(names), offsets[-1])
+    return b"".join([header, offsets.tobytes(), weights.tobytes(), *encoded])
+
+
+class NameSequence(Sequence[str]):
+    """Read only sequence of names of a dataset, in compact form.
+
+    Names are looked up on access. Use `take` to get many names at once.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.take(range(len(self))))
+
+    @abc.abstractmethod
+    def take(self, indexes: Sequence[int]) -> list[str]:
+        """Return names at indexes, which must be in range.
+
+        Names drawn many times in a large batch are created once and shared.
 
         Args:
-            schema: JSON schema to validate against
-            path_to_json: Path to JSON file to validate
+            indexes: Non negative indexes of names
+
+        Returns:
+            List of names
+        """
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("name index out of range")
+
+        return self.take((index,))[0]
+
+
+class _OffsetNames(NameSequence):
+    """Names stored one after another, with offsets of every name."""
+
+    __slots__ = ("_offsets",)
+
+    def __init__(self, offsets: Sequence[int]):
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+
+class _PackedNames(_OffsetNames):
+    """Names decoded on access from the UTF-8 encoded blob."""
+
+    __slots__ = ("_blob",)
+
+    def __init__(self, offsets: Sequence[int], blob: memoryview):
+        super().__init__(offsets)
+        self._blob = blob
+
+    def take(self, indexes: Sequence[int]) -> list[str]:
+        offsets, blob = self._offsets, self._blob
+        if len(indexes) < _TAKE_SHARED_MIN:
+            return [str(blob[offsets[i] : offsets[i + 1]], "utf-8") for i in indexes]
+
+        names: dict[int, str] = {}
+        get, setdefault = names.get, names.setdefault
+        return [
+            get(i) or setdefault(i, str(blob[offsets[i] : offsets[i + 1]], "utf-8"))
+            for i in indexes
+        ]
+
+    def validate(self) -> None:
+        """Check that offsets split the blob into valid UTF-8 names.
+
+        Offsets must start at 0, not decrease, end at the end of the blob
+        and point to starts of characters. Names are not checked on access,
+        for performance.
 
         Raises:
-            jsonschema.ValidationError: If JSON doesn't match schema
+            randname.error.InvalidDatasetFormatError: If offsets or names
+                are invalid
         """
-        with path.open("r", encoding="utf-8") as f:
-            json_content = json.load(f)
+        offsets, blob = self._offsets, self._blob
+        size = len(blob)
+
+        if offsets[0] != 0:
+            raise randname.error.InvalidDatasetFormatError(
+                f"Offsets start at {offsets[0]}, not at 0"
+            )
+        if offsets[-1] != size:
+            raise randname.error.InvalidDatasetFormatError(
+                f"Offsets end at {offsets[-1]}, not at blob size {size}"
+            )
+
+        previous = 0
+        for index, offset in enumerate(offsets):
+            if offset < previous:
+                raise randname.error.InvalidDatasetFormatError(
+                    f"Offsets decrease at index {index}"
+                )
+            # UTF-8 continuation bytes are 0b10xxxxxx
+            if offset < size and blob[offset] & 0xC0 == 0x80:
+                raise randname.error.InvalidDatasetFormatError(
+                    f"Offset at index {index} splits a character"
+                )
+            previous = offset
+
+        try:
+            str(blob, "utf-8")
+        except UnicodeDecodeError as error:
+            raise randname.error.InvalidDatasetFormatError(
+                f"Names are not valid UTF-8: {error}"
+            ) from error
+
+
+class _JoinedNames(_OffsetNames):
+    """Names sliced on access from a string of all names joined."""
+
+    __slots__ = ("_text",)
+
+    def __init__(self, offsets: Sequence[int], text: str):
+        super().__init__(offsets)
+        self._text = text
+
+    def take(self, indexes: Sequence[int]) -> list[str]:
+        offsets, text = self._offsets, self._text
+        if len(indexes) < _TAKE_SHARED_MIN:
+            return [text[offsets[i] : offsets[i + 1]] for i in indexes]
+
+        names: dict[int, str] = {}
+        get, setdefault = names.get, names.setdefault
+        return [
+            get(i) or setdefault(i, text[offsets[i] : offsets[i + 1]]) for i in indexes
+        ]
+
 
-        if schema is Database.schema_name_json:
-            Database.draft_validator_name.validate(json_content)
+class _TableNames(NameSequence):
+    """Names referred to by IDs in a name table.
+
+    Attributes:
+        table: Table the names are stored in
+    """
+
+    __slots__ = ("_ids", "_names", "table")
+
+    def __init__(self, ids: Sequence[int], table: "NameTable"):
+        self._ids = ids
+        self._names = table.names
+        self.table = table
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def take(self, indexes: Sequence[int]) -> list[str]:
+        ids, names = self._ids, self._names
+        return [names[ids[i]] for i in indexes]
+
+
+class NameTable:
+    """Names shared by datasets, every name stored once, with integer ID.
+
+    Datasets of different years of a country have mostly the same names.
+    Datasets created with a common table store only IDs of their names, so
+    memory used by names of many datasets is proportional to the number of
+    unique names, not to the number of datasets. Names are never removed
+    from the table.
+
+    Names can be interned in many threads at once, looking them up by ID
+    does not take a lock.
+
+    Attributes:
+        names: Names, at index equal to their ID
+        nbytes: Memory used by the table
+    """
+
+    __slots__ = ("_ids", "_lock", "_names_nbytes", "names")
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._names_nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.names) + sys.getsizeof(self._ids) + self._names_nbytes
+
+    def intern(self, names: Iterable[str]) -> "array[int]":
+        """Return IDs of names, adding names not in the table yet.
+
+        Args:
+            names: Names
+
+        Returns:
+            Array of IDs, in order of names
+        """
+        table, ids = self.names, self._ids
+        get = ids.get
+        result = array("i")
+        append = result.append
 
-        if schema is Database.schema_info_json:
-            Database.draft_validator_info.validate(json_content)
+        with self._lock:
+            for name in names:
+                name_id = get(name)
+                if name_id is None:
+                    name_id = ids[name] = len(table)
+                    table.append(name)
+                    self._names_nbytes += sys.getsizeof(name)
+                append(name_id)
+
+        return result
+
+
+class Dataset:
+    """Names and cumulative weights in compact form.
+
+    Names are joined in a single string, with offsets of every name, and
+    sliced from it only when drawn. Totals are stored in an array of 64 bit
+    integers, or of floats if any total is not an integer. There are no per
+    name Python objects, so a cached dataset uses several times less memory
+    than lists returned by `json.load`.
+
+    With a name table, names are stored in the table, shared with other
+    datasets, and the dataset stores only their IDs. `nbytes` does not
+    include memory used by the table.
+
+    Args:
+        names: Names
+        totals: Cumulative weights
+        table: Table to store names in, defaults to None
+
+    Attributes:
+        names: Sequence of names
+        totals: Sequence of cumulative weights
+        nbytes: Memory used by names and totals
+
+    Raises:
+        ValueError: If names and totals have different length
+    """
+
+    __slots__ = ("names", "nbytes", "totals")
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        totals: Sequence[int],
+        table: NameTable | None = None,
+    ):
+        if len(names) != len(totals):
+            raise ValueError(
+                f"Names and Totals have different length: {len(names)} != {len(totals)}"
+            )
+
+        weights: Any
+        try:
+            weights = array("q", totals)
+        except TypeError:
+            weights = array("d", totals)
+
+        if table is None:
+            text = "".join(names)
+            offsets = array("q", accumulate(map(len, names), initial=0))
+            self.names: NameSequence = _JoinedNames(offsets, text)
+            names_nbytes = sys.getsizeof(text) + sys.getsizeof(offsets)
+        else:
+            ids = table.intern(names)
+            self.names = _TableNames(ids, table)
+            names_nbytes = sys.getsizeof(ids)
+
+        self.totals: Sequence[int] = weights
+        self.nbytes: int = names_nbytes + sys.getsizeof(weights)
+
+
+class BinaryDataset:
+    """Names file in binary format.
+
+    Names and cumulative weights are views on the underlying buffer, so
+    opening a dataset does not create any per name Python objects. Names are
+    decoded only when drawn.
+
+    Args:
+        buffer: Content of binary dataset file, e.g. memory mapped file.
+
+    Attributes:
+        names: Sequence of names
+        totals: Sequence of cumulative weights
+        nbytes: Size of the underlying buffer
+
+    Raises:
+        randname.error.InvalidDatasetFormatError: If buffer does not contain
+            a valid binary dataset.
+    """
+
+    __slots__ = ("_buffer", "names", "nbytes", "totals")
+
+    def __init__(self, buffer: Buffer):
+        view = memoryview(buffer).cast("B")
+
+        if len(view) < BINARY_HEADER.size:
+            raise randname.error.InvalidDatasetFormatError("File is too short")
+
+        magic, version, count, blob_size = BINARY_HEADER.unpack_from(view)
+
+        if magic != BINARY_MAGIC:
+            raise randname.error.InvalidDatasetFormatError(f"Invalid magic: {magic!r}")
+        if version != BINARY_VERSION:
+            raise randname.error.InvalidDatasetFormatError(
+                f"Unsupported version: {version}"
+            )
+
+        offsets_start = BINARY_HEADER.size
+        totals_start = offsets_start + (count + 1) * 8
+        blob_start = totals_start + count * 8
+
+        if count < 1 or len(view) != blob_start + blob_size:
+            raise randname.error.InvalidDatasetFormatError("Invalid size")
+
+        offsets: Sequence[int]
+        totals: Sequence[int]
+        if sys.byteorder == "little":
+            offsets = view[offsets_start:totals_start].cast("q")
+            totals = view[totals_start:blob_start].cast("q")
+        else:
+            offsets = array("q", view[offsets_start:totals_start])
+            totals = array("q", view[totals_start:blob_start])
+            offsets.byteswap()
+            totals.byteswap()
+
+        self._buffer = buffer
+        self.names: _PackedNames = _PackedNames(offsets, view[blob_start:])
+        self.totals: Sequence[int] = totals
+        self.nbytes: int = len(view)
+
+    @classmethod
+    def open(cls, path: Path) -> "BinaryDataset":
+        """Memory map binary dataset file.
+
+        Args:
+            path: Path to binary dataset file
+
+        Returns:
+            Binary dataset
+        """
+        with path.open("rb") as binary_file:
+            try:
+                buffer = mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as error:
+                raise randname.error.InvalidDatasetFormatError(
+                    f"{path}: {error}"
+                ) from error
+
+        return cls(buffer)
+
+
+def pack_country(datasets: Mapping[PackKey, Buffer]) -> bytes:
+    """Pack binary names files of a country in a single file.
+
+    Args:
+        datasets: Content of binary names file, e.g. from `pack_dataset`,
+            for every name type, year and sex
+
+    Returns:
+        Content of pack file
+
+    Raises:
+        ValueError: If name type is not in NAME_TYPES, or sex is not a single
+            ASCII character
+        randname.error.InvalidDatasetFormatError: If dataset is not a valid
+            binary names file
+    """
+    entries = []
+    parts: list[Buffer] = []
+    offset = PACK_HEADER.size + PACK_ENTRY.size * len(datasets)
+
+    for (name_type, year, sex), content in sorted(datasets.items()):
+        if name_type not in NAME_TYPES:
+            raise ValueError(f"{name_type} not in {NAME_TYPES}")
+        if len(sex) != 1 or not sex.isascii():
+            raise ValueError(f"Sex must be a single ASCII character: {sex!r}")
+
+        # Check content, before it's packed
+        size = BinaryDataset(content).nbytes
+        padding = -offset % 8
+        parts.append(bytes(padding))
+        parts.append(content)
+        offset += padding
+        entries.append(
+            PACK_ENTRY.pack(
+                NAME_TYPES.index(name_type), sex.encode("ascii"), year, offset, size
+            )
+        )
+        offset += size
+
+    header = PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(entries))
+    return b"".join([header, *entries, *parts])
+
+
+class CountryPack:
+    """Names files of a country packed in a single file.
+
+    Entry table is read once. Datasets are views on the underlying buffer,
+    so opening one does not read nor copy it.
+
+    Args:
+        buffer: Content of pack file, e.g. memory mapped file.
+
+    Attributes:
+        nbytes: Size of the underlying buffer
+
+    Raises:
+        randname.error.InvalidDatasetFormatError: If buffer does not contain
+            a valid pack.
+    """
+
+    __slots__ = ("_buffer", "_entries", "_view", "nbytes")
+
+    def __init__(self, buffer: Buffer):
+        view = memoryview(buffer).cast("B")
+
+        if len(view) < PACK_HEADER.size:
+            raise randname.error.InvalidDatasetFormatError("File is too short")
+
+        magic, version, count = PACK_HEADER.unpack_from(view)
+
+        if magic != PACK_MAGIC:
+            raise randname.error.InvalidDatasetFormatError(f"Invalid magic: {magic!r}")
+        if version != PACK_VERSION:
+            raise randname.error.InvalidDatasetFormatError(
+                f"Unsupported version: {version}"
+            )
+        if count < 0 or len(view) < PACK_HEADER.size + count * PACK_ENTRY.size:
+            raise randname.error.InvalidDatasetFormatError("Invalid size")
+
+        entries: dict[PackKey, tuple[int, int]] = {}
+        for name_type_index, sex, year, offset, size in PACK_ENTRY.iter_unpack(
+            view[PACK_HEADER.size : PACK_HEADER.size + count * PACK_ENTRY.size]
+        ):
+            if name_type_index >= len(NAME_TYPES):
+                raise randname.error.InvalidDatasetFormatError(
+                    f"Invalid name type: {name_type_index}"
+                )
+            if offset < 0 or size < 0 or offset + size > len(view):
+                raise randname.error.InvalidDatasetFormatError(
+                    f"Dataset out of file: {offset} + {size}"
+                )
+            key = (NAME_TYPES[name_type_index], year, sex.decode("ascii"))
+            entries[key] = (offset, size)
+
+        self._buffer = buffer
+        self._view = view
+        self._entries = entries
+        self.nbytes: int = len(view)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: PackKey) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[PackKey]:
+        return iter(self.keys())
+
+    def keys(self) -> list[PackKey]:
+        """Return name type, year and sex of every dataset.
+
+        Returns:
+            Sorted keys of datasets
+        """
+        return sorted(self._entries)
+
+    def dataset(self, name_type: str, year: int, sex: str) -> BinaryDataset:
+        """Return dataset.
+
+        Args:
+            name_type: "first_names" or "last_names"
+            year: Year
+            sex: Sex
+
+        Returns:
+            Binary dataset, view on the pack buffer
+
+        Raises:
+            KeyError: If there is no such dataset in the pack
+            randname.error.InvalidDatasetFormatError: If dataset is invalid
+        """
+        offset, size = self._entries[(name_type, year, sex)]
+        return BinaryDataset(self._view[offset : offset + size])
+
+    @classmethod
+    def open(cls, path: Path) -> "CountryPack":
+        """Memory map pack file.
+
+        Args:
+            path: Path to pack file
+
+        Returns:
+            Country pack
+        """
+        with path.open("rb") as pack_file:
+            try:
+                buffer = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as error:
+                raise randname.error.InvalidDatasetFormatError(
+                    f"{path}: {error}"
+                ) from error
 
-        jsonschema.validate(json_content, schema)
+        return cls(buffer)
@@ -8,6 +8,8 @@ Classes:
     MissingInfoFileError: Exception for missing info.json file.
     FileNameDoesNotMatchPatternError: Exception for invalid file name pattern.
     GenderMismatchError: Exception for gender mismatch in database directories.
+    InvalidDatasetFormatError: Exception for corrupted binary dataset file.
+    NotEnoughNamesError: Exception for more unique names than available.
 """
 
 from typing import Any
@@ -69,3 +71,28 @@ class FileNameDoesNotMatchPatternError(RandnameError):
 class GenderMismatchError(RandnameError):
     """Exception raised when supported genders defined in info.json does not match
     to what is in corresponding folders."""
+
+
+class InvalidDatasetFormatError(RandnameError):
+    """Exception raised when binary dataset file is corrupted or its format
+    version is not supported."""
+
+
+class NotEnoughNamesError(RandnameError):
+    """Exception raised when more unique names are requested than there are
+    names available for given arguments.
+
+    Attributes:
+        requested: Number of requested names
+        available: Number of available names, or its upper bound
+        message: Explanation of the error
+    """
+
+    def __init__(self, requested: int, available: int):
+        self.requested = requested
+        self.available = available
+        self.message = (
+            f"{self.requested} unique names requested, "
+            f"at most {self.available} available"
+        )
+        super().__init__(self.message)
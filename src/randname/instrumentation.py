@@ -0,0 +1,175 @@
+"""Instrumentation module
+
+Per stage timers and counters of a Randname instance, opt-in.
+
+Stages are methods of the instance (and of its database), which are
+replaced with timed wrappers, when instrumentation is enabled, and restored
+when it's disabled. Disabled instrumentation leaves no trace on the hot
+path, methods of the class are called directly.
+
+Times of stages include stages called within them, e.g. "load_dataset"
+includes "read_file" and "parse_json".
+
+Examples:
+    >>> rn = Randname()
+    >>> rn.enable_instrumentation()
+    >>> rn.randfull()
+    'John Doe'
+    >>> rn.instrumentation_info()["stages"]["sample"]
+    {'calls': 2, 'seconds': 1.2e-05, 'items': 2, 'bytes': 0}
+
+Classes:
+    Measurement: Single call of a stage, passed to callbacks.
+    Instrumentation: Timers and counters of stages.
+
+Functions:
+    instrument: Replace methods of an object with timed wrappers.
+    uninstrument: Restore methods replaced by `instrument`.
+"""
+
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
+
+# Function returning number of items and bytes processed by a stage call,
+# from its positional arguments and result
+type Amount = Callable[[tuple[Any, ...], Any], tuple[int, int]]
+
+# Stage name, method name and amount function, or None for one item
+type Stage = tuple[str, str, Amount | None]
+
+
+class Measurement(NamedTuple):
+    """Single call of a stage.
+
+    Attributes:
+        stage: Name of the stage, e.g. "load_dataset".
+        seconds: Duration of the call.
+        items: Number of items processed, e.g. names drawn.
+        nbytes: Number of bytes processed, e.g. read from file.
+    """
+
+    stage: str
+    seconds: float
+    items: int
+    nbytes: int
+
+
+class Instrumentation:
+    def __init__(self, callback: Callable[[Measurement], None] | None = None):
+        """Timers and counters of stages.
+
+        Thread safe, calls of stages in many threads are added up.
+
+        Args:
+            callback: Function called with every measurement, in the thread
+                that called the stage, e.g. to export it to a metrics
+                library, defaults to None
+        """
+        self.callback = callback
+        self._lock = threading.Lock()
+        # Stage -> [calls, seconds, items, bytes]
+        self._totals: dict[str, list[Any]] = {}
+
+    def record(
+        self, stage: str, seconds: float, items: int = 1, nbytes: int = 0
+    ) -> None:
+        """Add call of a stage to its counters and pass it to the callback.
+
+        Args:
+            stage: Name of the stage
+            seconds: Duration of the call
+            items: Number of items processed, defaults to 1
+            nbytes: Number of bytes processed, defaults to 0
+        """
+        with self._lock:
+            totals = self._totals.get(stage)
+            if totals is None:
+                totals = self._totals[stage] = [0, 0.0, 0, 0]
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += items
+            totals[3] += nbytes
+
+        if self.callback is not None:
+            self.callback(Measurement(stage, seconds, items, nbytes))
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return counters of every stage called at least once.
+
+        Returns:
+            Stage -> calls, seconds, items and bytes
+        """
+        with self._lock:
+            return {
+                stage: {
+                    "calls": calls,
+                    "seconds": seconds,
+                    "items": items,
+                    "bytes": nbytes,
+                }
+                for stage, (calls, seconds, items, nbytes) in sorted(
+                    self._totals.items()
+                )
+            }
+
+    def reset(self) -> None:
+        """Reset counters of all stages."""
+        with self._lock:
+            self._totals.clear()
+
+
+def _timed(
+    function: Callable[..., Any],
+    stage: str,
+    amount: Amount | None,
+    instrumentation: Instrumentation,
+) -> Callable[..., Any]:
+    perf_counter = time.perf_counter
+    record = instrumentation.record
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        result = function(*args, **kwargs)
+        seconds = perf_counter() - start
+        if amount is None:
+            record(stage, seconds)
+        else:
+            record(stage, seconds, *amount(args, result))
+        return result
+
+    return wrapper
+
+
+def instrument(
+    target: object, stages: Iterable[Stage], instrumentation: Instrumentation
+) -> None:
+    """Replace methods of an object with wrappers recording their calls.
+
+    Wrappers are set as attributes of the object, so other instances of its
+    class are not affected.
+
+    Args:
+        target: Object to instrument
+        stages: Stage name, method name and amount function of every stage
+        instrumentation: Counters to record calls in
+    """
+    for stage, method, amount in stages:
+        # Wrap method of the class, in case the object is already instrumented
+        vars(target).pop(method, None)
+        function = getattr(target, method)
+        setattr(target, method, _timed(function, stage, amount, instrumentation))
+
+
+def uninstrument(target: object, stages: Iterable[Stage]) -> None:
+    """Restore methods replaced by `instrument`.
+
+    Args:
+        target: Instrumented object
+        stages: Stages passed to `instrument`
+    """
+    for _, method, _ in stages:
+        vars(target).pop(method, None)
@@ -0,0 +1,333 @@
+"""Parallel module
+
+Generate large number of names in a pool of processes.
+
+Request is split into shards of `chunk_size` names. Every shard is drawn with
+its own generator, seeded with a value derived from the master seed and the
+shard number, so for a fixed seed the result does not depend on the number
+of workers, nor on which worker draws which shard.
+
+Datasets are loaded once, in the parent process, and shared with workers
+through `multiprocessing.shared_memory`, in the binary names file format.
+Workers do not read names files.
+
+Examples:
+    >>> import randname.parallel
+    >>> names = randname.parallel.generate(10_000_000, country="US", seed=42)
+
+Functions:
+    generate: Generate list of names in a pool of processes.
+    generate_chunks: Generate names in a pool of processes, shard by shard.
+"""
+
+import random
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import randname.database
+from randname.core import (
+    DatasetKey,
+    KindConvention,
+    Randname,
+    SamplerConvention,
+    YearConvention,
+)
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+type SharedSegments = dict[DatasetKey, tuple[str, int]]
+
+# Worker process state, set by _init_worker
+_worker_randname: Randname | None = None
+_worker_segments: list[SharedMemory] = []
+
+
+def generate(
+    n: int,
+    kind: KindConvention = "full",
+    year: YearConvention | None = None,
+    sex: str | None = None,
+    country: str | None = None,
+    weights: bool = True,
+    *,
+    seed: int | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    path_to_database: Path | None = None,
+    sampler: SamplerConvention = "bisect",
+) -> list[str]:
+    """Generate list of n names in a pool of processes.
+
+    Args:
+        n: Number of names
+        kind: "first", "last" or "full", defaults to "full"
+        year: Year of birth, (start, end) range of years, or mapping of
+            years to population weights, defaults to None
+        sex: Sex's name, defaults to None
+        country: Country of origin, defaults to None
+        weights: Use population distribution if True, else treat all names
+            with same probability, defaults to True
+        seed: Master seed, defaults to None (random seed)
+        workers: Number of processes, defaults to None (number of CPUs)
+        chunk_size: Number of names in one shard, defaults to
+            DEFAULT_CHUNK_SIZE
+        path_to_database: Path to directory with database, defaults to
+            Randname.PATH_TO_DATABASE
+        sampler: Sampling method used by workers, defaults to "bisect"
+
+    Returns:
+        List of names, in order independent from number of workers
+
+    Raises:
+        ValueError: If n is negative, chunk_size or workers lower than 1
+        InvalidSexArgument: If sex is not in proper sex options
+        InvalidCountryName: If country is not in valid countries
+    """
+    return list(
+        chain.from_iterable(
+            generate_chunks(
+                n,
+                kind,
+                year,
+                sex,
+                country,
+                weights,
+                seed=seed,
+                workers=workers,
+                chunk_size=chunk_size,
+                path_to_database=path_to_database,
+                sampler=sampler,
+            )
+        )
+    )
+
+
+def generate_chunks(
+    n: int,
+    kind: KindConvention = "full",
+    year: YearConvention | None = None,
+    sex: str | None = None,
+    country: str | None = None,
+    weights: bool = True,
+    *,
+    seed: int | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    path_to_database: Path | None = None,
+    sampler: SamplerConvention = "bisect",
+) -> Iterator[list[str]]:
+    """Generate n names in a pool of processes, yielding them shard by shard.
+
+    Takes the same arguments as `generate`. Arguments are checked on call,
+    before the iterator is returned. Shards are yielded in order. Shared
+    memory and processes are released when the iterator is exhausted or
+    closed.
+
+    Returns:
+        Iterator of lists of names
+
+    Raises:
+        ValueError: If n is negative, chunk_size or workers lower than 1, or
+            kind is invalid
+        InvalidSexArgument: If sex is not in proper sex options
+        InvalidCountryName: If country is not in valid countries
+    """
+    if n < 0:
+        raise ValueError("n must be greater or equal 0")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than 0")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be greater than 0")
+
+    rn = Randname(path_to_database, sampler=sampler)
+    _check_arguments(rn, kind, year, sex, country, weights)
+
+    return _generate_chunks(
+        rn, n, kind, year, sex, country, weights, seed, workers, chunk_size, sampler
+    )
+
+
+def _check_arguments(
+    rn: Randname,
+    kind: KindConvention,
+    year: YearConvention | None,
+    sex: str | None,
+    country: str | None,
+    weights: bool,
+) -> None:
+    """Raise errors for invalid arguments, before starting workers."""
+    # Checks kind, country, year and sex of full names
+    _many(rn, kind)(0, year, sex, country, weights)
+
+    # Sex of full names falls back to available ones, first and last names
+    # must have it in every country they can be drawn from
+    if sex is not None and kind != "full":
+        index = rn.database.index
+        name_type = f"{kind}_names"
+        for country_name in index if country is None else [country]:
+            if index[country_name][name_type].years:
+                rn._gen_sex(sex, country_name, name_type)
+
+
+def _generate_chunks(
+    rn: Randname,
+    n: int,
+    kind: KindConvention,
+    year: YearConvention | None,
+    sex: str | None,
+    country: str | None,
+    weights: bool,
+    seed: int | None,
+    workers: int | None,
+    chunk_size: int,
+    sampler: SamplerConvention,
+) -> Iterator[list[str]]:
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+
+    shards = [
+        (index, min(chunk_size, n - start))
+        for index, start in enumerate(range(0, n, chunk_size))
+    ]
+    arguments = (kind, year, sex, country, weights)
+
+    if workers == 1 or len(shards) <= 1:
+        for index, size in shards:
+            yield _generate_shard(seed, index, size, arguments, rn)
+        return
+
+    segments: list[SharedMemory] = []
+    try:
+        shared: SharedSegments = {}
+        for key in _needed_keys(rn, kind, year, sex, country):
+            try:
+                names, totals = rn._load_dataset(key)
+            except FileNotFoundError:
+                continue
+
+            try:
+                content = randname.database.pack_dataset(names, totals)
+            except TypeError:
+                # Binary format has integer totals only, workers read datasets
+                # with float totals themselves
+                continue
+
+            segment = SharedMemory(create=True, size=len(content))
+            segments.append(segment)
+            assert segment.buf is not None
+            segment.buf[: len(content)] = content
+            shared[key] = (segment.name, len(content))
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(rn.database.path, sampler, shared),
+        ) as executor:
+            yield from executor.map(
+                _generate_shard,
+                [seed] * len(shards),
+                [index for index, _ in shards],
+                [size for _, size in shards],
+                [arguments] * len(shards),
+            )
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+
+def _many(rn: Randname, kind: KindConvention):
+    generators = {
+        "first": rn.randfirst_many,
+        "last": rn.randlast_many,
+        "full": rn.randfull_many,
+    }
+
+    if kind not in generators:
+        raise ValueError(f"{kind} not in {tuple(generators)}")
+
+    return generators[kind]
+
+
+def _needed_keys(
+    rn: Randname,
+    kind: KindConvention,
+    year: YearConvention | None,
+    sex: str | None,
+    country: str | None,
+) -> list[DatasetKey]:
+    """List datasets that can be drawn for given arguments."""
+    index = rn.database.index
+    countries = sorted(index) if country is None else [country]
+    name_types = {
+        "first": ("first_names",),
+        "last": ("last_names",),
+        "full": randname.database.NAME_TYPES,
+    }[kind]
+
+    keys: list[DatasetKey] = []
+    for country_name in countries:
+        for name_type in name_types:
+            entry = index[country_name][name_type]
+            if not entry.years:
+                continue
+            years = (
+                [rn._gen_year(year, country_name, name_type)] if year else entry.years
+            )
+            sexes = [sex] if sex in entry.sexes else entry.sexes
+            keys.extend(
+                (country_name, name_type, dataset_year, dataset_sex)
+                for dataset_year in years
+                for dataset_sex in sexes
+            )
+
+    return keys
+
+
+def _attach(name: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+
+    # Workers share resource tracker with the parent process, which owns and
+    # unlinks the segments, so registering them again is harmless.
+    return SharedMemory(name)
+
+
+def _init_worker(path: Path, sampler: SamplerConvention, shared: SharedSegments):
+    rn = Randname(path, sampler=sampler)
+
+    for key, (name, size) in shared.items():
+        segment = _attach(name)
+        _worker_segments.append(segment)
+        assert segment.buf is not None
+        # Segment can be bigger than requested, rounded up to the page size
+        dataset = randname.database.BinaryDataset(segment.buf[:size])
+        # Shared datasets don't use the worker memory, so they don't count
+        # toward the cache budget.
+        rn._cache.put(key, (dataset.names, dataset.totals), 0)
+
+    global _worker_randname
+    _worker_randname = rn
+
+
+def _generate_shard(
+    seed: int,
+    index: int,
+    size: int,
+    arguments: tuple[
+        KindConvention, YearConvention | None, str | None, str | None, bool
+    ],
+    rn: Randname | None = None,
+) -> list[str]:
+    """Draw one shard, in worker process or with given Randname instance."""
+    if rn is None:
+        rn = _worker_randname
+    assert rn is not None
+    kind, year, sex, country, weights = arguments
+
+    rn.seed(f"{seed}:{index}")
+    return _many(rn, kind)(size, year, sex, country, weights)
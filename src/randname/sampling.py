@@ -0,0 +1,197 @@
+"""Sampling module
+
+Classes:
+    AliasTable: Walker/Vose alias table for O(1) weighted sampling.
+    NumpyDataset: Dataset stored in NumPy arrays for vectorized sampling.
+
+Functions:
+    numpy_generator: Create NumPy random generator.
+
+Attributes:
+    NUMPY_AVAILABLE: True if optional NumPy dependency is installed.
+"""
+
+import importlib.util
+import random
+import sys
+from array import array
+from collections.abc import Callable, Sequence
+from typing import Any
+
+# NumPy is imported only when numpy sampler is used, it's slow to import
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "numpy sampler requires numpy: pip install rname[numpy]"
+        ) from error
+
+    return numpy
+
+
+def numpy_generator(seed: int | None = None) -> Any:
+    """Create NumPy random generator.
+
+    Args:
+        seed: Seed of the generator, defaults to None
+
+    Returns:
+        numpy.random.Generator
+    """
+    return _import_numpy().random.default_rng(seed)
+
+
+class AliasTable:
+    """Walker/Vose alias table built from cumulative weights.
+
+    Building the table takes O(n), after that every weighted draw takes O(1),
+    regardless of the number of names, instead of a bisect over the
+    cumulative weights.
+
+    Args:
+        cum_weights: Cumulative weights, as stored in names files.
+
+    Attributes:
+        nbytes: Memory used by the table in bytes.
+
+    Raises:
+        ValueError: If weights are empty or their sum is not positive.
+    """
+
+    __slots__ = ("_alias", "_probability", "_size")
+
+    def __init__(self, cum_weights: Sequence[int]):
+        size = len(cum_weights)
+
+        if not size or cum_weights[-1] <= 0:
+            raise ValueError("Total of weights must be greater than 0")
+
+        scale = size / cum_weights[-1]
+        probability = array("d", [0.0]) * size
+        alias = array("q", range(size))
+
+        scaled = array("d", [0.0]) * size
+        previous = 0
+        for index in range(size):
+            scaled[index] = (cum_weights[index] - previous) * scale
+            previous = cum_weights[index]
+
+        small = [index for index in range(size) if scaled[index] < 1.0]
+        large = [index for index in range(size) if scaled[index] >= 1.0]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Leftovers are 1.0 up to floating point error
+        for index in large + small:
+            probability[index] = 1.0
+
+        self._probability = probability
+        self._alias = alias
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        return self._probability.itemsize * len(
+            self._probability
+        ) + self._alias.itemsize * len(self._alias)
+
+    def sample(
+        self, k: int = 1, random: Callable[[], float] = random.random
+    ) -> list[int]:
+        """Draw k indexes with probability proportional to their weights.
+
+        Args:
+            k: Number of indexes to draw, defaults to 1
+            random: Function returning float in [0.0, 1.0), defaults to
+                random.random
+
+        Returns:
+            List of drawn indexes
+        """
+        size = self._size
+        probability = self._probability
+        alias = self._alias
+        result = []
+
+        for _ in range(k):
+            # Integer part of the scaled number selects the column, the
+            # fractional part is the biased coin flip for that column.
+            scaled = random() * size
+            index = int(scaled)
+            if index == size:  # random() * size can round up to size
+                index -= 1
+            coin = scaled - index
+            result.append(index if coin < probability[index] else alias[index])
+
+        return result
+
+
+class NumpyDataset:
+    """Dataset stored in NumPy arrays.
+
+    Cumulative weights are kept in int64 array (zero-copy for binary
+    datasets) and names in object array, so k names are drawn with a single
+    `searchsorted` call instead of a Python level loop.
+
+    Requires optional NumPy dependency: `pip install rname[numpy]`.
+
+    Args:
+        names: Sequence of names
+        totals: Sequence of cumulative weights
+
+    Attributes:
+        nbytes: Memory used by the arrays and names in bytes.
+    """
+
+    __slots__ = ("_names", "_totals", "nbytes")
+
+    def __init__(self, names: Sequence[str], totals: Sequence[int]):
+        numpy = _import_numpy()
+
+        self._names = numpy.array(list(names), dtype=object)
+        self._totals = numpy.asarray(totals, dtype=numpy.int64)
+        self.nbytes = (
+            self._names.nbytes
+            + self._totals.nbytes
+            + sum(sys.getsizeof(name) for name in self._names)
+        )
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def sample(self, k: int, generator: Any, cum_weights: bool = True) -> list[str]:
+        """Draw k names.
+
+        Args:
+            k: Number of names
+            generator: numpy.random.Generator
+            cum_weights: Include weights, if False every name has the same
+                probability, defaults to True
+
+        Returns:
+            List of names
+        """
+        if cum_weights:
+            # Integers in [0, total) keep the search exact, without casting
+            # the weights to float on every call.
+            points = generator.integers(0, self._totals[-1], size=k)
+            indexes = self._totals.searchsorted(points, side="right")
+        else:
+            indexes = generator.integers(0, len(self._names), size=k)
+
+        return self._names[indexes].tolist()
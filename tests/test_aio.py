@@ -0,0 +1,121 @@
+import asyncio
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+import randname.aio
+import randname.core
+import randname.error
+from randname.aio import AsyncRandname
+from randname.core import Randname
+
+_THIS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+DATABASE = Path(_THIS_FOLDER) / "test_data"
+
+
+def test_async_names_match_sync_names():
+    rn = AsyncRandname(Randname(DATABASE, seed=42))
+    names = asyncio.run(rn.randfull_many(10, country="T1"))
+
+    assert names == Randname(DATABASE, seed=42).randfull_many(10, country="T1")
+
+
+@pytest.mark.parametrize("sampler", ["bisect", "alias", "numpy"])
+def test_single_names(sampler):
+    rn = AsyncRandname(Randname(DATABASE, sampler=sampler))
+
+    async def draw():
+        return (
+            await rn.randfirst(country="T1"),
+            await rn.randlast(country="T1"),
+            await rn.randfull(country="T1"),
+        )
+
+    first, last, full = asyncio.run(draw())
+    assert first in Randname(DATABASE).randfirst_many(1000, country="T1", weights=False)
+    assert len(full.split()) == 2
+    assert isinstance(last, str)
+
+
+def test_concurrent_requests_share_one_load(monkeypatch):
+    rn = Randname(DATABASE)
+    calls = []
+    build = rn._build_cache_entries
+
+    def spy(key):
+        calls.append(key)
+        return build(key)
+
+    monkeypatch.setattr(rn, "_build_cache_entries", spy)
+    arn = AsyncRandname(rn)
+
+    async def draw():
+        return await asyncio.gather(
+            *(arn.randfirst(year=2022, sex="F", country="T1") for _ in range(20))
+        )
+
+    assert len(asyncio.run(draw())) == 20
+    assert calls == [("T1", "first_names", 2022, "F")]
+
+
+def test_cached_datasets_are_served_without_executor():
+    rn = Randname(DATABASE)
+    rn.preload()
+    arn = AsyncRandname(rn)
+
+    async def draw():
+        loop = asyncio.get_running_loop()
+
+        def fail(*args):
+            raise AssertionError("executor used")
+
+        loop.run_in_executor = fail  # type: ignore[method-assign]
+        return await arn.randfull_many(100, country="T1")
+
+    assert len(asyncio.run(draw())) == 100
+
+
+@pytest.mark.parametrize("sampler", ["bisect", "alias", "numpy"])
+def test_uncached_datasets_are_not_read_in_event_loop(monkeypatch, sampler):
+    rn = Randname(DATABASE, cache_size=0, sampler=sampler)
+    threads = []
+    read_key = rn._read_key
+
+    def spy(key):
+        threads.append(threading.get_ident())
+        return read_key(key)
+
+    monkeypatch.setattr(rn, "_read_key", spy)
+    arn = AsyncRandname(rn)
+
+    async def draw():
+        names = await arn.randfull_many(10, year=2022, sex="M", country="T1")
+        return names, threading.get_ident()
+
+    names, loop_thread = asyncio.run(draw())
+
+    assert len(names) == 10
+    assert len(threads) == 2
+    assert loop_thread not in threads
+
+
+def test_errors_are_raised():
+    rn = AsyncRandname(Randname(DATABASE))
+
+    with pytest.raises(randname.error.InvalidCountryNameError):
+        asyncio.run(rn.randfull(country="XX"))
+
+
+def test_module_functions(monkeypatch):
+    monkeypatch.setattr(randname.core, "_inst", Randname(DATABASE))
+
+    async def draw():
+        return await asyncio.gather(
+            randname.aio.randfirst(country="T1"),
+            randname.aio.randlast(country="T1"),
+            randname.aio.randfull(country="T1"),
+        )
+
+    assert len(asyncio.run(draw())) == 3
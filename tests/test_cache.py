@@ -0,0 +1,116 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import randname.cache
+from randname.core import Randname
+
+
+@pytest.fixture
+def database_path():
+    _THIS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+    return Path() / _THIS_FOLDER / "test_data"
+
+
+def test_cache_hit_and_miss():
+    cache = randname.cache.DatasetCache(100)
+    assert cache.get("a") is None
+    cache.put("a", "value", 10)
+    assert cache.get("a") == "value"
+
+    info = cache.info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 10
+    assert info.entries == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = randname.cache.DatasetCache(30)
+    cache.put("a", 1, 10)
+    cache.put("b", 2, 10)
+    cache.put("c", 3, 10)
+    cache.get("a")
+    cache.put("d", 4, 10)
+
+    assert "b" not in cache
+    assert "a" in cache
+    assert cache.info().evictions == 1
+    assert cache.info().currsize == 30
+
+
+def test_cache_on_evict_and_discard():
+    evicted = []
+    cache = randname.cache.DatasetCache(20, lambda *entry: evicted.append(entry))
+    cache.put("a", 1, 10)
+    cache.put("b", 2, 10)
+    cache.discard("b")
+    cache.discard("x")
+    cache.put("c", 3, 20)
+
+    assert evicted == [("a", 1)]
+    assert cache.info().evictions == 1
+    assert cache.info().currsize == 20
+
+
+def test_cache_skips_entry_larger_than_budget():
+    cache = randname.cache.DatasetCache(10)
+    cache.put("a", 1, 5)
+    cache.put("b", 2, 11)
+
+    assert "a" in cache
+    assert "b" not in cache
+
+
+def test_cache_disabled():
+    cache = randname.cache.DatasetCache(0)
+    cache.put("a", 1, 1)
+    assert len(cache) == 0
+
+
+def test_cache_invalid_size():
+    with pytest.raises(ValueError):
+        randname.cache.DatasetCache(-1)
+
+
+def test_randname_reuses_loaded_dataset(database_path):
+    rn = Randname(database_path)
+    for _ in range(10):
+        rn.randfirst(sex="F", country="T1")
+
+    info = rn.cache_info()
+    assert info.misses == 1
+    assert info.hits == 9
+    assert info.entries == 1
+
+
+def test_randname_clear_cache_on_database_change(database_path):
+    rn = Randname(database_path)
+    rn.randlast(sex="M", country="T1")
+    assert rn.cache_info().entries == 1
+
+    rn.database = database_path
+    assert rn.cache_info().entries == 0
+
+
+def test_randname_clear_cache_on_database_path_change(tmp_path, database_path):
+    shutil.copytree(database_path / "T1", tmp_path / "T1")
+    (tmp_path / "T1" / "first_names" / "2022_F").write_text(
+        json.dumps({"Names": ["Zzz"], "Totals": [1]})
+    )
+    rn = Randname(database_path)
+    assert rn.randfirst(year=2022, sex="F", country="T1") == "First_T1_F_2"
+
+    rn.database.path = tmp_path
+
+    assert rn.randfirst(year=2022, sex="F", country="T1") == "Zzz"
+    assert [dataset.sex for dataset in rn.resident_datasets()] == ["F"]
+
+
+def test_randname_cache_disabled(database_path):
+    rn = Randname(database_path, cache_size=0)
+    assert rn.randfirst(sex="M", country="T1") == "First_T1_M_2"
+    assert rn.cache_info().entries == 0
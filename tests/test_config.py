@@ -0,0 +1,68 @@
+import logging
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import randname.config
+from randname.config import logger, set_logger
+from randname.core import Randname
+
+
+@pytest.fixture
+def restore_logger():
+    yield
+    if randname.config._handler is not None:
+        logger.removeHandler(randname.config._handler)
+        randname.config._handler = None
+    logger.setLevel(logging.NOTSET)
+
+
+def test_no_handlers_installed_at_import():
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import logging, randname; "
+                "randname.randfull(); "
+                "print([type(h).__name__ for h in logging.getLogger('randname').handlers], "
+                "logging.getLogger().handlers)"
+            ),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert output.stdout.strip() == "['NullHandler'] []"
+    assert output.stderr == ""
+
+
+def test_hot_path_skips_debug_messages_when_disabled():
+    rn = Randname()
+    rn.preload()
+    with patch.object(logger, "debug") as debug:
+        rn.randfull_many(10)
+        rn.randfull()
+    debug.assert_not_called()
+
+
+def test_debug_messages_are_emitted_when_enabled(caplog):
+    with caplog.at_level(logging.DEBUG, logger="randname"):
+        Randname().randfull()
+    assert any(record.msg.startswith("Year") for record in caplog.records)
+
+
+@pytest.mark.usefixtures("restore_logger")
+def test_set_logger_replaces_its_handler():
+    set_logger("info")
+    set_logger("debug")
+
+    stream_handlers = [
+        handler
+        for handler in logger.handlers
+        if isinstance(handler, logging.StreamHandler)
+    ]
+    assert stream_handlers == [randname.config._handler]
+    assert logger.level == logging.DEBUG
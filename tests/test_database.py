@@ -1,10 +1,14 @@
 import os
+import shutil
+import sys
 from pathlib import Path
 
 import jsonschema
 import pytest
 
 import randname
+import randname.cache
+import randname.core
 import randname.database
 import randname.error
 
@@ -62,3 +66,423 @@ def test_validate_invalid_test_data(invalid_info_schema):
     database = randname.database.Database(invalid_info_schema)
     with pytest.raises(jsonschema.ValidationError):
         randname.database.Database.validate(database.path)
+
+
+def test_database_index(database):
+    index = database.index
+    assert set(index) == {"T1", "T2", "T3"}
+    assert index["T1"]["first_names"] == randname.database.NameTypeIndex(
+        (2022,), ("M", "F")
+    )
+    assert index["T3"]["first_names"].sexes == ("M",)
+    # File not matching naming convention is not indexed
+    assert index["T2"]["first_names"].years == (2022,)
+
+
+def test_database_index_is_read_only(database):
+    with pytest.raises(TypeError):
+        database.index["T4"] = {}  # type: ignore[index]
+
+
+def test_database_index_is_built_once(database):
+    assert database.index is database.index
+
+
+def test_database_index_rebuilt_on_path_change(database):
+    index = database.index
+    database.path = randname.core.Randname.PATH_TO_DATABASE
+    assert database.index is not index
+    assert set(database.index) == {"ES", "PL", "US"}
+
+
+def test_database_index_built(database):
+    assert not database.index_built
+    _ = database.index
+    assert database.index_built
+    database.path = randname.core.Randname.PATH_TO_DATABASE
+    assert not database.index_built
+
+
+def test_database_index_missing_info_file(invalid_database_path):
+    database = randname.database.Database(invalid_database_path)
+    with pytest.raises(randname.error.MissingInfoFileError):
+        _ = database.index
+
+
+def test_binary_dataset_round_trip(tmp_path):
+    path = tmp_path / "2022_F.bin"
+    path.write_bytes(randname.database.pack_dataset(["Zoë", "Ann", "Łucja"], [1, 3, 6]))
+
+    dataset = randname.database.BinaryDataset.open(path)
+    assert list(dataset.names) == ["Zoë", "Ann", "Łucja"]
+    assert list(dataset.totals) == [1, 3, 6]
+    assert dataset.names[-1] == "Łucja"
+    assert dataset.nbytes == path.stat().st_size
+
+
+def test_binary_dataset_invalid_content(tmp_path):
+    path = tmp_path / "2022_F.bin"
+    content = randname.database.pack_dataset(["Ann"], [1])
+
+    path.write_bytes(b"XXXX" + content[4:])
+    with pytest.raises(randname.error.InvalidDatasetFormatError):
+        randname.database.BinaryDataset.open(path)
+
+    path.write_bytes(content[:-1])
+    with pytest.raises(randname.error.InvalidDatasetFormatError):
+        randname.database.BinaryDataset.open(path)
+
+    path.write_bytes(b"")
+    with pytest.raises(randname.error.InvalidDatasetFormatError):
+        randname.database.BinaryDataset.open(path)
+
+
+def test_pack_dataset_length_mismatch():
+    with pytest.raises(ValueError):
+        randname.database.pack_dataset(["Ann", "Eve"], [1])
+
+
+def test_pack_dataset_float_totals():
+    dataset = randname.database.Dataset(["Ann", "Eve"], [0.5, 1.5])  # type: ignore[list-item]
+
+    with pytest.raises(TypeError, match="integer totals"):
+        randname.database.pack_dataset(dataset.names, dataset.totals)
+
+
+def test_compact_dataset():
+    dataset = randname.database.Dataset(["Zoë", "Ann", "Łucja"], [1, 3, 6])
+
+    assert list(dataset.names) == ["Zoë", "Ann", "Łucja"]
+    assert dataset.names[-1] == "Łucja"
+    assert dataset.names[1:] == ["Ann", "Łucja"]
+    assert list(dataset.totals) == [1, 3, 6]
+    assert dataset.totals.typecode == "q"  # type: ignore[attr-defined]
+    with pytest.raises(IndexError):
+        dataset.names[3]
+    with pytest.raises(ValueError):
+        randname.database.Dataset(["Ann", "Eve"], [1])
+
+    floats = randname.database.Dataset(["Ann", "Eve"], [0.5, 1.5])  # type: ignore[list-item]
+    assert list(floats.totals) == [0.5, 1.5]
+
+
+def test_compact_dataset_memory():
+    names = [f"Name{index}" for index in range(10_000)]
+    totals = list(range(1_000_000, 1_010_000))
+
+    dataset = randname.database.Dataset(names, totals)
+
+    # Lists returned by json.load, with their items
+    lists_nbytes = sum(
+        sys.getsizeof(items) + sum(map(sys.getsizeof, items))
+        for items in (names, totals)
+    )
+    assert dataset.nbytes * 3 < lists_nbytes
+
+
+def test_take_shares_repeated_names():
+    dataset = randname.database.Dataset(["Ann", "Eve"], [1, 2])
+
+    names = dataset.names.take([1, 0] * 50)
+
+    assert names == ["Eve", "Ann"] * 50
+    assert names[0] is names[2]
+
+
+def test_name_table_interns_names():
+    table = randname.database.NameTable()
+
+    assert list(table.intern(["Ann", "Eve", "Ann"])) == [0, 1, 0]
+    assert list(table.intern(["Eve", "Zoë"])) == [1, 2]
+    assert table.names == ["Ann", "Eve", "Zoë"]
+    assert len(table) == 3
+
+
+def test_datasets_share_name_table():
+    table = randname.database.NameTable()
+    names = [f"Name{index}" for index in range(1_000)]
+
+    first = randname.database.Dataset(names, list(range(1_000)), table)
+    second = randname.database.Dataset(names[::-1], list(range(1_000)), table)
+
+    assert list(first.names) == names
+    assert second.names[0] == "Name999"
+    assert first.names[-1] is second.names[0]
+    assert len(table) == 1_000
+    assert second.nbytes < randname.database.Dataset(names, list(range(1_000))).nbytes
+
+
+def test_datasets_are_cached_compact(database_path):
+    rn = randname.core.Randname(database_path)
+    rn.randfirst(year=2022, sex="F", country="T1")
+
+    names, totals = rn._load_dataset(("T1", "first_names", 2022, "F"))
+    assert isinstance(names, randname.database.NameSequence)
+    assert list(totals) == [0, 1]
+    assert list(names) == ["First_T1_F_1", "First_T1_F_2"]
+
+
+def test_binary_dataset_preferred_over_json(tmp_path, database_path):
+    shutil.copytree(database_path / "T1", tmp_path / "T1")
+    binary = tmp_path / "T1" / "first_names" / "2022_F.bin"
+    binary.write_bytes(randname.database.pack_dataset(["Binary"], [1]))
+
+    rn = randname.core.Randname(tmp_path)
+    assert rn.randfirst(sex="F", country="T1") == "Binary"
+    assert rn.randfirst(sex="M", country="T1") == "First_T1_M_2"
+    assert randname.database.Database.validate(tmp_path)
+
+
+@pytest.fixture
+def valid_database(tmp_path, database_path):
+    shutil.copytree(database_path / "T1", tmp_path / "T1")
+    return tmp_path
+
+
+@pytest.fixture
+def checked_files(monkeypatch):
+    """Record files, which content was validated."""
+    checked: list[Path] = []
+    validate_file = randname.database.Database._validate_file
+
+    def spy(file, structural):
+        checked.append(file[0])
+        return validate_file(file, structural)
+
+    monkeypatch.setattr(randname.database.Database, "_validate_file", staticmethod(spy))
+    return checked
+
+
+def test_validate_structural(valid_database):
+    assert randname.database.Database.validate(valid_database, structural=True)
+
+
+def test_validate_decreasing_totals(valid_database):
+    names_file = valid_database / "T1" / "first_names" / "2022_F"
+    names_file.write_text('{"Names": ["Ann", "Eve"], "Totals": [2, 1]}')
+
+    with pytest.raises(randname.error.InvalidDatasetFormatError):
+        randname.database.Database.validate(valid_database, structural=True)
+    with pytest.raises(jsonschema.ValidationError):
+        randname.database.Database.validate(valid_database)
+
+
+@pytest.mark.parametrize(
+    ("index", "offset"),
+    [(0, 1), (1, 999), (1, 3), (3, 8)],
+    ids=["start", "decreasing", "split-character", "end"],
+)
+def test_validate_corrupt_binary_offsets(valid_database, index, offset):
+    content = bytearray(
+        randname.database.pack_dataset(["Zoë", "Eve", "Ann"], [1, 2, 3])
+    )
+    position = randname.database.BINARY_HEADER.size + 8 * index
+    content[position : position + 8] = offset.to_bytes(8, "little")
+    binary = valid_database / "T1" / "first_names" / "2022_F.bin"
+    binary.write_bytes(content)
+
+    with pytest.raises(randname.error.InvalidDatasetFormatError):
+        randname.database.Database.validate(valid_database, structural=True)
+
+
+def test_validate_binary_invalid_utf8(valid_database):
+    content = randname.database.pack_dataset(["Ann"], [1])
+    binary = valid_database / "T1" / "first_names" / "2022_F.bin"
+    binary.write_bytes(content[:-1] + b"\xff")
+
+    with pytest.raises(randname.error.InvalidDatasetFormatError):
+        randname.database.Database.validate(valid_database, structural=True)
+
+
+def test_validate_in_process_pool(valid_database):
+    assert randname.database.Database.validate(valid_database, workers=2)
+
+    (valid_database / "T1" / "last_names" / "2022_M").write_text("{")
+    with pytest.raises(jsonschema.ValidationError):
+        randname.database.Database.validate(valid_database, workers=2)
+
+
+def test_validate_manifest_skips_unchanged_files(valid_database, checked_files):
+    database = randname.database.Database
+    manifest = valid_database / "manifest.json"
+
+    assert database.validate(valid_database, manifest=manifest)
+    assert len(checked_files) == 5
+
+    checked_files.clear()
+    assert database.validate(valid_database, manifest=manifest)
+    assert database.validate(valid_database, manifest=manifest, structural=True)
+    assert checked_files == []
+
+    # Same content, different modification time: hash matches
+    names_file = valid_database / "T1" / "first_names" / "2022_F"
+    os.utime(names_file, ns=(0, 0))
+    assert database.validate(valid_database, manifest=manifest)
+    assert checked_files == []
+
+    names_file.write_text('{"Names": ["Ann"], "Totals": [1]}')
+    assert database.validate(valid_database, manifest=manifest)
+    assert checked_files == [names_file]
+
+
+def test_validate_manifest_structural_entries(valid_database, checked_files):
+    database = randname.database.Database
+    manifest = valid_database / "manifest.json"
+    assert database.validate(valid_database, manifest=manifest, structural=True)
+    checked_files.clear()
+
+    # Structural validation is not enough to skip full validation
+    assert database.validate(valid_database, manifest=manifest)
+    assert len(checked_files) == 5
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        {"Names": ["Ann"]},
+        {"Names": ["Ann"], "Totals": [1], "Extra": []},
+        {"Names": [], "Totals": []},
+        {"Names": ["Ann", "Eve"], "Totals": [1]},
+        {"Names": ["Ann", 1], "Totals": [1, 2]},
+        {"Names": ["Ann", "Eve"], "Totals": [1, "2"]},
+        {"Names": ["Ann", "Eve"], "Totals": [1, True]},
+        {"Names": ["Ann", "Eve"], "Totals": [2, 1]},
+        {"Names": ["Ann"], "Totals": [-1]},
+    ],
+)
+def test_validate_names_invalid(data):
+    with pytest.raises(randname.error.InvalidDatasetFormatError):
+        randname.database.validate_names(data)
+
+
+def test_validate_names():
+    randname.database.validate_names({"Names": ["Ann", "Eve"], "Totals": [1, 1.5]})
+    randname.database.validate_names({"Names": ["Ann", "Eve"], "Totals": [0, 0]})
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"country": "XX", "first_names": ["M"]},
+        {"country": 1, "first_names": ["M"], "last_names": ["N"]},
+        {"country": "XX", "first_names": [], "last_names": ["N"]},
+        {"country": "XX", "first_names": ["M"], "last_names": [1]},
+        {"country": "XX", "first_names": ["M"], "last_names": ["N"], "year": 1},
+    ],
+)
+def test_validate_info_invalid(data):
+    with pytest.raises(randname.error.InvalidDatasetFormatError):
+        randname.database.validate_info(data)
+
+
+def test_validate_strict(valid_database):
+    assert randname.database.Database.validate(valid_database, strict=True)
+
+    with pytest.raises(ValueError):
+        randname.database.Database.validate(
+            valid_database, strict=True, structural=True
+        )
+
+
+def test_validate_without_jsonschema(invalid_info_schema, valid_database, monkeypatch):
+    monkeypatch.setattr(randname.database, "JSONSCHEMA_AVAILABLE", False)
+
+    assert randname.database.Database.validate(valid_database)
+    with pytest.raises(randname.error.InvalidDatasetFormatError):
+        randname.database.Database.validate(invalid_info_schema)
+    with pytest.raises(ImportError):
+        randname.database.Database.validate(valid_database, strict=True)
+
+
+def pack_t1(path: Path) -> None:
+    """Pack T1 country of test database in place, removing names directories."""
+    country = path / "T1"
+    datasets = {}
+    for name_type in randname.database.NAME_TYPES:
+        for file in (country / name_type).iterdir():
+            year, sex = file.name.split("_")
+            names, totals = randname.core.Randname._parse_dataset(file.read_bytes())
+            datasets[(name_type, int(year), sex)] = randname.database.pack_dataset(
+                names, totals
+            )
+        shutil.rmtree(country / name_type)
+
+    (country / randname.database.PACK_NAME).write_bytes(
+        randname.database.pack_country(datasets)
+    )
+
+
+def test_country_pack_round_trip(tmp_path):
+    path = tmp_path / randname.database.PACK_NAME
+    path.write_bytes(
+        randname.database.pack_country(
+            {
+                ("last_names", 2020, "N"): randname.database.pack_dataset(["Doe"], [2]),
+                ("first_names", 2021, "F"): randname.database.pack_dataset(
+                    ["Zoë", "Ann"], [1, 3]
+                ),
+            }
+        )
+    )
+
+    pack = randname.database.CountryPack.open(path)
+    assert pack.keys() == [("first_names", 2021, "F"), ("last_names", 2020, "N")]
+    assert ("last_names", 2020, "N") in pack
+    assert list(pack.dataset("first_names", 2021, "F").names) == ["Zoë", "Ann"]
+    assert list(pack.dataset("last_names", 2020, "N").totals) == [2]
+    with pytest.raises(KeyError):
+        pack.dataset("last_names", 2020, "F")
+
+
+def test_country_pack_invalid_content(tmp_path):
+    content = randname.database.pack_country(
+        {("first_names", 2021, "F"): randname.database.pack_dataset(["Ann"], [1])}
+    )
+
+    for invalid in (b"XXXX" + content[4:], content[:-1], b""):
+        with pytest.raises(randname.error.InvalidDatasetFormatError):
+            pack = randname.database.CountryPack(invalid)
+            pack.dataset("first_names", 2021, "F")
+
+
+def test_pack_country_invalid_key():
+    content = randname.database.pack_dataset(["Ann"], [1])
+
+    with pytest.raises(ValueError):
+        randname.database.pack_country({("middle_names", 2021, "F"): content})
+    with pytest.raises(ValueError):
+        randname.database.pack_country({("first_names", 2021, "FF"): content})
+
+
+def test_packed_country(valid_database):
+    expected = randname.core.Randname(valid_database, seed=1).randfull_many(
+        20, country="T1"
+    )
+    pack_t1(valid_database)
+
+    rn = randname.core.Randname(valid_database, seed=1)
+    assert rn.database.index["T1"]["first_names"].years == (2022,)
+    assert rn.randfull_many(20, country="T1") == expected
+    assert randname.database.Database.validate(valid_database)
+    with pytest.raises(FileNotFoundError):
+        rn._read_key(("T1", "first_names", 2021, "F"))
+
+
+def test_validate_pack_missing_sex(valid_database):
+    pack_t1(valid_database)
+    path = valid_database / "T1" / randname.database.PACK_NAME
+    pack = randname.database.CountryPack(path.read_bytes())
+    content = randname.database.pack_country(
+        {
+            key: randname.database.pack_dataset(
+                list(pack.dataset(*key).names), list(pack.dataset(*key).totals)
+            )
+            for key in pack
+            if key[2] == "M"
+        }
+    )
+    path.write_bytes(content)
+
+    with pytest.raises(randname.error.GenderMismatchError):
+        randname.database.Database.validate(valid_database)
@@ -0,0 +1,129 @@
+import json
+import os
+from pathlib import Path
+
+from randname.core import Randname
+from randname.instrumentation import Instrumentation, Measurement
+
+_THIS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+DATABASE = Path(_THIS_FOLDER) / "test_data"
+
+
+def test_disabled_by_default():
+    rn = Randname(DATABASE)
+    rn.randfull()
+
+    # Methods of the class are called directly
+    assert "_sample" not in vars(rn)
+    assert rn.instrumentation_info()["stages"] == {}
+
+
+def test_stages_are_recorded():
+    rn = Randname(DATABASE)
+    rn.enable_instrumentation()
+
+    rn.randfirst(country="T1")
+    rn.randfirst_many(10, year=2022, sex="F", country="T1")
+    stages = rn.instrumentation_info()["stages"]
+
+    assert stages["scan_database"]["calls"] == 1
+    assert stages["scan_database"]["items"] == 3
+    assert stages["resolve_year"]["calls"] == 2
+    assert stages["sample"]["calls"] == 2
+    assert stages["sample"]["items"] == 11
+    # JSON files, read on cache misses only
+    loads = stages["load_dataset"]["calls"]
+    assert loads == rn.cache_info().misses
+    assert stages["read_file"]["calls"] == stages["parse_json"]["calls"] == loads
+    assert stages["read_file"]["bytes"] == sum(
+        (DATABASE / "T1" / "first_names" / f"2022_{sex}").stat().st_size
+        for sex in {dataset.sex for dataset in rn.resident_datasets()}
+    )
+    assert stages["load_dataset"]["seconds"] >= stages["read_file"]["seconds"]
+
+
+def test_year_range_is_one_load(tmp_path):
+    country = tmp_path / "YR"
+    for name_type, sex in (("first_names", "F"), ("last_names", "N")):
+        (country / name_type).mkdir(parents=True)
+        for year in (2000, 2001):
+            (country / name_type / f"{year}_{sex}").write_text(
+                json.dumps({"Names": [f"Name{year}"], "Totals": [1]})
+            )
+    (country / "info.json").write_text(
+        json.dumps({"country": "YR", "first_names": ["F"], "last_names": ["N"]})
+    )
+    rn = Randname(tmp_path)
+    rn.enable_instrumentation()
+
+    rn.randfirst(year=(2000, 2001), country="YR")
+    stages = rn.instrumentation_info()["stages"]
+
+    assert rn.cache_info().misses == 1
+    assert stages["load_dataset"]["calls"] == 1
+    assert stages["load_dataset"]["bytes"] == rn.cache_info().currsize
+    assert stages["merge_years"]["calls"] == 1
+    # Years are read, but not counted as loaded datasets
+    assert stages["read_file"]["calls"] == 2
+
+
+def test_info_includes_cache_counters():
+    rn = Randname(DATABASE)
+    rn.enable_instrumentation()
+    rn.randfirst(year=2022, sex="M", country="T1")
+    rn.randfirst(year=2022, sex="M", country="T1")
+
+    cache = rn.instrumentation_info()["cache"]
+    assert cache["hits"] == 1
+    assert cache["misses"] == 1
+
+
+def test_callback_receives_measurements():
+    measurements: list[Measurement] = []
+    rn = Randname(DATABASE)
+    rn.enable_instrumentation(measurements.append)
+
+    rn.randfirst_many(5, year=2022, sex="M", country="T1")
+
+    samples = [m for m in measurements if m.stage == "sample"]
+    assert len(samples) == 1
+    assert samples[0].items == 5
+    assert samples[0].seconds >= 0
+
+
+def test_disable_restores_methods():
+    rn = Randname(DATABASE)
+    rn.enable_instrumentation()
+    rn.enable_instrumentation()
+    rn.randfirst(country="T1")
+    assert rn.instrumentation_info()["stages"]["sample"]["calls"] == 1
+
+    rn.disable_instrumentation()
+    rn.randfirst(country="T1")
+
+    assert not set(vars(rn)) & {"_sample", "_gen_year", "_read_key"}
+    assert "build_index" not in vars(rn.database)
+    assert rn.instrumentation_info()["stages"] == {}
+
+
+def test_new_database_is_instrumented():
+    rn = Randname(DATABASE)
+    rn.enable_instrumentation()
+    rn.randfirst(country="T1")
+
+    rn.database = DATABASE
+    rn.randfirst(country="T1")
+
+    assert rn.instrumentation_info()["stages"]["scan_database"]["calls"] == 2
+
+
+def test_instrumentation_reset():
+    instrumentation = Instrumentation()
+    instrumentation.record("stage", 0.5, 2, 10)
+    instrumentation.record("stage", 0.25)
+
+    assert instrumentation.snapshot() == {
+        "stage": {"calls": 2, "seconds": 0.75, "items": 3, "bytes": 10}
+    }
+    instrumentation.reset()
+    assert instrumentation.snapshot() == {}
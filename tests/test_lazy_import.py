@@ -0,0 +1,55 @@
+import subprocess
+import sys
+
+import randname
+import randname.core
+import randname.database
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_is_lazy():
+    output = run_python(
+        "import sys, randname, randname.core; "
+        "print('jsonschema' in sys.modules, 'numpy' in sys.modules, "
+        "'multiprocessing' in sys.modules, '_inst' in vars(randname.core))"
+    )
+    assert output == "False False False False"
+
+
+def test_instance_created_on_first_use():
+    output = run_python(
+        "import randname, randname.core; "
+        "randname.randfirst(country='US'); "
+        "print('_inst' in vars(randname.core), "
+        "randname.core._inst is randname.core._instance())"
+    )
+    assert output == "True True"
+
+
+def test_version():
+    assert isinstance(randname.__version__, str)
+    assert "__version__" in vars(randname)
+
+
+def test_validators_created_on_first_use():
+    validator = randname.database.Database.draft_validator_info
+    assert validator is randname.database.Database.draft_validator_info
+    assert "draft_validator_info" in vars(randname.database.Database)
+    assert not isinstance(
+        vars(randname.database.Database)["draft_validator_info"],
+        randname.database._LazyValidator,
+    )
+
+
+def test_aliases_keep_docstrings():
+    assert randname.randfirst.__doc__ == randname.core.Randname.randfirst.__doc__
+    assert randname.core.database is randname.core._instance().database
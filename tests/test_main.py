@@ -0,0 +1,81 @@
+import csv
+import json
+
+import pytest
+
+from randname.__main__ import main, parse_args
+
+
+def read_output(tmp_path, *args: str) -> str:
+    output = tmp_path / "names.out"
+    main([*args, "--output", str(output)])
+    return output.read_text(encoding="utf-8")
+
+
+def test_default_prints_one_name(capsys):
+    main([])
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 1
+
+
+def test_count_across_chunks(tmp_path):
+    text = read_output(tmp_path, "--first", "--count", "25", "--chunk-size", "10")
+    assert len(text.splitlines()) == 25
+
+
+def test_count_zero(tmp_path):
+    assert read_output(tmp_path, "--count", "0") == ""
+
+
+def test_seed_is_reproducible(tmp_path):
+    first = read_output(tmp_path, "--count", "50", "--seed", "3")
+    second = read_output(tmp_path, "--count", "50", "--seed", "3")
+    assert first == second
+
+
+def test_csv_columns(tmp_path):
+    text = read_output(
+        tmp_path,
+        "--last",
+        "--count",
+        "5",
+        "--format",
+        "csv",
+        "--columns",
+        "country",
+        "sex",
+        "year",
+    )
+    rows = list(csv.reader(text.splitlines()))
+    assert rows[0] == ["name", "country", "sex", "year"]
+    assert len(rows) == 6
+    for _, country, sex, year in rows[1:]:
+        assert (country, sex, year) == ("US", "N", "2010")
+
+
+def test_jsonl(tmp_path):
+    text = read_output(
+        tmp_path,
+        "--count",
+        "5",
+        "--sex",
+        "F",
+        "--format",
+        "jsonl",
+        "--columns",
+        "sex",
+    )
+    records = [json.loads(line) for line in text.splitlines()]
+    assert len(records) == 5
+    assert all(record.keys() == {"name", "sex"} for record in records)
+    assert all(record["sex"] == "F" for record in records)
+
+
+def test_text_columns(tmp_path):
+    text = read_output(tmp_path, "--first", "--count", "3", "--columns", "year")
+    assert all(line.split("\t")[1] == "2018" for line in text.splitlines())
+
+
+def test_invalid_count():
+    with pytest.raises(SystemExit):
+        parse_args(["--count", "-1"])
@@ -0,0 +1,91 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import randname.error
+import randname.parallel
+
+
+@pytest.fixture
+def database_path():
+    _THIS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+    return Path() / _THIS_FOLDER / "test_data"
+
+
+def test_generate_same_result_for_any_number_of_workers():
+    single = randname.parallel.generate(
+        2_000, country="US", seed=7, workers=1, chunk_size=300
+    )
+    parallel = randname.parallel.generate(
+        2_000, country="US", seed=7, workers=3, chunk_size=300
+    )
+    assert len(single) == 2_000
+    assert single == parallel
+
+
+def test_generate_different_seeds():
+    first = randname.parallel.generate(100, kind="first", seed=1, workers=1)
+    second = randname.parallel.generate(100, kind="first", seed=2, workers=1)
+    assert first != second
+
+
+def test_generate_chunks(database_path):
+    chunks = list(
+        randname.parallel.generate_chunks(
+            25,
+            "last",
+            sex="F",
+            country="T1",
+            seed=1,
+            workers=2,
+            chunk_size=10,
+            path_to_database=database_path,
+        )
+    )
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert chunks[0] == ["Last_T1_F_2"] * 10
+
+
+def test_generate_invalid_arguments():
+    with pytest.raises(ValueError):
+        randname.parallel.generate(-1)
+
+    with pytest.raises(ValueError):
+        randname.parallel.generate(10, chunk_size=0)
+
+    with pytest.raises(ValueError):
+        randname.parallel.generate(10, kind="middle")  # type: ignore[arg-type]
+
+    with pytest.raises(randname.error.InvalidCountryNameError):
+        randname.parallel.generate(10, country="XX")
+
+
+def test_generate_chunks_checks_arguments_on_call(database_path):
+    with pytest.raises(randname.error.InvalidSexArgumentError):
+        randname.parallel.generate_chunks(10, "first", sex="X")
+
+    with pytest.raises(randname.error.InvalidSexArgumentError):
+        randname.parallel.generate_chunks(10, "full", sex="X")
+
+    with pytest.raises(ValueError):
+        randname.parallel.generate_chunks(10, workers=0)
+
+    with pytest.raises(ValueError):
+        randname.parallel.generate_chunks(10, kind="middle")  # type: ignore[arg-type]
+
+
+def test_generate_float_totals(tmp_path, database_path):
+    shutil.copytree(database_path / "T1", tmp_path / "T1")
+    (tmp_path / "T1" / "last_names" / "2022_F").write_text(
+        json.dumps({"Names": ["Ann", "Eve"], "Totals": [0.5, 1.0]})
+    )
+
+    names = randname.parallel.generate(
+        20, "last", sex="F", seed=1, workers=2, chunk_size=10, path_to_database=tmp_path
+    )
+
+    assert set(names) <= {"Ann", "Eve"}
+    assert len(names) == 20
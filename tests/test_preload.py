@@ -0,0 +1,86 @@
+import os
+from pathlib import Path
+
+import pytest
+
+import randname
+import randname.error
+from randname.core import Randname, ResidentDataset
+
+_THIS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+DATABASE = Path(_THIS_FOLDER) / "test_data"
+
+
+def test_preload_all():
+    rn = Randname(DATABASE)
+    keys = rn.preload()
+    # T3 has only male first names
+    assert len(keys) == 11
+    assert rn.cache_info().entries == 11
+    assert [dataset[:4] for dataset in rn.resident_datasets()] == sorted(keys)
+
+
+def test_preload_selected():
+    rn = Randname(DATABASE)
+    keys = rn.preload(
+        countries=["T1"], name_types=["first_names"], years=[1990], sexes=["F", "N"]
+    )
+    assert keys == [("T1", "first_names", 2022, "F")]
+
+
+def test_first_draw_after_preload_is_a_hit():
+    rn = Randname(DATABASE)
+    rn.preload(countries=["T1"])
+    misses = rn.cache_info().misses
+
+    rn.randfull(country="T1")
+    assert rn.cache_info().misses == misses
+
+
+@pytest.mark.parametrize("sampler", ["alias", "numpy"])
+def test_preload_builds_sampler_structures(sampler):
+    rn = Randname(DATABASE, sampler=sampler)
+    rn.preload(countries=["T1"], name_types=["first_names"])
+    if rn._sampler == sampler:
+        # Datasets and derived structures
+        assert rn.cache_info().entries == 4
+    misses = rn.cache_info().misses
+
+    rn.randfirst_many(10, country="T1")
+    assert rn.cache_info().misses == misses
+
+
+def test_preload_in_background():
+    rn = Randname(DATABASE)
+    future = rn.preload(countries=["T2"], background=True)
+    assert len(future.result(timeout=10)) == 4
+    assert {dataset.country for dataset in rn.resident_datasets()} == {"T2"}
+
+
+def test_preload_invalid_arguments():
+    rn = Randname(DATABASE)
+    with pytest.raises(randname.error.InvalidCountryNameError):
+        rn.preload(countries=["XX"], background=True)
+    with pytest.raises(ValueError):
+        rn.preload(name_types=["middle_names"])  # type: ignore[list-item]
+
+
+def test_preload_over_cache_budget(caplog):
+    rn = Randname(DATABASE, cache_size=1)
+    assert len(rn.preload(countries=["T1"])) == 4
+    assert rn.resident_datasets() == []
+    assert "don't fit in the cache" in caplog.text
+
+
+def test_resident_datasets_include_derived_structures():
+    rn = Randname(DATABASE, sampler="alias")
+    rn.randfirst(sex="F", country="T1")
+    (dataset,) = rn.resident_datasets()
+    assert isinstance(dataset, ResidentDataset)
+    assert dataset[:4] == ("T1", "first_names", 2022, "F")
+    assert dataset.nbytes == rn.cache_info().currsize
+
+
+def test_module_level_preload():
+    assert randname.preload(countries=["US"], name_types=["last_names"])
+    assert "US" in {dataset.country for dataset in randname.resident_datasets()}
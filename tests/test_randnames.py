@@ -1,4 +1,5 @@
 import unittest
+from itertools import islice
 from pathlib import Path
 from unittest.mock import patch
 
@@ -9,9 +10,13 @@ from randname.core import (
     _inst,
     available_countries,
     randfirst,
+    randfirst_many,
     randfull,
+    randfull_many,
     randlast,
+    randlast_many,
     show_data,
+    stream,
 )
 
 
@@ -30,7 +35,7 @@ class TestRandomNames(unittest.TestCase):
         _inst.database = Randname.PATH_TO_DATABASE
 
     def setUp(self):
-        pass
+        _inst.database = self.database
 
     def tearDown(self):
         pass
@@ -75,6 +80,66 @@ class TestRandomNames(unittest.TestCase):
         test = "First_T1_M_2 Last_T1_F_2"
         self.assertEqual(name, test)
 
+    def test_first_name_many(self):
+        names = randfirst_many(5, sex="F", country="T1")
+        self.assertEqual(names, ["First_T1_F_2"] * 5)
+
+    def test_last_name_many(self):
+        names = randlast_many(5, sex="M", country="T1")
+        self.assertEqual(names, ["Last_T1_M_2"] * 5)
+
+    def test_full_name_many(self):
+        names = randfull_many(3, sex="F", country="T1")
+        self.assertEqual(names, ["First_T1_F_2 Last_T1_F_2"] * 3)
+
+        names = randfull_many(3, sex="F", country="T3")
+        self.assertEqual(names, ["First_T1_M_2 Last_T1_F_2"] * 3)
+
+    def test_many_draws_missing_arguments_for_every_name(self):
+        # Chance that 200 names are drawn from a single sex is 1/(2^199).
+        names = randfirst_many(200, country="T1")
+        self.assertEqual(set(names), {"First_T1_F_2", "First_T1_M_2"})
+
+        names = randfull_many(200, country="T1")
+        self.assertEqual(
+            {name.split()[1] for name in names}, {"Last_T1_F_2", "Last_T1_M_2"}
+        )
+
+    def test_many_zero_names(self):
+        self.assertEqual(randfirst_many(0, sex="F", country="T1"), [])
+        self.assertEqual(randfull_many(0, sex="F", country="T1"), [])
+
+    def test_many_negative_number_of_names(self):
+        with self.assertRaises(ValueError):
+            randlast_many(-1, country="T1")
+
+        with self.assertRaises(ValueError):
+            randfull_many(-1, country="T1")
+
+    def test_many_invalid_sex(self):
+        with self.assertRaises(randname.error.InvalidSexArgumentError):
+            randfirst_many(3, sex="D", country="T1")
+
+    def test_stream(self):
+        names = stream("full", sex="F", country="T1", chunk_size=10)
+        self.assertEqual(list(islice(names, 25)), ["First_T1_F_2 Last_T1_F_2"] * 25)
+
+        names = stream("first", sex="M", country="T1", chunk_size=1)
+        self.assertEqual(list(islice(names, 3)), ["First_T1_M_2"] * 3)
+
+        names = stream("last", sex="M", country="T1")
+        self.assertEqual(next(names), "Last_T1_M_2")
+
+    def test_stream_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            stream("middle", country="T1")  # type: ignore[arg-type]
+
+        with self.assertRaises(ValueError):
+            stream(country="T1", chunk_size=0)
+
+        with self.assertRaises(randname.error.InvalidSexArgumentError):
+            next(stream(sex="D", country="T1"))
+
     def test_get_name(self):
         # TODO: test case for each parameter:
         # name: str,
@@ -102,7 +167,7 @@ class TestRandomNames(unittest.TestCase):
 
     def test_gen_country_random(self):
         test_country = "T1"
-        with patch("random.choice", mock_random_choice):
+        with patch.object(_inst._rng, "choice", mock_random_choice):
             country = _inst._gen_country(None)
             self.assertEqual(test_country, country)
 
@@ -118,18 +183,16 @@ class TestRandomNames(unittest.TestCase):
         # TODO: available_sex
         ...
 
-    def test_gen_name_from_file(self):
-        file = Path("./tests/test_data/T2/first_names/gen_name_from_file_test")
-        name = _inst._gen_name_from_file(file)
-        test = "First_T2_F_2"
-        self.assertEqual(name, test)
+    def test_choose_names(self):
+        names, totals = _inst._load_dataset(("T2", "first_names", 2022, "F"))
+        self.assertEqual(_inst._choose_names(names, totals, True), ["First_T2_F_2"])
 
-    def test_gen_name_from_file_with_cum_weights_set_to_false(self):
+    def test_choose_names_with_cum_weights_set_to_false(self):
         test = {"First_T2_F_1", "First_T2_F_2"}
-        file = Path("./tests/test_data/T2/first_names/gen_name_from_file_test")
-        names = {_inst._gen_name_from_file(file, False) for _ in range(100)}
+        names, totals = _inst._load_dataset(("T2", "first_names", 2022, "F"))
+        chosen = set(_inst._choose_names(names, totals, False, 100))
         # It's not 100% sure, but chance of rolling 100 times just one name is equal to: 1/(2^100) which is approximately 0, exactly it's: 7.8886e10-31.
-        self.assertEqual(names, test)
+        self.assertEqual(chosen, test)
 
     def test_available_countries(self):
         countries = available_countries(self.database)
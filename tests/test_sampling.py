@@ -0,0 +1,99 @@
+import os
+import random
+from collections import Counter
+from itertools import accumulate
+from pathlib import Path
+
+import pytest
+
+import randname.sampling
+from randname.core import Randname
+
+
+@pytest.fixture
+def database_path():
+    _THIS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+    return Path() / _THIS_FOLDER / "test_data"
+
+
+def test_alias_table_matches_cumulative_weights():
+    weights = [1, 2, 3, 4, 0, 10]
+    cum_weights = list(accumulate(weights))
+    population = list(range(len(weights)))
+    k = 100_000
+
+    alias_table = randname.sampling.AliasTable(cum_weights)
+    alias_counts = Counter(alias_table.sample(k, random.Random(1).random))
+    bisect_counts = Counter(
+        random.Random(2).choices(population, cum_weights=cum_weights, k=k)
+    )
+
+    # Standard deviation of frequency is at most 0.0016 for k=100 000.
+    for index, weight in enumerate(weights):
+        expected = weight / cum_weights[-1]
+        assert alias_counts[index] / k == pytest.approx(expected, abs=0.008)
+        assert bisect_counts[index] / k == pytest.approx(expected, abs=0.008)
+
+    assert alias_counts[4] == 0
+
+
+def test_alias_table_single_name():
+    alias_table = randname.sampling.AliasTable([5])
+    assert alias_table.sample(3) == [0, 0, 0]
+
+
+def test_alias_table_invalid_weights():
+    with pytest.raises(ValueError):
+        randname.sampling.AliasTable([])
+
+    with pytest.raises(ValueError):
+        randname.sampling.AliasTable([0, 0])
+
+
+def test_randname_alias_sampler(database_path):
+    rn = Randname(database_path, sampler="alias")
+    assert rn.randfirst(sex="F", country="T1") == "First_T1_F_2"
+    assert (
+        rn.randfull_many(3, sex="M", country="T1") == ["First_T1_M_2 Last_T1_M_2"] * 3
+    )
+
+
+def test_randname_invalid_sampler(database_path):
+    with pytest.raises(ValueError):
+        Randname(database_path, sampler="linear")  # type: ignore[arg-type]
+
+
+def test_numpy_dataset_matches_cumulative_weights():
+    numpy = pytest.importorskip("numpy")
+    weights = [1, 2, 3, 4, 0, 10]
+    cum_weights = list(accumulate(weights))
+    names = [f"Name_{index}" for index in range(len(weights))]
+    k = 100_000
+
+    dataset = randname.sampling.NumpyDataset(names, cum_weights)
+    counts = Counter(dataset.sample(k, numpy.random.default_rng(1)))
+
+    for index, weight in enumerate(weights):
+        expected = weight / cum_weights[-1]
+        assert counts[f"Name_{index}"] / k == pytest.approx(expected, abs=0.008)
+
+
+def test_numpy_dataset_without_weights():
+    numpy = pytest.importorskip("numpy")
+    dataset = randname.sampling.NumpyDataset(["A", "B"], [0, 1])
+    names = dataset.sample(100, numpy.random.default_rng(1), cum_weights=False)
+    assert set(names) == {"A", "B"}
+
+
+def test_randname_numpy_sampler(database_path):
+    pytest.importorskip("numpy")
+    rn = Randname(database_path, sampler="numpy")
+    assert rn.randfirst(sex="F", country="T1") == "First_T1_F_2"
+    assert rn.randlast_many(3, sex="M", country="T1") == ["Last_T1_M_2"] * 3
+
+
+def test_randname_numpy_sampler_fallback(database_path, monkeypatch):
+    monkeypatch.setattr(randname.sampling, "NUMPY_AVAILABLE", False)
+    rn = Randname(database_path, sampler="numpy")
+    assert rn._sampler == "bisect"
+    assert rn.randfirst(sex="F", country="T1") == "First_T1_F_2"
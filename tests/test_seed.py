@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+import randname
+from randname.core import Randname
+
+
+def test_same_seed_same_names():
+    first = Randname(seed=42)
+    second = Randname(seed=42)
+    assert first.randfull_many(50) == second.randfull_many(50)
+    assert first.randfirst(country="US") == second.randfirst(country="US")
+
+
+def test_different_seed_different_names():
+    assert Randname(seed=1).randfull_many(50) != Randname(seed=2).randfull_many(50)
+
+
+def test_instance_is_independent_from_global_random():
+    rn = Randname(seed=42)
+    expected = rn.randfull_many(20)
+
+    rn.seed(42)
+    random.seed(0)
+    random.random()
+    assert rn.randfull_many(20) == expected
+
+
+def test_custom_rng():
+    assert Randname(rng=random.Random(7)).randlast_many(20) == Randname(
+        seed=7
+    ).randlast_many(20)
+
+
+def test_seed_and_rng_are_exclusive():
+    with pytest.raises(ValueError):
+        Randname(seed=1, rng=random.Random(1))
+
+
+@pytest.mark.parametrize("sampler", Randname.VALID_SAMPLERS)
+def test_seed_reproducible_with_every_sampler(sampler):
+    first = Randname(seed=3, sampler=sampler)
+    second = Randname(seed=3, sampler=sampler)
+    assert first.randfirst_many(100, country="US") == second.randfirst_many(
+        100, country="US"
+    )
+
+
+def test_module_level_seed():
+    randname.seed(5)
+    expected = randname.randfull_many(10)
+    randname.seed(5)
+    assert randname.randfull_many(10) == expected
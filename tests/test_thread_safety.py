@@ -0,0 +1,195 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from randname.core import Randname
+from randname.database import Database
+
+_THIS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+DATABASE = Path(_THIS_FOLDER) / "test_data"
+THREADS = 8
+
+
+def run_in_threads(function, threads=THREADS):
+    """Call function in every thread at once, return results in thread order."""
+    barrier = threading.Barrier(threads)
+
+    def call(_):
+        barrier.wait()
+        return function()
+
+    with ThreadPoolExecutor(threads) as executor:
+        return list(executor.map(call, range(threads)))
+
+
+def spy_reads(monkeypatch, rn, delay=0.01, error=None):
+    """Count dataset reads, slowed down so threads miss the cache together."""
+    reads = Counter()
+    read_key = rn._read_key
+
+    def spy(key):
+        reads[key] += 1
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return read_key(key)
+
+    monkeypatch.setattr(rn, "_read_key", spy)
+    return reads
+
+
+def valid_names():
+    rn = Randname(DATABASE)
+    names = set()
+    for key in rn.preload():
+        names.update(rn._load_dataset(key)[0])
+    return names
+
+
+@pytest.mark.parametrize("sampler", Randname.VALID_SAMPLERS)
+def test_dataset_is_read_once_under_contention(monkeypatch, sampler):
+    rn = Randname(DATABASE, sampler=sampler)
+    reads = spy_reads(monkeypatch, rn)
+
+    run_in_threads(lambda: rn.randfirst(year=2022, sex="F", country="T1"))
+
+    assert reads == {("T1", "first_names", 2022, "F"): 1}
+    assert len(rn.resident_datasets()) == 1
+
+
+def test_read_error_is_raised_in_every_thread(monkeypatch):
+    rn = Randname(DATABASE)
+    reads = spy_reads(monkeypatch, rn, error=OSError("disk"))
+
+    def draw():
+        try:
+            rn.randfirst(year=2022, sex="F", country="T1")
+        except OSError as error:
+            return error
+
+    errors = run_in_threads(draw)
+
+    assert all(isinstance(error, OSError) for error in errors)
+    assert sum(reads.values()) == 1
+    # Failed load is not remembered, next call reads again
+    with pytest.raises(OSError):
+        rn.randfirst(year=2022, sex="F", country="T1")
+    assert sum(reads.values()) == 2
+
+
+def test_index_is_built_once(monkeypatch):
+    rn = Randname(DATABASE)
+    builds = []
+    build_index = Database.build_index
+
+    def spy(path):
+        builds.append(path)
+        time.sleep(0.01)
+        return build_index(path)
+
+    monkeypatch.setattr(Database, "build_index", staticmethod(spy))
+
+    indexes = run_in_threads(lambda: rn.database.index)
+
+    assert len(builds) == 1
+    assert all(index is indexes[0] for index in indexes)
+
+
+@pytest.mark.parametrize("sampler", Randname.VALID_SAMPLERS)
+def test_stress_randfull(sampler):
+    rn = Randname(DATABASE, sampler=sampler, cache_size=4096)
+    names = valid_names()
+
+    def draw():
+        return [rn.randfull() for _ in range(500)] + rn.randfull_many(500)
+
+    results = run_in_threads(draw)
+
+    for full_names in results:
+        assert len(full_names) == 1000
+        for full_name in full_names:
+            first, last = full_name.split(" ")
+            assert first in names
+            assert last in names
+    info = rn.cache_info()
+    assert info.currsize <= info.maxsize
+
+
+def test_threads_draw_from_own_generators():
+    rn = Randname(DATABASE, seed=1)
+
+    results = run_in_threads(lambda: rn.randfirst_many(20, country="T1", weights=False))
+
+    assert len({tuple(names) for names in results}) == THREADS
+
+
+def test_seeding_thread_is_reproducible_while_others_draw():
+    reference = Randname(DATABASE, seed=5)
+    expected = [reference.randfull() for _ in range(200)]
+    rn = Randname(DATABASE, seed=5)
+    stop = threading.Event()
+
+    def draw():
+        while not stop.is_set():
+            rn.randfull()
+
+    with ThreadPoolExecutor(4) as executor:
+        for _ in range(4):
+            executor.submit(draw)
+        try:
+            names = [rn.randfull() for _ in range(200)]
+        finally:
+            stop.set()
+
+    assert names == expected
+
+
+def test_seed_reseeds_other_threads():
+    rn = Randname(DATABASE)
+
+    def reseed_and_draw():
+        rn.seed(3)
+        return rn.randfull_many(20)
+
+    with ThreadPoolExecutor(1) as executor:
+        first = executor.submit(reseed_and_draw).result()
+        second = executor.submit(reseed_and_draw).result()
+
+    assert first == second
+
+
+@pytest.mark.slow
+def test_throughput_scaling():
+    """Throughput with many threads must not collapse on lock contention.
+
+    With the GIL threads can't draw in parallel, so only the same total
+    throughput is expected. Without it, throughput should grow with threads.
+    """
+    rn = Randname(DATABASE)
+    rn.preload()
+    calls = 5_000
+
+    def draw():
+        for _ in range(calls):
+            rn.randfull()
+
+    def throughput(threads):
+        start = time.perf_counter()
+        run_in_threads(draw, threads)
+        return threads * calls / (time.perf_counter() - start)
+
+    draw()  # warm up
+    single = throughput(1)
+    multi = throughput(THREADS)
+
+    gil_disabled = not getattr(sys, "_is_gil_enabled", lambda: True)()
+    if gil_disabled and (os.cpu_count() or 1) >= THREADS:
+        assert multi >= 2 * single
+    else:
+        assert multi >= 0.5 * single
@@ -0,0 +1,89 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import randname.database
+
+_THIS_FOLDER = Path(os.path.dirname(os.path.abspath(__file__)))
+TOOLS = _THIS_FOLDER.parent / "tools"
+SRC = _THIS_FOLDER.parent / "src"
+
+
+def run_tool(tool: str, *args: object) -> list[str]:
+    """Run script from tools directory, return lines it printed."""
+    result = subprocess.run(
+        [sys.executable, str(TOOLS / tool), *map(str, args)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=dict(os.environ, PYTHONPATH=str(SRC)),
+    )
+    return result.stdout.splitlines()
+
+
+def read_names_file(path: Path) -> tuple[list[str], list[int]]:
+    if path.suffix == randname.database.BINARY_SUFFIX:
+        dataset = randname.database.BinaryDataset.open(path)
+        return list(dataset.names), list(dataset.totals)
+
+    content = json.loads(path.read_text(encoding="utf-8"))
+    return content["Names"], content["Totals"]
+
+
+@pytest.mark.parametrize(
+    ("output_format", "suffix"), [("json", ""), ("binary", ".bin")]
+)
+def test_convert_to_json(tmp_path, output_format, suffix):
+    sources = [tmp_path / "2018_F.csv", tmp_path / "2018_M.csv"]
+    sources[0].write_text("name,count\nanna,3\nzoë,2\nola,1\n", encoding="utf-8")
+    sources[1].write_text("name,count\njan,5\nadam,4.0\n", encoding="utf-8")
+    output = tmp_path / "first_names"
+    arguments = ["-f", *sources, "-o", output, "--format", output_format, "-j", 2]
+
+    assert len(run_tool("convert_to_json.py", *arguments)) == 2
+    assert read_names_file(output / f"2018_F{suffix}") == (
+        ["Anna", "Zoë", "Ola"],
+        [3, 5, 6],
+    )
+    assert read_names_file(output / f"2018_M{suffix}") == (["Jan", "Adam"], [5, 9])
+
+    # Outputs newer than their sources are skipped
+    assert run_tool("convert_to_json.py", *arguments) == []
+
+    modified = sources[0].stat().st_mtime + 10
+    os.utime(sources[0], (modified, modified))
+    assert run_tool("convert_to_json.py", *arguments) == [
+        f"{sources[0]} -> {output / f'2018_F{suffix}'}"
+    ]
+
+    assert len(run_tool("convert_to_json.py", *arguments, "--force")) == 2
+
+
+def test_pack_database(tmp_path):
+    shutil.copytree(_THIS_FOLDER / "test_data" / "T1", tmp_path / "T1")
+    (tmp_path / "T1" / "first_names" / "2023_F").write_text(
+        json.dumps({"Names": ["Zoë", "Łucja"], "Totals": [2, 7]}), encoding="utf-8"
+    )
+    sources = {}
+    for name_type in randname.database.NAME_TYPES:
+        for file in (tmp_path / "T1" / name_type).iterdir():
+            year, sex = file.name.split("_")
+            sources[(name_type, int(year), sex)] = read_names_file(file)
+
+    assert run_tool("pack_database.py", tmp_path) == [
+        f"{tmp_path / 'T1'} -> {tmp_path / 'T1' / 'names.pack'} (5 datasets)"
+    ]
+
+    pack = randname.database.CountryPack.open(
+        tmp_path / "T1" / randname.database.PACK_NAME
+    )
+    assert pack.keys() == sorted(sources)
+    for key, (names, totals) in sources.items():
+        dataset = pack.dataset(*key)
+        assert list(dataset.names) == names
+        assert list(dataset.totals) == totals
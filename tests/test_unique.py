@@ -0,0 +1,112 @@
+import json
+import os
+import shutil
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+import randname.error
+from randname.core import Randname
+
+_THIS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+DATABASE = Path(_THIS_FOLDER) / "test_data"
+
+
+@pytest.mark.parametrize("kind", ["first", "last", "full"])
+def test_unique_names_are_distinct(kind):
+    rn = Randname(seed=1)
+    names = getattr(rn, f"rand{kind}_many")(5_000, country="US", unique=True)
+
+    assert len(names) == 5_000
+    assert len(set(names)) == 5_000
+
+
+def test_unique_is_reproducible():
+    assert Randname(seed=3).randfull_many(1_000, unique=True) == Randname(
+        seed=3
+    ).randfull_many(1_000, unique=True)
+
+
+def test_all_names_can_be_drawn():
+    rn = Randname(DATABASE, seed=1)
+
+    names = rn.randfirst_many(4, country="T1", weights=False, unique=True)
+
+    assert sorted(names) == [
+        "First_T1_F_1",
+        "First_T1_F_2",
+        "First_T1_M_1",
+        "First_T1_M_2",
+    ]
+
+
+def test_names_with_zero_weight_are_not_drawn():
+    rn = Randname(DATABASE, seed=1)
+
+    names = rn.randfirst_many(2, country="T1", unique=True)
+
+    assert sorted(names) == ["First_T1_F_2", "First_T1_M_2"]
+    with pytest.raises(randname.error.NotEnoughNamesError) as error:
+        rn.randfirst_many(3, country="T1", unique=True)
+    assert error.value.requested == 3
+    assert error.value.available == 2
+
+
+def test_all_full_names_can_be_drawn():
+    rn = Randname(DATABASE, seed=1)
+
+    names = rn.randfull_many(16, country="T1", weights=False, unique=True)
+
+    assert len(set(names)) == 16
+    with pytest.raises(randname.error.NotEnoughNamesError):
+        rn.randfull_many(17, country="T1", weights=False, unique=True)
+
+
+def test_zero_and_negative_n():
+    rn = Randname(DATABASE)
+
+    assert rn.randfull_many(0, unique=True) == []
+    with pytest.raises(ValueError):
+        rn.randfull_many(-1, unique=True)
+
+
+def test_rest_is_selected_with_weights():
+    rn = Randname(DATABASE, seed=1)
+    parts = [(1.0, [{"a": 0.9, "b": 0.1}])]
+
+    first = Counter()
+    for _ in range(2_000):
+        drawn: dict[str, None] = {}
+        rn._select_rest("first", parts, drawn, 1)
+        first.update(list(drawn))
+
+    assert 0.85 < first["a"] / 2_000 < 0.95
+
+
+def test_rest_is_selected_when_weights_are_skewed(tmp_path):
+    shutil.copytree(DATABASE / "T1", tmp_path / "T1")
+    names = ["Common"] + [f"Rare{index}" for index in range(2_000)]
+    totals = list(range(10**15, 10**15 + len(names)))
+    (tmp_path / "T1" / "first_names" / "2022_F").write_text(
+        json.dumps({"Names": names, "Totals": totals})
+    )
+    rn = Randname(tmp_path, seed=1)
+
+    # Rare names are almost never drawn, more chunks mean rejection loop
+    # kept going instead of selecting the rest
+    chunks = 0
+    gen_many = rn._gen_many
+
+    def counting_gen_many(*args):
+        nonlocal chunks
+        chunks += 1
+        assert chunks <= 2
+        return gen_many(*args)
+
+    rn._gen_many = counting_gen_many  # type: ignore[method-assign]
+
+    drawn = rn.randfirst_many(100, sex="F", country="T1", unique=True)
+
+    assert len(set(drawn)) == 100
+    assert "Common" in drawn
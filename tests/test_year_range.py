@@ -0,0 +1,233 @@
+import json
+from collections import Counter
+from itertools import pairwise
+
+import pytest
+
+from randname.core import Randname, YearRange
+
+# Occurrences of names in every year of the test database
+YEARS = {
+    2000: {"Anna": 3, "Ola": 1},
+    2001: {"Anna": 1, "Ewa": 3},
+    2003: {"Ewa": 4},
+}
+
+
+@pytest.fixture
+def database(tmp_path):
+    country = tmp_path / "YR"
+    (country / "first_names").mkdir(parents=True)
+    (country / "last_names").mkdir()
+    (country / "info.json").write_text(
+        json.dumps({"country": "YR", "first_names": ["F"], "last_names": ["N"]})
+    )
+
+    for year, counts in YEARS.items():
+        totals, total = [], 0
+        for count in counts.values():
+            total += count
+            totals.append(total)
+        (country / "first_names" / f"{year}_F").write_text(
+            json.dumps({"Names": list(counts), "Totals": totals})
+        )
+        (country / "last_names" / f"{year}_N").write_text(
+            json.dumps({"Names": [f"Last{year}"], "Totals": [1]})
+        )
+
+    return tmp_path
+
+
+def test_range_selects_years_within_it(database):
+    rn = Randname(database)
+
+    assert rn._gen_year((2000, 2002), "YR", "first_names") == YearRange((2000, 2001))
+    assert rn._gen_year((1990, 2010), "YR", "first_names") == YearRange(
+        (2000, 2001, 2003)
+    )
+    # Single and no year within the range
+    assert rn._gen_year((2001, 2002), "YR", "first_names") == 2001
+    assert rn._gen_year((2002, 2002), "YR", "first_names") == 2003
+
+
+def test_invalid_ranges(database):
+    rn = Randname(database)
+
+    with pytest.raises(ValueError):
+        rn.randfirst(year=(2003, 2000), country="YR")
+    with pytest.raises(ValueError):
+        rn.randfirst(year=(2000, 2001, 2003), country="YR")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        rn.randfirst(year={2000: -1, 2001: 2}, country="YR")
+    with pytest.raises(ValueError):
+        rn.randfirst(year={2000: 0}, country="YR")
+
+
+def test_merged_dataset_adds_up_occurrences(database):
+    rn = Randname(database)
+
+    names, totals = rn._load_dataset(
+        ("YR", "first_names", YearRange((2000, 2001)), "F")
+    )
+
+    assert list(names) == ["Anna", "Ola", "Ewa"]
+    assert list(totals) == [4, 5, 8]
+
+
+def test_weighted_years(database):
+    rn = Randname(database)
+
+    year = rn._gen_year({2000: 1, 2002: 2, 2003: 1}, "YR", "first_names")
+    # 2002 is mapped to 2003, like a single year
+    assert year == YearRange((2000, 2003), (1, 3))
+
+    names, totals = rn._load_dataset(("YR", "first_names", year, "F"))
+    counts = dict(zip(names, (b - a for a, b in pairwise([0, *totals]))))
+    assert counts["Anna"] / totals[-1] == pytest.approx(3 / 4 * 1 / 4)
+    assert counts["Ola"] / totals[-1] == pytest.approx(1 / 4 * 1 / 4)
+    assert counts["Ewa"] / totals[-1] == pytest.approx(3 / 4)
+
+
+@pytest.mark.parametrize("sampler", ["bisect", "alias", "numpy"])
+def test_draws_follow_merged_distribution(database, sampler):
+    rn = Randname(database, sampler=sampler, seed=1)
+
+    names = Counter(rn.randfirst_many(8_000, year=(2000, 2003), country="YR"))
+
+    assert names.keys() == {"Anna", "Ola", "Ewa"}
+    assert names["Ewa"] / 8_000 == pytest.approx(7 / 12, abs=0.03)
+    assert names["Ola"] / 8_000 == pytest.approx(1 / 12, abs=0.03)
+
+
+def test_merged_dataset_is_cached(database):
+    rn = Randname(database)
+
+    rn.randfirst(year=(2000, 2003), country="YR")
+    misses = rn.cache_info().misses
+    rn.randfirst(year=(2000, 2003), country="YR")
+
+    assert rn.cache_info().misses == misses
+    assert [dataset.year for dataset in rn.resident_datasets()] == [
+        YearRange((2000, 2001, 2003))
+    ]
+
+
+def test_full_names_and_unique_with_range(database):
+    rn = Randname(database, seed=1)
+
+    first, last = rn.randfull(year=(2000, 2001), country="YR").split()
+    assert first in ("Anna", "Ola", "Ewa")
+    assert last in ("Last2000", "Last2001")
+
+    names = rn.randfirst_many(3, year=(2000, 2003), country="YR", unique=True)
+    assert sorted(names) == ["Anna", "Ewa", "Ola"]
+
+
+def test_preload_range(database):
+    rn = Randname(database)
+
+    keys = rn.preload(name_types=["first_names"], years=[(2000, 2001), 2003])
+
+    assert keys == [
+        ("YR", "first_names", YearRange((2000, 2001)), "F"),
+        ("YR", "first_names", 2003, "F"),
+    ]
+
+
+def test_shared_names_across_years(database):
+    rn = Randname(database, shared_names=True)
+
+    rn.preload(name_types=["first_names"], years=[2000, 2001, 2003, (2000, 2003)])
+
+    table = rn._name_tables["YR"]
+    assert table.names == ["Anna", "Ola", "Ewa"]
+    names, totals = rn._load_dataset(
+        ("YR", "first_names", YearRange((2000, 2001, 2003)), "F")
+    )
+    assert list(names) == ["Anna", "Ola", "Ewa"]
+    assert list(totals) == [4, 5, 12]
+    assert names[2] is rn._load_dataset(("YR", "first_names", 2003, "F"))[0][0]
+
+    rn.clear_cache()
+    assert rn._name_tables == {}
+
+
+def test_name_table_is_charged_to_cache(database):
+    rn = Randname(database, shared_names=True)
+
+    rn.preload(name_types=["first_names"], years=[2000, 2001])
+
+    table = rn._name_tables["YR"]
+    resident = rn.resident_datasets()
+    assert resident[-1] == ("YR", "name_table", 0, "", table.nbytes)
+    assert rn.cache_info().currsize == sum(dataset.nbytes for dataset in resident)
+
+    # Evicting the last dataset of the country evicts its table
+    rn._cache.put("other", None, rn.cache_info().maxsize)
+    assert rn._name_tables == {}
+    assert "other" in rn._cache
+
+
+def test_name_table_within_small_budget(database):
+    rn = Randname(database, shared_names=True, cache_size=400)
+
+    for year in (2000, 2001, 2003, 2000, 2003):
+        rn.randfirst(year=year, country="YR")
+        info = rn.cache_info()
+        resident = {dataset.name_type for dataset in rn.resident_datasets()}
+
+        assert info.currsize <= info.maxsize
+        # Table is cached exactly as long as a dataset using it
+        assert ("name_table" in resident) == ("first_names" in resident)
+        assert ("YR" in rn._name_tables) == ("first_names" in resident)
+
+    assert rn.cache_info().evictions > 0
+
+
+def test_name_table_without_cache(database):
+    rn = Randname(database, shared_names=True, cache_size=0)
+
+    assert rn.randfirst(year=2003, country="YR") == "Ewa"
+    assert rn._name_tables == {}
+
+
+def test_name_table_dropped_while_dataset_is_read(database):
+    rn = Randname(database, shared_names=True)
+    key = ("YR", "first_names", 2003, "F")
+    read_key = rn._read_key
+
+    def read_and_drop(key):
+        loaded = read_key(key)
+        # Table evicted by another thread, before the dataset is stored
+        rn._drop_country("YR")
+        return loaded
+
+    rn._read_key = read_and_drop  # type: ignore[method-assign]
+    names, _ = rn._load_dataset(key)
+
+    # Table used by the dataset is registered and charged again
+    table = rn._name_tables["YR"]
+    assert names[0] == table.names[0] == "Ewa"
+    assert rn._cache.peek(("YR", "name_table")) is table
+    assert key in rn._cache
+
+
+def test_name_table_replaced_while_dataset_is_read(database):
+    rn = Randname(database, shared_names=True)
+    key = ("YR", "first_names", 2003, "F")
+    read_key = rn._read_key
+
+    def read_and_replace(key):
+        loaded = read_key(key)
+        # Table evicted, and a new one created by another load
+        rn._drop_country("YR")
+        rn._name_table("YR")
+        return loaded
+
+    rn._read_key = read_and_replace  # type: ignore[method-assign]
+    names, _ = rn._load_dataset(key)
+
+    # Dataset uses a table that's not charged, so it's not kept
+    assert list(names) == ["Ewa"]
+    assert key not in rn._cache
+    assert ("YR", "name_table") not in rn._cache
@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+"""Convert JSON names files to binary format used by randname module.
+
+Binary file is written next to the source file, with `.bin` suffix. Randname
+prefers binary file over JSON one, when both exist.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from randname.database import BINARY_SUFFIX, DATASET_NAME_PATTERN, pack_dataset
+
+DESCRIPTION = """
+json to binary tool
+
+Example: ./convert_to_binary.py database/US
+"""
+
+EPILOG = """
+Report bugs to aj.walkiewicz@gmail.com
+Copyright (C) 2021 Adam Walkiewicz
+"""
+
+NAMES = "Names"
+TOTALS = "Totals"
+
+
+def find_names_files(path: Path) -> list[Path]:
+    """Find JSON names files
+
+    :param path: names file or directory to search recursively
+    :type path: pathlib.Path
+    :return: list of names files
+    :rtype: list
+    """
+    if path.is_file():
+        return [path]
+
+    return sorted(
+        file
+        for file in path.rglob("*")
+        if file.is_file()
+        and file.suffix != BINARY_SUFFIX
+        and DATASET_NAME_PATTERN.fullmatch(file.name)
+    )
+
+
+def convert_to_binary(source: Path, output: Path) -> None:
+    """Convert JSON names file to binary file
+
+    :param source: path to JSON names file
+    :type source: pathlib.Path
+    :param output: path to output binary file
+    :type output: pathlib.Path
+    """
+    with source.open("r", encoding="utf-8") as json_file:
+        data_set = json.load(json_file)
+
+    output.write_bytes(pack_dataset(data_set[NAMES], data_set[TOTALS]))
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        usage="%(prog)s [OPTION] PATH...",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=(DESCRIPTION),
+        epilog=(EPILOG),
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="names files or directories with names files",
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="overwrite binary files newer than the source file",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+
+    for path in args.paths:
+        for source in find_names_files(path):
+            output = source.with_name(source.name + BINARY_SUFFIX)
+
+            if (
+                not args.force
+                and output.exists()
+                and output.stat().st_mtime >= source.stat().st_mtime
+            ):
+                continue
+
+            convert_to_binary(source, output)
+            print(f"{source} -> {output}")
+
+
+if __name__ == "__main__":
+    main()
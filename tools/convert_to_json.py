@@ -1,17 +1,31 @@
 #!/usr/bin/python3
-"""[summary]
-Convert xlsx to json file compiant with randname module
+"""Convert csv, xlsx and xls files to names files compliant with randname module
+
+Source rows are streamed, only the first `--count` rows are read. Many source
+files are converted in parallel, in a pool of processes. Names files are
+written as JSON, or directly in binary format read by randname.
+
+Conversion is incremental, outputs newer than their source are skipped,
+unless `--force` is given.
 """
-import pandas as pd
-import numpy as np
-import os
-import json
+
 import argparse
+import csv
+import json
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from randname.database import BINARY_SUFFIX, pack_dataset
 
 DESCRIPTION = """
-xlsx to jason tool
+csv, xlsx and xls to names file tool
 
-Example: ./xlsx_to_json -f example_data.xlsx -o example_output
+Example: ./convert_to_json.py -t xlsx -f example_data.xlsx -o example_output
+         ./convert_to_json.py -f 2018_F.csv 2018_M.csv -o database/US/first_names --format binary
 """
 
 EPILOG = """
@@ -22,57 +36,251 @@ Copyright (C) 2021 Adam Walkiewicz
 NAMES = "Names"
 TOTALS = "Totals"
 COUNT = 10000
+FORMATS = ("json", "binary")
+
+
+class Job(NamedTuple):
+    """Conversion of a single source file
+
+    :param source: path to source file
+    :param output: path to output names file
+    :param file_type: type of source file, key of READERS
+    :param output_format: "json" or "binary"
+    :param count: maximal number of names
+    :param cum_weights: convert weights to cumulative weights
+    :param header: skip first row of source file
+    """
+
+    source: Path
+    output: Path
+    file_type: str
+    output_format: str
+    count: int
+    cum_weights: bool
+    header: bool
+
+
+def read_csv(path: Path) -> Iterator[tuple[Any, Any]]:
+    """Stream first two columns of csv file
+
+    :param path: path to csv file
+    :type path: pathlib.Path
+    :return: iterator of (name, weight) rows
+    :rtype: Iterator
+    """
+    with path.open("r", encoding="utf-8", newline="") as csv_file:
+        for row in csv.reader(csv_file):
+            if len(row) < 2:
+                raise ValueError(f"{path}: row with less than 2 columns: {row}")
+            yield row[0], row[1]
+
+
+def read_xlsx(path: Path) -> Iterator[tuple[Any, Any]]:
+    """Stream first two columns of the first sheet of xlsx file
+
+    Requires openpyxl.
+
+    :param path: path to xlsx file
+    :type path: pathlib.Path
+    :return: iterator of (name, weight) rows
+    :rtype: Iterator
+    """
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        for row in workbook.worksheets[0].iter_rows(max_col=2, values_only=True):
+            yield row[0], row[1]
+    finally:
+        workbook.close()
+
+
+def read_xls(path: Path) -> Iterator[tuple[Any, Any]]:
+    """Read first two columns of the first sheet of xls file
+
+    Requires xlrd.
+
+    :param path: path to xls file
+    :type path: pathlib.Path
+    :return: iterator of (name, weight) rows
+    :rtype: Iterator
+    """
+    import xlrd
+
+    workbook = xlrd.open_workbook(path, on_demand=True)
+    try:
+        sheet = workbook.sheet_by_index(0)
+        for index in range(sheet.nrows):
+            name, weight = sheet.row_values(index, 0, 2)
+            yield name, weight
+    finally:
+        workbook.release_resources()
+
+
+READERS = {
+    "csv": read_csv,
+    "xlsx": read_xlsx,
+    "xls": read_xls,
+}
+
+
+def file_type(path: Path) -> str:
+    """Guess type of source file from its suffix, csv by default
+
+    :param path: path to source file
+    :type path: pathlib.Path
+    :return: key of READERS
+    :rtype: str
+    """
+    suffix = path.suffix.lower().lstrip(".")
+    return suffix if suffix in READERS else "csv"
+
+
+def weight_to_int(weight: Any) -> int:
+    """Convert weight read from source file to integer
+
+    :param weight: weight, e.g. "12", 12 or 12.0
+    :return: integer weight
+    :rtype: int
+    """
+    try:
+        return int(weight)
+    except ValueError:
+        return int(float(weight))
+
+
+def convert_rows(
+    rows: Iterable[tuple[Any, Any]], count: int, cum_weights: bool, header: bool
+) -> tuple[list[str], list[int]]:
+    """Convert source rows to names and totals, in a single pass
+
+    Only the first `count` rows are read.
+
+    :param rows: (name, weight) rows
+    :param count: maximal number of names
+    :param cum_weights: convert weights to cumulative weights
+    :param header: skip the first row
+    :return: names and totals
+    :rtype: tuple
+    """
+    rows = iter(rows)
+    if header:
+        next(rows, None)
+
+    names: list[str] = []
+    totals: list[int] = []
+    total = 0
+    for name, weight in islice(rows, count):
+        weight = weight_to_int(weight)
+        total = total + weight if cum_weights else weight
+        names.append(str(name).title())
+        totals.append(total)
+
+    return names, totals
+
+
+def write_names_file(
+    names: list[str], totals: list[int], output: Path, output_format: str
+) -> None:
+    """Write names file, replacing the old one atomically
+
+    :param names: names
+    :param totals: totals
+    :param output: path to names file
+    :type output: pathlib.Path
+    :param output_format: "json" or "binary"
+    :type output_format: str
+    """
+    temporary = output.with_name(output.name + ".tmp")
+
+    if output_format == "binary":
+        temporary.write_bytes(pack_dataset(names, totals))
+    else:
+        with temporary.open("w", encoding="utf-8") as json_file:
+            json.dump({NAMES: names, TOTALS: totals}, json_file, ensure_ascii=False)
+
+    os.replace(temporary, output)
+
 
-def valid_dataframe(df) -> bool:
-    """Validate dataframe
+def convert(job: Job) -> Path:
+    """Convert source file to names file
 
-    :param df: dataframe
-    :type df: pandas.core.frame.DataFrame
-    :return: return True if valid. Else False
+    :param job: conversion to run
+    :type job: Job
+    :return: path to names file
+    :rtype: pathlib.Path
+    """
+    rows = READERS[job.file_type](job.source)
+    try:
+        names, totals = convert_rows(rows, job.count, job.cum_weights, job.header)
+    finally:
+        # Stop reading the source, if it has more rows than count
+        rows.close()
+
+    job.output.parent.mkdir(parents=True, exist_ok=True)
+    write_names_file(names, totals, job.output, job.output_format)
+    return job.output
+
+
+def is_up_to_date(job: Job) -> bool:
+    """Check if output is newer than its source
+
+    :param job: conversion
+    :type job: Job
     :rtype: bool
     """
+    return (
+        job.output.exists() and job.output.stat().st_mtime >= job.source.stat().st_mtime
+    )
 
-    if len(df.columns) != 2:
-        return False
 
-    return True
+def output_path(
+    source: Path, output: str | None, many: bool, output_format: str
+) -> Path:
+    """Return path to names file converted from source file
 
+    With a single source, output is the path to names file. With many
+    sources, it's the directory, where names files are named after their
+    sources, e.g. `2018_F.csv` -> `2018_F`. Without output, names file is
+    written next to the source, with `_out` suffix. Binary names files get
+    `.bin` suffix.
 
-def modify_dataframe_names(df):
-    df.columns = [NAMES, TOTALS]
-    df[NAMES] = df[NAMES].apply(lambda name: str(name).title())
+    :rtype: pathlib.Path
+    """
+    if output is None:
+        path = source.with_name(source.name + "_out")
+    elif many:
+        path = Path(output) / source.stem
+    else:
+        path = Path(output)
 
-def convert_weights_to_cumulative(df):
-    df["Totals"] = np.cumsum(df["Totals"])
+    if output_format == "binary" and path.suffix != BINARY_SUFFIX:
+        path = path.with_name(path.name + BINARY_SUFFIX)
 
-def save_to_json(df, output_file: str):
-    temp_dict = {
-        NAMES: tuple(df[NAMES].head(COUNT)),
-        TOTALS: tuple(df[TOTALS].head(COUNT))
-        }
+    return path
 
-    with open(output_file, "w") as json_file:
-        json.dump(temp_dict, json_file, ensure_ascii=False)
 
 def parse_arguments():
     parser = argparse.ArgumentParser(
         usage="%(prog)s [OPTION]",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         description=(DESCRIPTION),
-        epilog=(EPILOG)
+        epilog=(EPILOG),
     )
     parser.add_argument(
         "-t",
         "--type",
-        required=True,
-        type=str
+        choices=READERS,
+        default=None,
+        help="type of source files (default: guessed from suffix, csv)",
     )
     parser.add_argument(
         "-f",
         "--file",
-        type=str,
+        nargs="+",
+        type=Path,
         required=True,
-        help="path to xlsx file"
+        help="paths to source files",
     )
     parser.add_argument(
         "-w",
@@ -80,49 +288,77 @@ def parse_arguments():
         required=False,
         default=True,
         action="store_false",
-        help="disable cumulative weights"
+        help="disable cumulative weights",
     )
     parser.add_argument(
         "-o",
         "--output",
         required=False,
-        default=False,
-        type=str
+        default=None,
+        type=str,
+        help="names file, or directory with names files for many sources",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="json",
+        help="format of names files (default: json)",
+    )
+    parser.add_argument(
+        "-c",
+        "--count",
+        type=int,
+        default=COUNT,
+        help=f"maximal number of names in names file (default: {COUNT})",
+    )
+    parser.add_argument(
+        "--no-header",
+        dest="header",
+        action="store_false",
+        help="source files have no header row",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="convert sources older than their outputs",
     )
     return parser.parse_args()
 
-def main():
 
+def main():
     args = parse_arguments()
+    many = len(args.file) > 1
 
-    # validate data exist
-
-    file_type = {
-        "csv": pd.read_csv,
-        "xlsx": pd.read_excel
-    }
-
-    if args.type not in file_type.keys():
-        return False
-    else:
-        df = file_type[args.type](args.file, usecols=[0, 1])
-
-    # df = pd.read_excel(args.file)
-
-    if not valid_dataframe(df):
-        return False
+    jobs = [
+        Job(
+            source,
+            output_path(source, args.output, many, args.format),
+            args.type or file_type(source),
+            args.format,
+            args.count,
+            args.cum_weights,
+            args.header,
+        )
+        for source in args.file
+    ]
+    jobs = [job for job in jobs if args.force or not is_up_to_date(job)]
 
-    modify_dataframe_names(df)
+    if args.workers == 1 or len(jobs) <= 1:
+        for job, output in zip(jobs, map(convert, jobs)):
+            print(f"{job.source} -> {output}")
+        return
 
-    convert_weights_to_cumulative(df)
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for job, output in zip(jobs, executor.map(convert, jobs)):
+            print(f"{job.source} -> {output}")
 
-    if args.output:
-        output_file = args.output
-    else:
-        output_file = args.file + "_out"
-
-    save_to_json(df, output_file=output_file)
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,168 @@
+#!/usr/bin/python3
+"""Pack names files of a country in a single file used by randname module.
+
+Pack file `names.pack` is written to the country directory, next to
+info.json. Randname reads datasets of the country from the pack, instead of
+first_names and last_names directories, which can be removed after packing.
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+from randname.database import (
+    BINARY_SUFFIX,
+    DATASET_NAME_PATTERN,
+    NAME_TYPES,
+    PACK_NAME,
+    PackKey,
+    pack_country,
+    pack_dataset,
+)
+
+DESCRIPTION = """
+names files to country pack tool
+
+Example: ./pack_database.py database/US
+         ./pack_database.py database
+"""
+
+EPILOG = """
+Report bugs to aj.walkiewicz@gmail.com
+Copyright (C) 2021 Adam Walkiewicz
+"""
+
+NAMES = "Names"
+TOTALS = "Totals"
+
+
+def find_countries(path: Path) -> list[Path]:
+    """Find country directories
+
+    :param path: country directory or database directory
+    :type path: pathlib.Path
+    :return: list of country directories
+    :rtype: list
+    """
+    if (path / "info.json").is_file():
+        return [path]
+
+    return sorted(
+        directory for directory in path.iterdir() if (directory / "info.json").is_file()
+    )
+
+
+def find_datasets(country: Path) -> dict[PackKey, Path]:
+    """Find names files of a country, binary file is preferred over JSON one
+
+    :param country: country directory
+    :type country: pathlib.Path
+    :return: names file for every name type, year and sex
+    :rtype: dict
+    """
+    datasets: dict[PackKey, Path] = {}
+
+    for name_type in NAME_TYPES:
+        name_type_directory = country / name_type
+        if not name_type_directory.is_dir():
+            continue
+
+        for file in sorted(name_type_directory.iterdir()):
+            match = DATASET_NAME_PATTERN.fullmatch(file.name)
+            if not match:
+                continue
+
+            key = (name_type, int(match["year"]), match["sex"])
+            if key not in datasets or file.suffix == BINARY_SUFFIX:
+                datasets[key] = file
+
+    return datasets
+
+
+def read_dataset(path: Path) -> bytes:
+    """Return names file in binary format
+
+    :param path: path to JSON or binary names file
+    :type path: pathlib.Path
+    :return: content of binary names file
+    :rtype: bytes
+    """
+    if path.suffix == BINARY_SUFFIX:
+        return path.read_bytes()
+
+    with path.open("r", encoding="utf-8") as json_file:
+        data_set = json.load(json_file)
+
+    return pack_dataset(data_set[NAMES], data_set[TOTALS])
+
+
+def pack(country: Path, datasets: dict[PackKey, Path]) -> Path:
+    """Write pack file of a country
+
+    File is replaced atomically, so processes reading the old pack are not
+    affected.
+
+    :param country: country directory
+    :type country: pathlib.Path
+    :param datasets: names file for every name type, year and sex
+    :type datasets: dict
+    :return: path to pack file
+    :rtype: pathlib.Path
+    """
+    output = country / PACK_NAME
+    temporary = output.with_name(output.name + ".tmp")
+    temporary.write_bytes(
+        pack_country({key: read_dataset(path) for key, path in datasets.items()})
+    )
+    os.replace(temporary, output)
+    return output
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        usage="%(prog)s [OPTION] PATH...",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=(DESCRIPTION),
+        epilog=(EPILOG),
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="country directories or database directories",
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="overwrite pack files newer than all names files",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+
+    for path in args.paths:
+        for country in find_countries(path):
+            datasets = find_datasets(country)
+            if not datasets:
+                print(f"{country}: no names files, skipping")
+                continue
+
+            output = country / PACK_NAME
+            if (
+                not args.force
+                and output.exists()
+                and output.stat().st_mtime
+                >= max(file.stat().st_mtime for file in datasets.values())
+            ):
+                continue
+
+            pack(country, datasets)
+            print(f"{country} -> {output} ({len(datasets)} datasets)")
+
+
+if __name__ == "__main__":
+    main()